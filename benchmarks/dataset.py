@@ -0,0 +1,164 @@
+"""Synthetic API data at a given scale, built from the recorded samples.
+
+Every record is a copy of the matching sample in ``fixtures/samples.json``
+with its identifying fields varied, so payload shapes and sizes stay
+realistic. Titles are drawn from feature and maintenance templates, and a
+share of them repeat across sources, so the title rules and the
+deduplication do real work.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+SAMPLES = json.loads((Path(__file__).parent / "fixtures" / "samples.json").read_text())
+
+# Every fifth title is a maintenance title the title rules should drop
+MAINTENANCE_EVERY = 5
+NOW = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+
+
+def _iso(when: datetime) -> str:
+    return when.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _title(rng: random.Random, n: int) -> str:
+    name = rng.choice(SAMPLES["names"])
+    if n % MAINTENANCE_EVERY == 0:
+        return rng.choice(SAMPLES["maintenance_titles"]).format(name=name, n=n)
+    # A variant suffix keeps most titles distinct while sharing vocabulary
+    title = rng.choice(SAMPLES["titles"]).format(name=name)
+    return title if n % 7 == 0 else f"{title} ({n % 97})"
+
+
+@dataclass
+class Dataset:
+    """Every payload the stand-in server serves."""
+
+    scale: int
+    core_releases: List[Dict[str, Any]] = field(default_factory=list)
+    os_releases: List[Dict[str, Any]] = field(default_factory=list)
+    issues: List[Dict[str, Any]] = field(default_factory=list)
+    discussions: List[Dict[str, Any]] = field(default_factory=list)
+    commits: List[Dict[str, Any]] = field(default_factory=list)
+    repos: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    catalogue: Dict[str, List[str]] = field(default_factory=dict)
+    topics: List[Dict[str, Any]] = field(default_factory=list)
+    feed: bytes = b""
+
+    @property
+    def feature_titles(self) -> List[str]:
+        """Return the titles of every issue/PR, e.g. for the stage benchmarks."""
+        return [item["title"] for item in self.issues]
+
+
+def _releases(tag_format: str, months: int) -> List[Dict[str, Any]]:
+    """Monthly betas, stables and patches, newest first like the API."""
+    releases = []
+    for back in range(months):
+        year, month = 2026, 10 - back
+        while month < 1:
+            year, month = year - 1, month + 12
+        stable = datetime(year, month, 1, 18, tzinfo=timezone.utc) + timedelta(days=back % 3)
+        for tag, when, pre in (
+            (tag_format.format(year=year, month=month, rest="0b0"), stable - timedelta(days=6), True),
+            (tag_format.format(year=year, month=month, rest="0"), stable, False),
+            (tag_format.format(year=year, month=month, rest="1"), stable + timedelta(days=8), False),
+        ):
+            if when > NOW:
+                continue
+            release = copy.deepcopy(SAMPLES["release"])
+            release.update(tag_name=tag, name=tag, prerelease=pre, published_at=_iso(when))
+            releases.append(release)
+    return sorted(releases, key=lambda r: r["published_at"], reverse=True)
+
+
+def build_dataset(scale: int, seed: int = 2026) -> Dataset:
+    """Build ``scale`` items per source (issues/PRs, discussions, commits, HACS repositories, forum topics, posts)."""
+    rng = random.Random(seed)
+    data = Dataset(scale=scale)
+    data.core_releases = _releases("{year}.{month}.{rest}", 18)
+    data.os_releases = _releases("{month}.{rest}", 18)
+
+    for n in range(scale):
+        updated = NOW - timedelta(minutes=7 * (scale - n))
+        if n % 2:
+            item = copy.deepcopy(SAMPLES["pull"])
+            item["number"] = 130000 + n
+            item["html_url"] = f"https://github.com/home-assistant/core/pull/{item['number']}"
+            item["draft"] = n % 3 == 0
+            item["milestone"] = {"title": "2026.11.0"} if n % 4 == 1 else None
+        else:
+            item = copy.deepcopy(SAMPLES["issue"])
+            item["number"] = 120000 + n
+            item["html_url"] = f"https://github.com/home-assistant/core/issues/{item['number']}"
+            item["reactions"]["+1"] = rng.randint(0, 80)
+            item["comments"] = rng.randint(0, 30)
+        item["title"] = _title(rng, n)
+        item["updated_at"] = _iso(updated)
+        data.issues.append(item)
+
+        discussion = copy.deepcopy(SAMPLES["discussion"])
+        discussion["number"] = 1000 + n
+        discussion["title"] = ("ADR: " if n % 3 == 0 else "") + _title(rng, n + 1)
+        discussion["html_url"] = f"https://github.com/home-assistant/architecture/discussions/{discussion['number']}"
+        discussion["comments"] = rng.randint(0, 40)
+        data.discussions.append(discussion)
+
+        commit = copy.deepcopy(SAMPLES["commit"])
+        commit["sha"] = f"{n + 1:040x}"
+        number = 140000 + n
+        commit["commit"]["message"] = f"{_title(rng, n + 2)} (#{number})\n\nDetails"
+        committed = _iso(NOW - timedelta(minutes=11 * (scale - n)))
+        commit["commit"]["committer"]["date"] = committed
+        commit["commit"]["author"]["date"] = committed
+        data.commits.append(commit)
+
+        repo = copy.deepcopy(SAMPLES["repo"])
+        full_name = f"bench-owner-{n % 97}/bench-repo-{n}"
+        repo.update(
+            full_name=full_name,
+            name=f"bench-repo-{n}",
+            stargazers_count=rng.choice((20, 150, 600, 1200, 3000)),
+            pushed_at=_iso(NOW - timedelta(days=rng.randint(1, 200))),
+            created_at=_iso(NOW - timedelta(days=rng.randint(10, 900))),
+            html_url=f"https://github.com/{full_name}",
+        )
+        data.repos[full_name] = repo
+
+        topic = copy.deepcopy(SAMPLES["topic"])
+        topic.update(
+            id=500000 + n,
+            title=_title(rng, n + 3),
+            like_count=rng.randint(0, 120),
+            views=rng.randint(10, 5000),
+            vote_count=rng.randint(0, 80),
+            bumped_at=_iso(NOW - timedelta(minutes=13 * n)),
+        )
+        data.topics.append(topic)
+
+    names = list(data.repos)
+    data.catalogue = {
+        "integrations": names[: (2 * len(names)) // 3],
+        "lovelace": names[(2 * len(names)) // 3:],
+        "theme": [f"bench-themes/theme-{n}" for n in range(scale // 10)],
+    }
+
+    entries = []
+    for n in range(scale):
+        title = _title(rng, n + 4)
+        feature = rng.choice(SAMPLES["titles"]).format(name=rng.choice(SAMPLES["names"]))
+        feature2 = rng.choice(SAMPLES["titles"]).format(name=rng.choice(SAMPLES["names"]))
+        entries.append(SAMPLES["feed_entry"].format(title=title, n=n, day=1 + n % 28, feature=feature, feature2=feature2))
+    data.feed = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom"><title>Home Assistant</title>'
+        + "".join(entries)
+        + "</feed>"
+    ).encode()
+    return data
@@ -0,0 +1,222 @@
+"""Run the offline benchmarks.
+
+Usage, from the repository root with Home Assistant installed::
+
+    python -m benchmarks.run                      # scales 10, 1000, 10000
+    python -m benchmarks.run --scales 1000 --json before.json
+    python -m benchmarks.run --stages-only --no-memory
+
+For every scale the full ``async_fetch_haos_features`` pipeline runs twice
+against the stand-in server: ``cold`` with empty storage, then ``warm``
+with the caches, cursors and indexes the first run left behind. The CPU
+bound stages are then timed on their own with the same data.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.haos_feature_forecast.blog_feed import FeedParser
+from custom_components.haos_feature_forecast.classify import CLASSIFIERS
+from custom_components.haos_feature_forecast.const import DEFAULT_DEDUP_THRESHOLD, DOMAIN
+from custom_components.haos_feature_forecast.dedup import deduplicate
+from custom_components.haos_feature_forecast.fetch_haos_features import _rank_key, async_fetch_haos_features
+from custom_components.haos_feature_forecast.forum_index import ForumIndex
+from custom_components.haos_feature_forecast.hacs_index import HacsCatalogueParser
+from custom_components.haos_feature_forecast.metrics import metrics_trace_config
+from custom_components.haos_feature_forecast.model import Feature, Forecast
+from custom_components.haos_feature_forecast.render import render_html, render_markdown
+
+from .dataset import NOW, Dataset, build_dataset
+from .server import RedirectingSession, StandInServer
+
+DEFAULT_SCALES = (10, 1000, 10000)
+_SOURCES = ("issue", "pr", "blog", "discussion", "forum")
+
+Result = Dict[str, Any]
+
+
+async def _measure(work: Callable[[], Union[Any, Awaitable[Any]]], memory: bool) -> Result:
+    """Time one call and record its peak traced allocation."""
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    value = work()
+    if inspect.isawaitable(value):
+        value = await value
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"ms": round(elapsed * 1000, 1), "peak_kib": round(peak / 1024) if peak is not None else None, "value": value}
+
+
+async def bench_pipeline(data: Dataset, server: StandInServer, token: str, memory: bool) -> List[Result]:
+    """Run the whole refresh cold and then warm."""
+    results = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        os.makedirs(os.path.join(config_dir, ".storage"))
+        hass = HomeAssistant(config_dir)
+        session = aiohttp.ClientSession(trace_configs=[metrics_trace_config()])
+        hass.data[DOMAIN] = {
+            "session": RedirectingSession(session, server),
+            "config_entry": SimpleNamespace(data={"github_token": token}, options={}),
+        }
+        try:
+            for case in ("cold", "warm"):
+                server.reset_counters()
+                result = await _measure(lambda: async_fetch_haos_features(hass, force=True), memory)
+                domain_data = hass.data[DOMAIN]
+                metrics = domain_data.get("metrics") or {}
+                results.append({
+                    "case": f"pipeline {case}",
+                    "ms": result["ms"],
+                    "peak_kib": result["peak_kib"],
+                    "requests": sum(server.requests.values()),
+                    "not_modified": server.not_modified,
+                    "bytes": server.bytes_sent,
+                    "items_out": domain_data.get("feature_count"),
+                    "routes": dict(server.requests),
+                    "stages": metrics.get("stages", {}),
+                    "sources": {
+                        name: {key: record.get(key) for key in ("wall_ms", "requests", "items_out")}
+                        for name, record in (metrics.get("sources") or {}).items()
+                        if record.get("at") == metrics.get("started_at")
+                    },
+                })
+        finally:
+            lifecycle_db = hass.data[DOMAIN].pop("lifecycle_db", None)
+            if lifecycle_db is not None:
+                await hass.async_add_executor_job(lifecycle_db.close)
+            await session.close()
+            await hass.async_stop(force=True)
+    return results
+
+
+def _features(data: Dataset) -> List[Dict[str, Any]]:
+    """Scored-looking feature dicts for every synthetic title."""
+    return [
+        {
+            "title": title,
+            "importance": 1 + n % 5,
+            "likelihood": 1 + (n // 5) % 5,
+            "source": _SOURCES[n % len(_SOURCES)],
+            "url": f"https://example.invalid/{n}",
+        }
+        for n, title in enumerate(data.feature_titles)
+    ]
+
+
+async def bench_stages(data: Dataset, memory: bool) -> List[Result]:
+    """Time the CPU-bound stages in isolation."""
+    titles = [{"title": title} for title in data.feature_titles]
+    features = _features(data)
+    feature_objects = [Feature.from_dict(f) for f in features]
+    forecast = Forecast(
+        generated_at=NOW.isoformat(),
+        current_version="2026.10",
+        upcoming_version="2026.11",
+        next_version="2026.12",
+        upcoming=feature_objects,
+        feature_count=len(feature_objects),
+        source_counts={source: len(features) // len(_SOURCES) for source in _SOURCES},
+    )
+    catalogue = json.dumps(data.catalogue)
+
+    def parse_catalogue() -> int:
+        parser = HacsCatalogueParser()
+        parser.feed(catalogue, final=True)
+        return len(parser.names)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+
+        def rank_forum() -> int:
+            index = ForumIndex(hass)
+            index.apply(data.topics, NOW.timestamp())
+            return sum(1 for topic in index.open_topics() if index.likes_per_week(topic, NOW.timestamp()) >= 0)
+
+        cases: List[tuple] = [
+            ("classify", len(titles), lambda: len(CLASSIFIERS["pr"].select(titles))),
+            ("dedup", len(features), lambda: len(deduplicate(features, threshold=DEFAULT_DEDUP_THRESHOLD))),
+            ("rank", len(features), lambda: len(sorted(features, key=_rank_key))),
+            ("render html", len(feature_objects), lambda: len(render_html(forecast))),
+            ("render markdown", len(feature_objects), lambda: len(render_markdown(forecast))),
+            ("blog feed parse", data.feed.count(b"<entry>"), lambda: len(list(FeedParser().feed(data.feed)))),
+            ("hacs catalogue parse", sum(len(v) for v in data.catalogue.values()), parse_catalogue),
+            ("forum index", len(data.topics), rank_forum),
+        ]
+        results = []
+        for name, items_in, work in cases:
+            result = await _measure(work, memory)
+            results.append({
+                "case": name, "ms": result["ms"], "peak_kib": result["peak_kib"],
+                "items_in": items_in, "items_out": result["value"],
+            })
+        await hass.async_stop(force=True)
+    return results
+
+
+def _print(scale: int, results: List[Result]) -> None:
+    print(f"\n== scale {scale} ==")
+    print(f"{'case':<22}{'ms':>10}{'peak KiB':>10}{'requests':>10}{'304':>6}{'bytes':>12}{'items':>14}")
+    for r in results:
+        items = f"{r.get('items_in', '')}->{r['items_out']}" if "items_in" in r else str(r.get("items_out", ""))
+        peak = r["peak_kib"] if r["peak_kib"] is not None else "-"
+        print(
+            f"{r['case']:<22}{r['ms']:>10}{peak:>10}{r.get('requests', ''):>10}"
+            f"{r.get('not_modified', ''):>6}{r.get('bytes', ''):>12}{items:>14}"
+        )
+        for name, stage in r.get("stages", {}).items():
+            print(f"  stage {name:<14}{stage['wall_ms']:>10}{'':>38}{stage.get('items_in')}->{stage.get('items_out')}")
+        for name, source in r.get("sources", {}).items():
+            print(f"  {name:<20}{source['wall_ms']:>10}{'':>10}{source['requests']:>10}{'':>32}{source['items_out']}")
+
+
+async def main(argv: Optional[List[str]] = None) -> None:
+    """Parse arguments and run every scale."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--anonymous", action="store_true", help="run without a GitHub token (REST only, anonymous budgets)")
+    parser.add_argument("--stages-only", action="store_true", help="skip the end-to-end pipeline runs")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc, which slows every case down")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--verbose", action="store_true", help="show the integration's log output")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+
+    report: Dict[str, List[Result]] = {}
+    for scale in args.scales:
+        data = build_dataset(scale)
+        results: List[Result] = []
+        if not args.stages_only:
+            server = StandInServer(data)
+            await server.start()
+            try:
+                results += await bench_pipeline(data, server, "" if args.anonymous else "benchmark", not args.no_memory)
+            finally:
+                await server.stop()
+        results += await bench_stages(data, not args.no_memory)
+        _print(scale, results)
+        report[str(scale)] = results
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
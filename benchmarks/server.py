@@ -0,0 +1,252 @@
+"""Local aiohttp stand-in for every remote the forecast talks to.
+
+Serves a ``Dataset`` under one base URL, one path prefix per remote host:
+
+- ``/github``: releases, issues (with ``since`` and Link pagination),
+  discussions, search, compare, repositories and GraphQL
+- ``/raw``: the HACS ``data.json`` catalogue
+- ``/site``: the blog feed
+- ``/forum``: the Discourse ``latest``/``top`` topic lists
+
+Responses carry ETags and GitHub rate-limit headers, answer
+``If-None-Match`` with 304 and are counted per route.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from .dataset import Dataset
+
+# Remote prefixes and the local paths they are served under
+REMOTES = {
+    "https://api.github.com": "/github",
+    "https://raw.githubusercontent.com": "/raw",
+    "https://www.home-assistant.io": "/site",
+    "https://community.home-assistant.io": "/forum",
+}
+
+FORUM_PAGE_SIZE = 30
+SEARCH_RESULT_CAP = 1000
+
+_GRAPHQL_REPO = re.compile(r'(r\d+): repository\(owner: "([^"]+)", name: "([^"]+)"\)')
+
+
+class StandInServer:
+    """The stand-in application plus per-route request counters."""
+
+    def __init__(self, data: Dataset) -> None:
+        """Create the application for a dataset."""
+        self.data = data
+        self.base_url = ""
+        self.requests: Counter = Counter()
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.app = web.Application()
+        self.app.router.add_get("/github/repos/home-assistant/core/releases", self._core_releases)
+        self.app.router.add_get("/github/repos/home-assistant/operating-system/releases", self._os_releases)
+        self.app.router.add_get("/github/repos/home-assistant/core/issues", self._issues)
+        self.app.router.add_get("/github/repos/home-assistant/architecture/discussions", self._discussions)
+        self.app.router.add_get("/github/repos/home-assistant/core/compare/{spec}", self._compare)
+        self.app.router.add_get("/github/search/issues", self._search)
+        self.app.router.add_get("/github/repos/{owner}/{name}", self._repo)
+        self.app.router.add_post("/github/graphql", self._graphql)
+        self.app.router.add_get("/raw/hacs/default/master/data.json", self._catalogue)
+        self.app.router.add_get("/site/blog/feed.xml", self._feed)
+        self.app.router.add_get("/forum/c/feature-requests/13/l/{order}.json", self._forum)
+
+    async def start(self) -> str:
+        """Listen on a free localhost port and return the base URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Shut the server down."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def reset_counters(self) -> None:
+        """Zero the counters between benchmark cases."""
+        self.requests.clear()
+        self.not_modified = 0
+        self.bytes_sent = 0
+
+    def rewrite(self, url: Any) -> str:
+        """Map a remote URL onto this server."""
+        url = str(url)
+        for remote, prefix in REMOTES.items():
+            if url.startswith(remote):
+                return f"{self.base_url}{prefix}{url[len(remote):]}"
+        return url
+
+    # Helpers
+
+    def _respond(
+        self,
+        request: web.Request,
+        route: str,
+        body: bytes,
+        content_type: str = "application/json",
+        headers: Optional[Dict[str, str]] = None,
+        resource: Optional[str] = "core",
+    ) -> web.Response:
+        self.requests[route] += 1
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        response_headers = {"ETag": etag, **(headers or {})}
+        if resource:
+            response_headers.update(
+                {
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "4999",
+                    "X-RateLimit-Reset": str(int(time.time()) + 3600),
+                    "X-RateLimit-Resource": resource,
+                }
+            )
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers=response_headers)
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type=content_type, headers=response_headers)
+
+    def _json(self, request: web.Request, route: str, payload: Any, **kwargs: Any) -> web.Response:
+        return self._respond(request, route, json.dumps(payload).encode(), **kwargs)
+
+    def _page(self, request: web.Request, route: str, items: List[Any], wrap: Optional[str] = None, **kwargs: Any) -> web.Response:
+        """Serve one ``page``/``per_page`` slice with a GitHub-style Link header."""
+        per_page = int(request.query.get("per_page", 30))
+        page = int(request.query.get("page", 1))
+        chunk = items[(page - 1) * per_page: page * per_page]
+        headers = {}
+        if page * per_page < len(items):
+            next_url = request.url.update_query(page=page + 1)
+            headers["Link"] = f'<{self.base_url}{next_url.path_qs}>; rel="next"'
+        payload = {wrap: chunk, "total_count": len(items)} if wrap else chunk
+        return self._json(request, route, payload, headers=headers, **kwargs)
+
+    # GitHub
+
+    async def _core_releases(self, request: web.Request) -> web.Response:
+        return self._page(request, "core_releases", self.data.core_releases)
+
+    async def _os_releases(self, request: web.Request) -> web.Response:
+        return self._page(request, "os_releases", self.data.os_releases)
+
+    async def _issues(self, request: web.Request) -> web.Response:
+        items = self.data.issues
+        since = request.query.get("since")
+        if since:
+            items = [item for item in items if item["updated_at"] > since]
+        if request.query.get("direction", "desc") == "desc":
+            items = list(reversed(items))
+        return self._page(request, "issues", items)
+
+    async def _discussions(self, request: web.Request) -> web.Response:
+        return self._page(request, "discussions", self.data.discussions)
+
+    async def _compare(self, request: web.Request) -> web.Response:
+        base, _, _ = request.match_info["spec"].partition("...")
+        # A release tag compares against every commit; a commit SHA against the ones after it
+        commits = self.data.commits
+        shas = [commit["sha"] for commit in commits]
+        if base in shas:
+            commits = commits[shas.index(base) + 1:]
+        return self._page(request, "compare", commits, wrap="commits")
+
+    async def _search(self, request: web.Request) -> web.Response:
+        query = request.query.get("q", "")
+        if "is:merged" in query:
+            items = [item for item in self.data.issues if "pull_request" in item][: SEARCH_RESULT_CAP]
+            items = [
+                {**item, "state": "closed", "pull_request": {**item["pull_request"], "merged_at": item["updated_at"]}}
+                for item in items
+            ]
+        else:
+            items = [item for item in self.data.issues if item.get("milestone")][: SEARCH_RESULT_CAP]
+        return self._page(request, "search", items, wrap="items", resource="search")
+
+    async def _repo(self, request: web.Request) -> web.Response:
+        full_name = f"{request.match_info['owner']}/{request.match_info['name']}"
+        repo = self.data.repos.get(full_name)
+        if repo is None:
+            self.requests["repos"] += 1
+            return web.json_response({"message": "Not Found"}, status=404)
+        return self._json(request, "repos", repo)
+
+    async def _graphql(self, request: web.Request) -> web.Response:
+        query = (await request.json()).get("query", "")
+        data: Dict[str, Any] = {}
+        for alias, owner, name in _GRAPHQL_REPO.findall(query):
+            repo = self.data.repos.get(f"{owner}/{name}")
+            data[alias] = repo and {
+                "name": repo["name"],
+                "description": repo["description"],
+                "stargazerCount": repo["stargazers_count"],
+                "createdAt": repo["created_at"],
+                "pushedAt": repo["pushed_at"],
+                "url": repo["html_url"],
+            }
+        if "discussions:" in query:
+            nodes = [
+                {"title": d["title"], "url": d["html_url"], "comments": {"totalCount": d["comments"]}}
+                for d in self.data.discussions[:20]
+            ]
+            data["discussions"] = {"discussions": {"nodes": nodes}}
+        return self._json(request, "graphql", {"data": data}, resource="graphql")
+
+    # Other remotes
+
+    async def _catalogue(self, request: web.Request) -> web.Response:
+        return self._json(request, "hacs_catalogue", self.data.catalogue, resource=None)
+
+    async def _feed(self, request: web.Request) -> web.Response:
+        return self._respond(request, "blog_feed", self.data.feed, content_type="application/atom+xml", resource=None)
+
+    async def _forum(self, request: web.Request) -> web.Response:
+        order = request.match_info["order"]
+        topics = self.data.topics
+        if order == "top":
+            topics = sorted(topics, key=lambda t: t["like_count"], reverse=True)
+        page = int(request.query.get("page", 0))
+        chunk = topics[page * FORUM_PAGE_SIZE: (page + 1) * FORUM_PAGE_SIZE]
+        topic_list: Dict[str, Any] = {"topics": chunk}
+        if (page + 1) * FORUM_PAGE_SIZE < len(topics):
+            topic_list["more_topics_url"] = f"/c/feature-requests/13/l/{order}?page={page + 1}"
+        return self._json(request, f"forum_{order}", {"topic_list": topic_list}, resource=None)
+
+
+class RedirectingSession:
+    """Wrap a ClientSession so remote URLs go to the stand-in server."""
+
+    def __init__(self, session: Any, server: StandInServer) -> None:
+        """Wrap ``session``."""
+        self._session = session
+        self._server = server
+
+    @property
+    def closed(self) -> bool:
+        """Return True once the wrapped session is closed."""
+        return self._session.closed
+
+    def get(self, url: Any, **kwargs: Any) -> Any:
+        """GET from the stand-in server."""
+        return self._session.get(self._server.rewrite(url), **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> Any:
+        """POST to the stand-in server."""
+        return self._session.post(self._server.rewrite(url), **kwargs)
+
+    async def close(self) -> None:
+        """Close the wrapped session."""
+        await self._session.close()
@@ -2,9 +2,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.const import Platform
 from homeassistant.helpers import entity_registry as er
-from .const import DOMAIN
+from .api import async_register_api
+from .const import DOMAIN, UPDATE_INTERVAL
 from .coordinator import HaosFeatureForecastCoordinator
-import asyncio
+from .http_session import async_create_forecast_session
+from .storage import async_load_snapshot, snapshot_age
 import logging
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,14 +22,19 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         _LOGGER.info("="*60)
         _LOGGER.info("HAOS Feature Forecast: Manual update triggered via service call")
         _LOGGER.info("="*60)
-        try:
-            from .fetch_haos_features import async_fetch_haos_features
-            asyncio.create_task(async_fetch_haos_features(hass))
-            _LOGGER.info("HAOS Feature Forecast: Manual update task started. Check logs for progress.")
-        except Exception as err:
-            _LOGGER.error(f"HAOS Feature Forecast: Manual update service failed: {err}", exc_info=True)
+        coordinator = hass.data[DOMAIN].get("coordinator")
+        if coordinator is None:
+            _LOGGER.warning("HAOS Feature Forecast: Manual update ignored, the integration is not set up")
+            return
+        # Through the coordinator so the sensor updates and concurrent requests coalesce
+        hass.async_create_background_task(
+            coordinator.async_request_manual_refresh(), f"{DOMAIN}_manual_refresh"
+        )
+        _LOGGER.info("HAOS Feature Forecast: Manual update requested. Check logs for progress.")
 
     hass.services.async_register(DOMAIN, "update_forecast", handle_update_forecast)
+    # Lets cards fetch the rendered forecast on demand instead of via the state attribute
+    async_register_api(hass)
     return True
 
 async def _cleanup_old_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -92,27 +99,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "Rate limit: 60 requests/hour. Add a token in integration options to increase to 5000 requests/hour."
         )
     
+    # One pooled session for every fetch while the entry is loaded
+    async_create_forecast_session(hass, entry)
+    
     # Create and store the coordinator
     _LOGGER.info("HAOS Feature Forecast: Creating coordinator...")
     coordinator = HaosFeatureForecastCoordinator(hass)
     
-    # Perform first refresh - but don't fail if it errors
-    # The coordinator will provide a helpful error message in the card
-    _LOGGER.info("HAOS Feature Forecast: Starting initial data fetch (may take 1-2 minutes)...")
-    try:
-        await coordinator.async_config_entry_first_refresh()
-        _LOGGER.info("="*60)
-        _LOGGER.info("HAOS Feature Forecast: Initial data fetch completed successfully")
-        _LOGGER.info("="*60)
-    except Exception as err:
-        # Log the error but don't fail setup - coordinator will show error message in card
-        _LOGGER.warning("="*60)
-        _LOGGER.warning(
-            f"HAOS Feature Forecast: Initial data fetch failed - {err}. "
-            f"The integration will continue to work and retry every 6 hours. "
-            f"Check the card for troubleshooting information."
-        )
-        _LOGGER.warning("="*60)
+    # Show the last persisted forecast immediately instead of blocking on a cold fetch
+    snapshot = await async_load_snapshot(hass)
+    needs_refresh = True
+    if snapshot:
+        coordinator.restore_snapshot(snapshot)
+        age = snapshot_age(snapshot)
+        needs_refresh = age is None or age >= UPDATE_INTERVAL.total_seconds()
+        if not needs_refresh:
+            _LOGGER.info(
+                f"HAOS Feature Forecast: Snapshot is {age / 60:.0f} minutes old, "
+                f"next refresh follows the regular update interval"
+            )
     
     hass.data[DOMAIN]["coordinator"] = coordinator
     
@@ -120,14 +125,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("HAOS Feature Forecast: Setting up sensor platform...")
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    if needs_refresh:
+        # Refresh in the background; the coordinator reports errors in the card
+        _LOGGER.info("HAOS Feature Forecast: Starting background data fetch (may take 1-2 minutes)...")
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_initial_refresh"
+        )
+    
+    # Options (TTLs, HTML attribute, ...) are read at setup; apply changes by reloading
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    
     _LOGGER.info("HAOS Feature Forecast: Integration setup complete. Check your dashboard card for forecast data.")
     return True
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry after its token or options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop("coordinator", None)
+        hass.data[DOMAIN].pop("session", None)
+        # Rebuilt with the current TTL options on setup; keep its live failure/backoff state
+        scheduler = hass.data[DOMAIN].pop("scheduler", None)
+        if scheduler is not None:
+            hass.data[DOMAIN]["scheduler_state"] = scheduler.as_dict()
+        lifecycle_db = hass.data[DOMAIN].pop("lifecycle_db", None)
+        if lifecycle_db is not None:
+            await hass.async_add_executor_job(lifecycle_db.close)
     return unload_ok
 
 __version__ = '1.4.3'
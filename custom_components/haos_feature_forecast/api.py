@@ -0,0 +1,88 @@
+"""On-demand delivery of the rendered forecast to cards.
+
+The HTML is several kilobytes, so instead of relying on the sensor
+attribute a card can fetch it when it is displayed: through the websocket
+command ``haos_feature_forecast/forecast`` or ``GET /api/haos_feature_forecast/forecast``.
+The HTTP view answers ``If-None-Match`` with 304 while the forecast is unchanged.
+
+``haos_feature_forecast/features`` returns the structured forecast as
+versioned JSON (or markdown/HTML rendered from the same model).
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict
+
+import voluptuous as vol
+from aiohttp import web
+
+from homeassistant.components import websocket_api
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .render import RENDERERS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def forecast_payload(hass: HomeAssistant) -> Dict[str, Any]:
+    """Return the current forecast as shown by the sensor."""
+    domain_data = hass.data.get(DOMAIN, {})
+    coordinator = domain_data.get("coordinator")
+    data = coordinator.data if coordinator is not None and isinstance(coordinator.data, dict) else {}
+    return {
+        "state": data.get("state", "Unavailable"),
+        "rendered_html": data.get("rendered_html", domain_data.get("rendered_html", "")),
+        "feature_count": data.get("feature_count", 0),
+        "forecast_id": data.get("forecast_id"),
+    }
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/forecast"})
+@callback
+def websocket_get_forecast(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]) -> None:
+    """Send the rendered forecast to a card."""
+    connection.send_result(msg["id"], forecast_payload(hass))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/features",
+        vol.Optional("format", default="json"): vol.In(list(RENDERERS)),
+    }
+)
+@callback
+def websocket_get_features(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]) -> None:
+    """Send the structured forecast in the requested format."""
+    forecast = hass.data.get(DOMAIN, {}).get("forecast")
+    if forecast is None:
+        connection.send_error(msg["id"], "not_ready", "No forecast has been built yet")
+        return
+    connection.send_result(msg["id"], {"format": msg["format"], "forecast": RENDERERS[msg["format"]](forecast)})
+
+
+class ForecastView(HomeAssistantView):
+    """Serve the rendered forecast HTML."""
+
+    url = f"/api/{DOMAIN}/forecast"
+    name = f"api:{DOMAIN}:forecast"
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the HTML, or 304 if the client already has this version."""
+        payload = forecast_payload(request.app[KEY_HASS])
+        etag = f'"{payload["forecast_id"]}"' if payload["forecast_id"] else None
+        if etag and request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        headers = {"ETag": etag} if etag else {}
+        return web.Response(text=payload["rendered_html"], content_type="text/html", headers=headers)
+
+
+@callback
+def async_register_api(hass: HomeAssistant) -> None:
+    """Register the websocket command and HTTP view."""
+    websocket_api.async_register_command(hass, websocket_get_forecast)
+    websocket_api.async_register_command(hass, websocket_get_features)
+    hass.http.register_view(ForecastView())
+    _LOGGER.debug(f"Registered forecast API at {ForecastView.url} and websocket type {DOMAIN}/forecast")
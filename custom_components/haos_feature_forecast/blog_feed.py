@@ -0,0 +1,192 @@
+"""Streaming RSS/Atom parsing for the Home Assistant blog feed.
+
+Entries are parsed one at a time with ``XMLPullParser`` while the feed is
+downloaded, and the download stops at the first entry already processed on
+a previous run. Features extracted per post are stored by GUID so only new
+posts are ever analysed.
+"""
+from __future__ import annotations
+
+import logging
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .metrics import record_stream_bytes
+
+_LOGGER = logging.getLogger(__name__)
+
+BLOG_STORAGE_KEY = f"{DOMAIN}.blog"
+BLOG_STORAGE_VERSION = 1
+# Posts whose features are kept; older ones have long since shipped
+BLOG_MAX_ENTRIES = 40
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_CHUNK_SIZE = 16 * 1024
+
+
+class FeedEntry(NamedTuple):
+    """One blog post reduced to plain text."""
+
+    guid: str
+    title: str
+    link: str
+    published: str
+    summary: str
+
+
+class _TextExtractor(HTMLParser):
+    """Collect the text content of an HTML fragment."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+
+    def handle_data(self, data: str) -> None:
+        self.parts.append(data)
+
+
+def html_to_text(fragment: str) -> str:
+    """Strip tags from an HTML fragment and collapse whitespace."""
+    if "<" not in fragment:
+        return " ".join(fragment.split())
+    extractor = _TextExtractor()
+    extractor.feed(fragment)
+    extractor.close()
+    return " ".join(" ".join(extractor.parts).split())
+
+
+def _child_text(elem: ET.Element, *tags: str) -> str:
+    for tag in tags:
+        child = elem.find(tag)
+        if child is not None and child.text:
+            return child.text.strip()
+    return ""
+
+
+def _parse_entry(elem: ET.Element) -> Optional[FeedEntry]:
+    """Build a FeedEntry from an Atom ``entry`` or RSS ``item`` element."""
+    if elem.tag == f"{_ATOM}entry":
+        link = ""
+        for link_elem in elem.findall(f"{_ATOM}link"):
+            if link_elem.get("rel", "alternate") == "alternate":
+                link = link_elem.get("href", "")
+                break
+        title = _child_text(elem, f"{_ATOM}title")
+        guid = _child_text(elem, f"{_ATOM}id") or link
+        published = _child_text(elem, f"{_ATOM}published", f"{_ATOM}updated")
+        summary = _child_text(elem, f"{_ATOM}summary", f"{_ATOM}content")
+    else:
+        link = _child_text(elem, "link")
+        title = _child_text(elem, "title")
+        guid = _child_text(elem, "guid") or link
+        published = _child_text(elem, "pubDate")
+        summary = _child_text(elem, "description")
+    if not guid:
+        return None
+    return FeedEntry(guid, html_to_text(title), link, published, html_to_text(summary))
+
+
+class FeedParser:
+    """Incremental feed parser yielding entries as soon as each one closes."""
+
+    def __init__(self) -> None:
+        """Initialize the pull parser."""
+        self._parser = ET.XMLPullParser(events=("end",))
+
+    def feed(self, data: bytes) -> Iterator[FeedEntry]:
+        """Feed raw bytes and yield any entries completed by them."""
+        self._parser.feed(data)
+        for _, elem in self._parser.read_events():
+            if elem.tag in (f"{_ATOM}entry", "item"):
+                entry = _parse_entry(elem)
+                # Drop the subtree so memory stays flat over the whole feed
+                elem.clear()
+                if entry:
+                    yield entry
+
+
+class BlogStore:
+    """Per-post extracted features plus the feed's ETag, kept on disk."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty store."""
+        self._store = Store(hass, BLOG_STORAGE_VERSION, BLOG_STORAGE_KEY)
+        self.etag: Optional[str] = None
+        # GUID -> {"published": str, "features": [...]}, newest first
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load processed posts from disk."""
+        data = await self._store.async_load()
+        if isinstance(data, dict):
+            self.etag = data.get("etag")
+            self.entries = data.get("entries", {})
+
+    def add_new(self, new_entries: Dict[str, Dict[str, Any]]) -> None:
+        """Prepend newly processed posts and trim to BLOG_MAX_ENTRIES."""
+        merged = dict(new_entries)
+        for guid, entry in self.entries.items():
+            if guid not in merged:
+                merged[guid] = entry
+        self.entries = dict(list(merged.items())[:BLOG_MAX_ENTRIES])
+
+    def features(self) -> List[Dict[str, Any]]:
+        """Return the features of every stored post."""
+        return [feature for entry in self.entries.values() for feature in entry.get("features", [])]
+
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write."""
+        self._store.async_delay_save(lambda: {"etag": self.etag, "entries": self.entries}, 10)
+
+
+async def async_get_blog_store(hass: HomeAssistant) -> BlogStore:
+    """Return the shared blog store, loading it from disk on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    store = domain_data.get("blog_store")
+    if store is None:
+        store = BlogStore(hass)
+        await store.async_load()
+        domain_data["blog_store"] = store
+    return store
+
+
+async def async_read_new_entries(
+    session: aiohttp.ClientSession, url: str, store: BlogStore, timeout: float = 15
+) -> Optional[List[FeedEntry]]:
+    """Return posts not processed before, newest first.
+
+    Returns an empty list when the feed is unchanged (304) and None when it
+    could not be fetched. Reading stops at the first already-known GUID.
+    """
+    headers = {"If-None-Match": store.etag} if store.etag and store.entries else {}
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+        if resp.status == 304:
+            return []
+        if resp.status != 200:
+            _LOGGER.debug(f"Blog RSS returned status {resp.status} - this is normal if the blog feed is temporarily unavailable")
+            return None
+        parser = FeedParser()
+        new_entries: List[FeedEntry] = []
+        reached_known = False
+        async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+            record_stream_bytes(len(chunk))
+            for entry in parser.feed(chunk):
+                if entry.guid in store.entries:
+                    reached_known = True
+                    break
+                new_entries.append(entry)
+            if reached_known:
+                break
+        store.etag = resp.headers.get("ETag")
+    _LOGGER.debug(
+        f"Blog feed: {len(new_entries)} new posts"
+        f"{', stopped at first known post' if reached_known else ''}"
+    )
+    return new_entries
@@ -0,0 +1,104 @@
+"""Shared title classification rules, compiled once at import.
+
+Every keyword filter the fetchers apply to titles lives in ``TITLE_RULES``.
+Each rule set is compiled into one alternation regex per rule type, so a
+title is checked with a single C-level scan per type instead of a Python
+loop over keywords.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Substring rules per source. ``skip`` rejects a title, ``include`` (when
+# present) must match, ``tags`` label accepted titles and ``min_length``
+# rejects titles that are too short to be specific.
+TITLE_RULES: Dict[str, Dict[str, Any]] = {
+    "issue": {
+        "skip": ("update", "bump", "dependencies", "monthly", "weekly"),
+    },
+    "pr": {
+        "skip": ("bump", "update dependencies", "translation", "fix typo"),
+        "include": ("add ", "new ", "feature", "implement"),
+    },
+    "discussion": {
+        "skip": ("adr", "question", "meta"),
+        # Architecture Decision Records and RFCs
+        "tags": {"adr": ("adr", "rfc")},
+    },
+    "forum": {
+        "skip": (
+            "update", "general", "discussion",  # Original filters
+            "about the", "guidelines", "guide",  # Meta category/process posts
+            "heads-up", "moving",  # Meta announcements
+            "how to", "rules", "process",  # Process documentation
+            "pinned", "sticky",  # Pinned meta-posts
+            "category", "faq", "frequently asked",  # Category information
+            "feature requests are", "feature request guidelines",  # Specific meta-posts about FR process
+        ),
+        # Very short titles are often meta or too vague
+        "min_length": 15,
+    },
+    "blog": {
+        "skip": ("update", "release", "version"),
+        "min_length": 10,
+    },
+}
+
+# Words ignored when comparing titles for duplicates
+STOP_WORDS: FrozenSet[str] = frozenset(
+    {"support", "feature", "implementation", "new", "add", "the", "a", "an", "for", "to", "of", "in", "with"}
+)
+
+
+def _alternation(words: Iterable[str]) -> Optional["re.Pattern[str]"]:
+    """Compile keywords into one regex, longest first so none is shadowed."""
+    words = sorted(set(words), key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(word) for word in words))
+
+
+class TitleClassifier:
+    """Compiled form of one source's rules."""
+
+    __slots__ = ("_skip", "_include", "_tags", "_min_length")
+
+    def __init__(
+        self,
+        skip: Sequence[str] = (),
+        include: Sequence[str] = (),
+        tags: Optional[Mapping[str, Sequence[str]]] = None,
+        min_length: int = 0,
+    ) -> None:
+        """Compile the rule lists."""
+        self._skip = _alternation(skip)
+        self._include = _alternation(include)
+        self._tags = [(tag, _alternation(words)) for tag, words in (tags or {}).items()]
+        self._min_length = min_length
+
+    def classify(self, title: str) -> Optional[FrozenSet[str]]:
+        """Return the title's tags, or None if the rules reject it."""
+        if self._min_length and len(title.strip()) < self._min_length:
+            return None
+        lowered = title.lower()
+        if self._skip is not None and self._skip.search(lowered):
+            return None
+        if self._include is not None and not self._include.search(lowered):
+            return None
+        if not self._tags:
+            return frozenset()
+        return frozenset(tag for tag, pattern in self._tags if pattern is not None and pattern.search(lowered))
+
+    def select(self, items: Iterable[Dict[str, Any]], key: str = "title") -> List[Tuple[Dict[str, Any], FrozenSet[str]]]:
+        """Classify a whole batch, returning accepted items with their tags."""
+        classify = self.classify
+        selected = []
+        for item in items:
+            tags = classify(item.get(key) or "")
+            if tags is not None:
+                selected.append((item, tags))
+        return selected
+
+
+CLASSIFIERS: Dict[str, TitleClassifier] = {kind: TitleClassifier(**rules) for kind, rules in TITLE_RULES.items()}
@@ -1,7 +1,26 @@
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
-from .const import DOMAIN
+from .const import (
+    CONF_DEDUP_THRESHOLD,
+    CONF_FORUM_PAGES,
+    CONF_HACS_CONCURRENCY,
+    CONF_HTML_ATTRIBUTE,
+    CONF_PARTIAL_INTERVAL,
+    CONF_REFRESH_DEADLINE,
+    CONF_SOURCE_TTLS,
+    DEFAULT_DEDUP_THRESHOLD,
+    DEFAULT_FORUM_PAGES,
+    DEFAULT_HACS_CONCURRENCY,
+    DEFAULT_HTML_ATTRIBUTE,
+    DEFAULT_PARTIAL_INTERVAL,
+    DEFAULT_REFRESH_DEADLINE,
+    DEFAULT_SOURCE_TTLS,
+    DOMAIN,
+)
+
+# Per-source TTLs are edited in minutes, one field per source, and stored in seconds
+TTL_FIELD_PREFIX = "ttl_"
 
 class HAOSFeatureForecastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for HAOS Feature Forecast."""
@@ -42,22 +61,50 @@ class HAOSFeatureForecastOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for HAOS Feature Forecast."""
 
     async def async_step_init(self, user_input=None):
-        """Manage the options."""
+        """Manage the token and the refresh options."""
+        options = self.config_entry.options
         if user_input is not None:
-            # Update the config entry with new token
+            token = user_input.pop("github_token", "")
+            ttls = {
+                name: user_input.pop(f"{TTL_FIELD_PREFIX}{name}") * 60
+                for name in DEFAULT_SOURCE_TTLS
+                if f"{TTL_FIELD_PREFIX}{name}" in user_input
+            }
+            new_options = {**options, **user_input, CONF_SOURCE_TTLS: ttls}
+            # Token and options in one update, so the entry reloads once
             self.hass.config_entries.async_update_entry(
-                self.config_entry,
-                data={"github_token": user_input.get("github_token", "")}
+                self.config_entry, data={"github_token": token}, options=new_options
             )
-            return self.async_create_entry(title="", data={})
+            return self.async_create_entry(title="", data=new_options)
 
         # Pre-fill with existing token
         current_token = self.config_entry.data.get("github_token", "")
-        
-        return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema({
-                vol.Optional("github_token", description={"suggested_value": current_token}): str,
-            })
-        )
+        ttls = options.get(CONF_SOURCE_TTLS, {})
+        schema = {
+            vol.Optional("github_token", description={"suggested_value": current_token}): str,
+            vol.Optional(
+                CONF_HTML_ATTRIBUTE, default=options.get(CONF_HTML_ATTRIBUTE, DEFAULT_HTML_ATTRIBUTE)
+            ): bool,
+            vol.Optional(
+                CONF_HACS_CONCURRENCY, default=options.get(CONF_HACS_CONCURRENCY, DEFAULT_HACS_CONCURRENCY)
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+            vol.Optional(
+                CONF_DEDUP_THRESHOLD, default=options.get(CONF_DEDUP_THRESHOLD, DEFAULT_DEDUP_THRESHOLD)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=1.0)),
+            vol.Optional(
+                CONF_FORUM_PAGES, default=options.get(CONF_FORUM_PAGES, DEFAULT_FORUM_PAGES)
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+            vol.Optional(
+                CONF_PARTIAL_INTERVAL, default=options.get(CONF_PARTIAL_INTERVAL, DEFAULT_PARTIAL_INTERVAL)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+            vol.Optional(
+                CONF_REFRESH_DEADLINE, default=options.get(CONF_REFRESH_DEADLINE, DEFAULT_REFRESH_DEADLINE)
+            ): vol.All(vol.Coerce(int), vol.Range(min=30, max=600)),
+        }
+        for name, ttl in DEFAULT_SOURCE_TTLS.items():
+            minutes = round(float(ttls.get(name, ttl.total_seconds())) / 60)
+            schema[vol.Optional(f"{TTL_FIELD_PREFIX}{name}", default=minutes)] = vol.All(
+                vol.Coerce(int), vol.Range(min=5, max=7 * 24 * 60)
+            )
 
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
@@ -1 +1,65 @@
+from datetime import timedelta
+
 DOMAIN = "haos_feature_forecast"
+
+# Entry option holding per-source TTL overrides in seconds, e.g. {"hacs_features": 43200}
+CONF_SOURCE_TTLS = "source_ttls"
+
+# Entry option limiting parallel HACS repository lookups
+CONF_HACS_CONCURRENCY = "hacs_concurrency"
+DEFAULT_HACS_CONCURRENCY = 8
+
+# Entry option: keep the rendered HTML in the sensor attributes (the card template reads it);
+# when off, cards fetch it from the forecast API instead
+CONF_HTML_ATTRIBUTE = "html_attribute"
+DEFAULT_HTML_ATTRIBUTE = True
+
+# Entry option: topic-list pages (30 topics each) read per forum walk
+CONF_FORUM_PAGES = "forum_pages"
+DEFAULT_FORUM_PAGES = 5
+
+# Entry option: minimum seconds between interim forecasts published while sources are still fetched
+CONF_PARTIAL_INTERVAL = "partial_interval"
+DEFAULT_PARTIAL_INTERVAL = 5
+
+# Entry option: title similarity (token Jaccard, 0-1) above which features are merged
+CONF_DEDUP_THRESHOLD = "dedup_threshold"
+DEFAULT_DEDUP_THRESHOLD = 0.6
+
+# How long each source's data stays fresh; sources change at very different speeds
+DEFAULT_SOURCE_TTLS = {
+    "core_releases": timedelta(hours=24),
+    "os_releases": timedelta(hours=24),
+    "github_features": timedelta(hours=1),
+    "next_release_features": timedelta(hours=3),
+    "merged_features": timedelta(hours=1),
+    "blog_features": timedelta(hours=12),
+    "discussion_features": timedelta(hours=6),
+    "forum_features": timedelta(hours=6),
+    "hacs_features": timedelta(hours=24),
+}
+
+# Longest a source's fetch may take before it is abandoned as failed and its cached data used
+DEFAULT_SOURCE_TIMEOUTS = {
+    "core_releases": timedelta(seconds=60),
+    "os_releases": timedelta(seconds=60),
+    "github_features": timedelta(seconds=90),
+    "next_release_features": timedelta(seconds=60),
+    "merged_features": timedelta(seconds=90),
+    "blog_features": timedelta(seconds=45),
+    "discussion_features": timedelta(seconds=45),
+    "forum_features": timedelta(seconds=60),
+    "hacs_features": timedelta(seconds=150),
+}
+
+# Entry option: seconds from the start of a refresh until its fetch phase ends. Each
+# source's timeout is cut to what is left of it, so it caps the slow HACS scan too
+CONF_REFRESH_DEADLINE = "refresh_deadline"
+DEFAULT_REFRESH_DEADLINE = 120
+
+# The coordinator ticks at the fastest source TTL; slower sources are skipped until due
+UPDATE_INTERVAL = min(DEFAULT_SOURCE_TTLS.values())
+
+# Requested refreshes (the update_forecast service) run at most once per this
+# interval; requests in between are coalesced into one trailing refresh
+MIN_REFRESH_INTERVAL = timedelta(minutes=2)
@@ -1,15 +1,23 @@
 """DataUpdateCoordinator for HAOS Feature Forecast."""
-from datetime import timedelta
 import logging
+from html import escape
+from typing import Any, Dict, List, Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN
+from .const import DOMAIN, MIN_REFRESH_INTERVAL, UPDATE_INTERVAL
 from .fetch_haos_features import async_fetch_haos_features
+from .model import Forecast
 
 _LOGGER = logging.getLogger(__name__)
 
+def _forecast_id(domain_data: Dict[str, Any]) -> Optional[str]:
+    """Return a short identifier of the rendered forecast's content."""
+    fingerprint = domain_data.get("forecast_fingerprint")
+    return fingerprint[:12] if fingerprint else None
+
 class HaosFeatureForecastCoordinator(DataUpdateCoordinator):
     """Coordinator to manage data updates."""
 
@@ -19,8 +27,18 @@ class HaosFeatureForecastCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(hours=6),
+            update_interval=UPDATE_INTERVAL,
+            # The first request refreshes at once; requests while it runs are
+            # dropped and later ones within the cooldown share one trailing refresh
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=MIN_REFRESH_INTERVAL.total_seconds(),
+                immediate=True,
+            ),
         )
+        # Set while a manual request runs so its refresh refetches every source
+        self._force_next = False
         # Provide helpful initial message instead of empty content
         initial_html = (
             "<p><b>⏳ Initializing HAOS Feature Forecast...</b></p>"
@@ -39,11 +57,70 @@ class HaosFeatureForecastCoordinator(DataUpdateCoordinator):
             "Check the sensor or card for initialization status."
         )
 
+    def restore_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Seed the coordinator and domain cache from a persisted snapshot."""
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        rendered_html = snapshot.get("rendered_html", "")
+        feature_count = snapshot.get("feature_count", 0)
+        domain_data["cached_features"] = snapshot.get("cached_features", {})
+        domain_data["release_data"] = snapshot.get("release_data", {})
+        # A reload keeps the live scheduler state saved on unload
+        domain_data["scheduler_state"] = domain_data.get("scheduler_state") or snapshot.get("scheduler", {})
+        domain_data["forecast_fingerprint"] = snapshot.get("forecast_fingerprint")
+        domain_data["forecast"] = Forecast.from_json(snapshot.get("forecast"))
+        domain_data["first_seen"] = snapshot.get("first_seen", {})
+        domain_data["rendered_html"] = rendered_html
+        domain_data["feature_count"] = feature_count
+        domain_data["last_successful_html"] = rendered_html
+        domain_data["last_successful_count"] = feature_count
+        self.data = {
+            "state": "OK",
+            "rendered_html": rendered_html,
+            "feature_count": feature_count,
+            "forecast_id": _forecast_id(domain_data),
+        }
+        _LOGGER.info(
+            f"Restored forecast snapshot from {snapshot.get('saved_at', 'unknown time')} "
+            f"({feature_count} features)"
+        )
+
+    @callback
+    def async_set_partial_data(self, rendered_html: str, feature_count: int, forecast_id: str, pending: List[str]) -> None:
+        """Show an interim forecast while the ``pending`` sources are still being fetched.
+
+        Unlike ``async_set_updated_data`` this leaves the refresh schedule and
+        any queued refresh request alone; the running refresh sets the final data.
+        """
+        self.data = {
+            "state": "OK",
+            "rendered_html": rendered_html,
+            "feature_count": feature_count,
+            "forecast_id": forecast_id,
+            "pending_sources": pending,
+        }
+        self.async_update_listeners()
+
+    async def async_request_manual_refresh(self) -> None:
+        """Request a refresh of every source through the debouncer.
+
+        The flag only reaches a refresh the debouncer runs immediately, which
+        forces it (see ``async_fetch_haos_features`` for a refresh already
+        running). A request coalesced into the trailing refresh of the cooldown
+        comes at most ``MIN_REFRESH_INTERVAL`` after the last requested
+        refresh; that trailing refresh runs unforced.
+        """
+        self._force_next = True
+        try:
+            await self.async_request_refresh()
+        finally:
+            self._force_next = False
+
     async def _async_update_data(self):
         """Fetch data from the integration."""
+        force, self._force_next = self._force_next, False
         try:
-            _LOGGER.info("Coordinator starting data update...")
-            await async_fetch_haos_features(self.hass)
+            _LOGGER.info(f"Coordinator starting {'forced ' if force else ''}data update...")
+            await async_fetch_haos_features(self.hass, force=force)
             # Return a dict with state and attributes instead of just HTML
             domain_data = self.hass.data.get(DOMAIN, {})
             rendered_html = domain_data.get("rendered_html", "")
@@ -73,13 +150,14 @@ class HaosFeatureForecastCoordinator(DataUpdateCoordinator):
             return {
                 "state": "OK",
                 "rendered_html": rendered_html,
-                "feature_count": feature_count
+                "feature_count": feature_count,
+                "forecast_id": _forecast_id(domain_data),
             }
         except Exception as err:
             _LOGGER.error("Error updating HAOS Feature Forecast: %s", err, exc_info=True)
             error_html = (
                 "<p><b>❌ Error loading forecast data</b></p>"
-                f"<p>Error: {str(err)}</p>"
+                f"<p>Error: {escape(str(err))}</p>"
                 "<p><small>Check logs for details: <code>ha core logs | grep haos_feature_forecast</code></small></p>"
                 "<p><small>See <a href='https://github.com/R00S/haos_feature_forecast/blob/main/TROUBLESHOOTING.md' target='_blank'>Troubleshooting Guide</a></small></p>"
             )
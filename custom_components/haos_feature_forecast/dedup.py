@@ -0,0 +1,159 @@
+"""Linear-time feature deduplication with near-duplicate clustering.
+
+Titles are reduced to token sets and summarized with MinHash signatures.
+An LSH index over signature bands proposes candidate pairs in roughly
+linear time, and only those pairs are checked against the exact Jaccard
+threshold. Matching features from different sources are merged into one
+entry that lists every source.
+"""
+from __future__ import annotations
+
+import random
+import re
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from .classify import STOP_WORDS
+from .const import DEFAULT_DEDUP_THRESHOLD
+
+# 12 bands of 3 rows: a pair at 0.6 Jaccard shares a band with ~95% probability,
+# while unrelated titles that merely share one word rarely do
+MINHASH_PERMUTATIONS = 36
+LSH_BANDS = 12
+_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+
+# Words in more titles than this are left out of signatures so that generic
+# terms ("sensor", "card") do not pile every title into the same buckets
+COMMON_TOKEN_MIN_COUNT = 20
+COMMON_TOKEN_RATIO = 0.02
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(MINHASH_PERMUTATIONS)
+]
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def title_tokens(title: str) -> FrozenSet[str]:
+    """Return the significant lower-case words of a title."""
+    words = _PUNCTUATION.sub("", title.lower()).split()
+    return frozenset(w for w in words if w not in STOP_WORDS and len(w) > 2)
+
+
+@lru_cache(maxsize=16384)
+def _token_hashes(token: str) -> Tuple[int, ...]:
+    """Hash one token under every permutation; vocabularies repeat a lot."""
+    h = zlib.crc32(token.encode())
+    return tuple((a * h + b) % _PRIME for a, b in _PERMUTATIONS)
+
+
+def minhash(tokens: FrozenSet[str]) -> Tuple[int, ...]:
+    """Return the MinHash signature of a non-empty token set."""
+    return tuple(map(min, zip(*map(_token_hashes, tokens))))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Return the Jaccard similarity of two token sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _score(feature: Dict[str, Any]) -> int:
+    return feature.get("importance", 1) * feature.get("likelihood", 1)
+
+
+def _merge(cluster: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge a cluster into its highest-scored member, attaching all sources."""
+    best = max(cluster, key=_score)
+    merged = dict(best)
+    sources: List[Dict[str, Any]] = []
+    seen = set()
+    # The representative's own source is listed first
+    for feature in [best] + [f for f in cluster if f is not best]:
+        for src in feature.get("sources") or [{"source": feature.get("source"), "url": feature.get("url")}]:
+            key = (src.get("source"), src.get("url"))
+            if key not in seen:
+                seen.add(key)
+                sources.append(src)
+    merged["sources"] = sources
+    # Keep an explicit release target reported by any member
+    if not merged.get("target_version"):
+        targeted = next((f for f in cluster if f.get("target_version")), None)
+        if targeted is not None:
+            merged["target_version"] = targeted["target_version"]
+    # Corroboration from other sources never lowers the estimate
+    merged["importance"] = max(f.get("importance", 1) for f in cluster)
+    merged["likelihood"] = max(f.get("likelihood", 1) for f in cluster)
+    return merged
+
+
+def deduplicate(
+    features: Sequence[Dict[str, Any]],
+    threshold: float = DEFAULT_DEDUP_THRESHOLD,
+    tokenizer: Callable[[str], FrozenSet[str]] = title_tokens,
+) -> List[Dict[str, Any]]:
+    """Cluster features with similar titles and merge each cluster.
+
+    Features whose title has no significant words are dropped. The result
+    keeps the order in which each cluster was first seen.
+    """
+    token_sets: List[FrozenSet[str]] = []
+    kept: List[Dict[str, Any]] = []
+    for feature in features:
+        tokens = tokenizer(feature.get("title", ""))
+        if tokens:
+            token_sets.append(tokens)
+            kept.append(feature)
+
+    parent = list(range(len(kept)))
+    counts = Counter(token for tokens in token_sets for token in tokens)
+    common_limit = max(COMMON_TOKEN_MIN_COUNT, len(kept) * COMMON_TOKEN_RATIO)
+    common = {token for token, count in counts.items() if count > common_limit}
+
+    def _find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Identical token sets are merged without hashing
+    by_tokens: Dict[FrozenSet[str], int] = {}
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    checked = set()
+    for i, tokens in enumerate(token_sets):
+        first = by_tokens.setdefault(tokens, i)
+        if first != i:
+            parent[i] = _find(first)
+            continue
+        if threshold >= 1.0:
+            continue
+        signature = minhash(tokens - common or tokens)
+        for band in range(LSH_BANDS):
+            bucket = buckets.setdefault((band, signature[band * _ROWS:(band + 1) * _ROWS]), [])
+            for j in bucket:
+                root_i, root_j = _find(i), _find(j)
+                if root_i == root_j or (j, i) in checked:
+                    continue
+                checked.add((j, i))
+                if jaccard(tokens, token_sets[j]) >= threshold:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+            bucket.append(i)
+
+    clusters: Dict[int, List[Dict[str, Any]]] = {}
+    for i, feature in enumerate(kept):
+        clusters.setdefault(_find(i), []).append(feature)
+    return [cluster[0] if len(cluster) == 1 else _merge(cluster) for cluster in clusters.values()]
+
+
+def dedup_threshold(value: Optional[Any]) -> float:
+    """Return a usable threshold from an option value."""
+    try:
+        threshold = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_DEDUP_THRESHOLD
+    return min(max(threshold, 0.1), 1.0)
@@ -0,0 +1,36 @@
+"""Diagnostics support for HAOS Feature Forecast."""
+from __future__ import annotations
+
+import time
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {"github_token"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return the structured forecast and refresh state for a config entry."""
+    domain_data = hass.data.get(DOMAIN, {})
+    forecast = domain_data.get("forecast")
+    scheduler = domain_data.get("scheduler")
+    merge_index = domain_data.get("merge_index")
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "forecast": forecast.as_dict() if forecast else None,
+        "scheduler": scheduler.as_dict() if scheduler else domain_data.get("scheduler_state", {}),
+        "breakers": scheduler.breaker_states(time.time()) if scheduler else {},
+        "accuracy": domain_data.get("accuracy"),
+        "release_prediction": domain_data.get("release_prediction"),
+        "merge_index": merge_index.as_dict() if merge_index else None,
+        "source_fingerprints": domain_data.get("source_fingerprints", {}),
+        "http_cache_stats": domain_data.get("http_cache_stats", {}),
+        "metrics": domain_data.get("metrics"),
+    }
@@ -4,24 +4,75 @@
 import asyncio
 import logging
 import re
+import time
+from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
-from statistics import mean
-from typing import Dict, List, Any, Optional
-from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, List, Any, Optional
 
 import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.const import __version__ as HA_VERSION
-from .const import DOMAIN
+from . import graphql
+from .classify import CLASSIFIERS
+from .const import (
+    CONF_DEDUP_THRESHOLD,
+    CONF_FORUM_PAGES,
+    CONF_HACS_CONCURRENCY,
+    CONF_PARTIAL_INTERVAL,
+    CONF_REFRESH_DEADLINE,
+    CONF_SOURCE_TTLS,
+    DEFAULT_FORUM_PAGES,
+    DEFAULT_HACS_CONCURRENCY,
+    DEFAULT_PARTIAL_INTERVAL,
+    DEFAULT_REFRESH_DEADLINE,
+    DEFAULT_SOURCE_TIMEOUTS,
+    DOMAIN,
+)
+from .blog_feed import BlogStore, FeedEntry, async_get_blog_store, async_read_new_entries
+from .dedup import deduplicate, dedup_threshold, title_tokens
+from .forum_index import ForumIndex, async_get_forum_index, async_sync_forum
+from .github_client import GitHubClient, async_get_governor
+from .hacs_index import HacsIndexCache, async_fetch_hacs_index, async_get_hacs_index_cache
+from .http_cache import async_get_http_cache
+from .http_session import async_get_forecast_session
+from .item_store import CoreItemStore, async_get_item_store
+from .ratelimit import PRIORITY_ENRICHMENT, PRIORITY_ITEMS, PRIORITY_RELEASES, TokenBucket
+from .lifecycle import LifecycleDB, async_get_lifecycle_db
+from .merge_index import MergeIndex, async_get_merge_index
+from .metrics import PipelineMetrics
+from .model import Feature, Forecast
+from .render import render_html
+from .release_history import ReleaseHistory, async_get_release_history
+from .scheduler import BREAKER_HALF_OPEN, BREAKER_OPEN, SourceScheduler
+from .storage import async_schedule_snapshot_save, compact_releases, source_fingerprint
 
 _LOGGER = logging.getLogger(__name__)
 
 # GitHub URLs
 HA_RELEASES = "https://api.github.com/repos/home-assistant/core/releases"
 HA_OS_RELEASES = "https://api.github.com/repos/home-assistant/operating-system/releases"
+# One request covers about a year of releases for the cadence history
+RELEASES_PARAMS = {"per_page": 100}
 HA_ISSUES = "https://api.github.com/repos/home-assistant/core/issues"
 HA_DISCUSSIONS = "https://api.github.com/repos/home-assistant/architecture/discussions"
+GITHUB_SEARCH_ISSUES = "https://api.github.com/search/issues"
+HA_COMPARE = "https://api.github.com/repos/home-assistant/core/compare/{base}...dev"
+CORE_REPO = "home-assistant/core"
+
+# Labels marking merged or milestoned core PRs as user-facing features
+NEXT_RELEASE_LABELS = ("new-integration", "new-feature", "breaking-change")
+# Search result pages (100 each) per query; a month of feature merges fits in two
+NEXT_RELEASE_MAX_PAGES = 3
+# Compare pages (100 commits each) per run; a longer backlog continues next run
+MERGE_INDEX_MAX_PAGES = 5
+
+# Forum topics gaining this many likes a week rank one importance level higher
+FORUM_TRENDING_LIKES_PER_WEEK = 5
+FORUM_MAX_FEATURES = 10
+
+# Pages of 100 issues/PRs loaded on the first sync without a token
+CORE_ITEMS_ANONYMOUS_PAGES = 2
 
 # Blog and Forum URLs
 HA_BLOG_RSS = "https://www.home-assistant.io/blog/feed.xml"
@@ -31,6 +82,11 @@ COMMUNITY_FORUM = "https://community.home-assistant.io"
 # HACS URLs
 HACS_DEFAULT_REPOS = "https://raw.githubusercontent.com/hacs/default/master/data.json"
 
+# Repository fields kept from GET /repos/{name} for HACS scoring
+HACS_REPO_FIELDS = ("name", "description", "stargazers_count", "created_at", "pushed_at", "html_url")
+# Repositories checked per run without a token (60 requests/hour shared with everything else)
+HACS_UNAUTHENTICATED_BUDGET = 15
+
 # Importance levels (1-5 scale)
 IMPORTANCE_CRITICAL = 5  # Core features, widely used integrations
 IMPORTANCE_HIGH = 4      # Popular features, major integrations
@@ -45,7 +101,38 @@ LIKELIHOOD_MEDIUM = 3    # Discussed with positive signals
 LIKELIHOOD_LOW = 2       # Early discussion, no commitment
 LIKELIHOOD_SPECULATIVE = 1  # Just ideas
 
-SOURCE_WEIGHTS = {"pr":1.0,"blog":0.95,"milestone":0.9,"discussion":0.8,"issue":0.7,"forum":0.6}
+# Per-source cache keys, in fetch order; each has its own TTL in const.DEFAULT_SOURCE_TTLS
+SOURCE_NAMES = (
+    "core_releases",
+    "os_releases",
+    "github_features",
+    "next_release_features",
+    "merged_features",
+    "blog_features",
+    "discussion_features",
+    "forum_features",
+    "hacs_features",
+)
+
+# GitHubClient source labels used by each scheduled source, to spot deferrals
+_SOURCE_REQUEST_LABELS = {
+    "core_releases": ("core_releases",),
+    "os_releases": ("os_releases",),
+    "github_features": ("issues",),
+    "next_release_features": ("search",),
+    "merged_features": ("compare",),
+    "discussion_features": ("discussions",),
+    "hacs_features": ("hacs_repos",),
+}
+
+_SOURCE_FAILURE_HINTS = {
+    "github_features": "This may be due to rate limiting - consider adding a GitHub token.",
+    "hacs_features": "This may be due to rate limiting - consider adding a GitHub token.",
+    "blog_features": "The blog RSS feed may be temporarily unavailable.",
+}
+
+# Prior reliability per source; recalibrated from landed-vs-predicted history (lifecycle.py)
+SOURCE_WEIGHTS = {"merged":1.0,"pr":1.0,"blog":0.95,"milestone":0.9,"discussion":0.8,"issue":0.7,"forum":0.6}
 
 def parse_ha_version(version_str: str) -> tuple:
     """Parse Home Assistant version string to (year, month).
@@ -66,276 +153,418 @@ def get_next_version(year: int, month: int) -> tuple:
         return (year + 1, 1)
     return (year, month + 1)
 
-def _src_badge(src, url):
-    if url:
-        return f'<a href="{url}" target="_blank">{src.title()}</a>'
-    return src.title()
-
-def _importance_label(level: int) -> str:
-    """Convert importance level to label."""
-    labels = {5: "Critical", 4: "High", 3: "Medium", 2: "Low", 1: "Minimal"}
-    return labels.get(level, "Unknown")
-
-def _likelihood_label(level: int) -> str:
-    """Convert likelihood level to label."""
-    labels = {5: "Certain", 4: "Very likely", 3: "Likely", 2: "Possible", 1: "Speculative"}
-    return labels.get(level, "Unknown")
-
-def _rank_key(f):
-    """Sort features by importance * likelihood (descending)."""
+def _rank_key(f, weights: Optional[Dict[str, float]] = None):
+    """Sort features by importance * likelihood * source weight (descending).
+    
+    A feature reported by several sources uses its most reliable source.
+    """
     importance = f.get("importance", 1)
     likelihood = f.get("likelihood", 1)
-    return -(importance * likelihood)
+    weights = SOURCE_WEIGHTS if weights is None else weights
+    refs = f.get("sources") or [{"source": f.get("source")}]
+    weight = max(weights.get(ref.get("source"), 1.0) for ref in refs)
+    return -(importance * likelihood * weight)
 
 def normalize_title(title: str) -> str:
     """Normalize title for deduplication."""
-    # Remove common words and punctuation
-    title = title.lower()
-    title = re.sub(r'[^\w\s]', '', title)  # Remove punctuation
-    # Remove common stop words
-    stop_words = {'support', 'feature', 'implementation', 'new', 'add', 'the', 'a', 'an', 'for', 'to', 'of', 'in', 'with'}
-    words = [w for w in title.split() if w not in stop_words and len(w) > 2]
-    return ' '.join(sorted(words))  # Sort to handle word order
-
-async def fetch_github_data(session: aiohttp.ClientSession, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> List[Dict[str, Any]]:
-    """Fetch data from GitHub API."""
-    try:
-        async with session.get(url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-            if resp.status == 200:
-                return await resp.json()
-            elif resp.status == 403:
-                _LOGGER.warning(f"GitHub API rate limit exceeded (status 403). Add a GitHub token in integration options to increase rate limit from 60/hour to 5000/hour.")
-                return []
-            elif resp.status == 401:
-                _LOGGER.error(f"GitHub API authentication failed (status 401). Check that your GitHub token is valid.")
-                return []
-            else:
-                _LOGGER.debug(f"GitHub API returned status {resp.status} for {url}")
-                return []
-    except Exception as err:
-        _LOGGER.debug(f"Failed to fetch from {url}: {err}")
-        return []
+    # Sort to handle word order
+    return ' '.join(sorted(title_tokens(title)))
 
-def predict_next_release(releases: List[Dict[str, Any]]) -> datetime:
-    """Predict next release date based on historical release cadence."""
-    try:
-        release_dates = []
-        for r in releases[:20]:  # Use last 20 releases
-            pub_date = r.get("published_at")
-            if pub_date:
-                # Parse ISO format with Z timezone
-                dt = datetime.fromisoformat(pub_date.replace("Z", "+00:00"))
-                release_dates.append(dt)
-        
-        if len(release_dates) < 2:
-            # Fallback to monthly cadence
-            return datetime.now(timezone.utc) + timedelta(days=30)
-        
-        release_dates.sort()
-        # Calculate average days between releases
-        deltas = [(release_dates[i+1] - release_dates[i]).days 
-                  for i in range(len(release_dates) - 1)]
-        avg_delta = mean(deltas) if deltas else 30
-        
-        # Predict next release
-        next_estimate = release_dates[-1] + timedelta(days=avg_delta)
-        return next_estimate
-    except Exception as err:
-        _LOGGER.warning(f"Error predicting next release: {err}")
-        return datetime.now(timezone.utc) + timedelta(days=30)
+async def fetch_github_data(
+    client: GitHubClient,
+    url: str,
+    params: Optional[Dict] = None,
+    source: str = "github",
+    priority: int = PRIORITY_ITEMS,
+    transform: Optional[Callable[[Any], Any]] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch data from GitHub API through the shared client.
+
+    Returns None on any failure, or when the rate-limit governor defers the
+    request to keep quota for higher-priority sources.
+    """
+    return await client.get_json(
+        url, params=params, source=source, priority=priority, transform=transform, rate_limiter=rate_limiter
+    )
+
+def _score_issue(issue: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Score a feature issue that passed the title rules, or return None if it is filtered out."""
+    title = issue.get("title", "")
+    reactions = issue.get("reactions", {}).get("+1", 0)
+    comments = issue.get("comments", 0)
+    has_milestone = issue.get("milestone") is not None
+    labels = [l.get("name", "") for l in issue.get("labels", [])]
+    
+    # Calculate importance based on reactions and comments
+    if reactions > 50 or "core" in labels:
+        importance = IMPORTANCE_CRITICAL
+    elif reactions > 20:
+        importance = IMPORTANCE_HIGH
+    elif reactions > 10:
+        importance = IMPORTANCE_MEDIUM
+    elif reactions > 5:
+        importance = IMPORTANCE_LOW
+    else:
+        importance = IMPORTANCE_MINIMAL
+    
+    # Calculate likelihood based on milestone, labels, and activity
+    if has_milestone:
+        likelihood = LIKELIHOOD_HIGH
+    elif "in-progress" in labels or comments > 10:
+        likelihood = LIKELIHOOD_MEDIUM
+    elif "investigating" in labels:
+        likelihood = LIKELIHOOD_LOW
+    else:
+        likelihood = LIKELIHOOD_SPECULATIVE
+    
+    # Only add features with reasonable importance and likelihood
+    if importance < IMPORTANCE_LOW or likelihood < LIKELIHOOD_LOW:
+        return None
+    return {
+        "title": title,
+        "importance": importance,
+        "likelihood": likelihood,
+        "source": "issue",
+        "url": issue.get("html_url", "")
+    }
+
+def _score_pr(pr: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Score an open feature PR that passed the title rules."""
+    title = pr.get("title", "")
+    labels = [l.get("name", "") for l in pr.get("labels", [])]
+    
+    # Calculate importance
+    if "core" in labels or "breaking-change" in labels:
+        importance = IMPORTANCE_HIGH
+    elif "new-integration" in labels:
+        importance = IMPORTANCE_MEDIUM
+    else:
+        importance = IMPORTANCE_LOW
+    
+    # PRs are more certain to land
+    if pr.get("draft", False):
+        likelihood = LIKELIHOOD_MEDIUM
+    else:
+        likelihood = LIKELIHOOD_HIGH
+    
+    return {
+        "title": title,
+        "importance": importance,
+        "likelihood": likelihood,
+        "source": "pr",
+        "url": pr.get("html_url", "")
+    }
+
+async def sync_core_items(client: GitHubClient, store: CoreItemStore) -> bool:
+    """Bring the local issue/PR store up to date; return True on success.
+    
+    The first sync walks every page of open issues and PRs (only the newest
+    CORE_ITEMS_ANONYMOUS_PAGES pages without a token). Later syncs ask for
+    ``since=<cursor>`` in ascending update order, so a walk that stops half
+    way can still move the cursor forward safely.
+    """
+    if store.last_sync:
+        params = {"state": "all", "since": store.last_sync, "sort": "updated", "direction": "asc", "per_page": 100}
+        max_pages = None
+    else:
+        params = {"state": "open", "sort": "updated", "direction": "desc", "per_page": 100}
+        max_pages = None if client.authenticated else CORE_ITEMS_ANONYMOUS_PAGES
+    
+    raw_items, complete = await client.get_paginated(
+        HA_ISSUES, params=params, source="issues", priority=PRIORITY_ITEMS, max_pages=max_pages
+    )
+    if not raw_items and not complete:
+        return False
+    
+    changed, newest = store.apply(raw_items)
+    # A truncated initial walk (newest first) must not set the cursor unless
+    # it was truncated on purpose to fit the anonymous budget
+    if store.last_sync or complete or max_pages is not None:
+        store.advance_cursor(newest)
+    store.async_schedule_save()
+    _LOGGER.info(
+        f"Synced core issues/PRs: {len(raw_items)} fetched, {changed} changed, "
+        f"{len(store.items)} tracked ({'incremental' if 'since' in params else 'full'} sync)"
+    )
+    return True
 
-async def fetch_real_features(session: aiohttp.ClientSession, headers: Optional[Dict] = None) -> List[Dict[str, Any]]:
-    """Fetch real planned features from GitHub."""
+async def fetch_real_features(client: GitHubClient, store: CoreItemStore) -> Optional[List[Dict[str, Any]]]:
+    """Fetch real planned features from GitHub.
+    
+    Scores every open feature issue and PR in the local item store after an
+    incremental sync, rather than a single page of each. Returns None if the
+    sync failed and nothing is stored yet.
+    """
     features = []
     
     try:
-        # Fetch issues and PRs with specific labels indicating planned features
-        # Look for issues with milestone, feature-request label, or in-progress PRs
-        issues = await fetch_github_data(
-            session, 
-            HA_ISSUES,
-            params={"state": "open", "labels": "new-feature", "per_page": 30, "sort": "reactions-+1"},
-            headers=headers
-        )
+        if not await sync_core_items(client, store):
+            if not store.items:
+                return None
+            _LOGGER.info(f"Core issue/PR sync failed, scoring {len(store.items)} stored items")
         
-        for issue in issues[:15]:  # Limit processing
+        # Maintenance and generic titles are dropped in one pass per source
+        for issue, _ in CLASSIFIERS["issue"].select(store.issues()):
             try:
-                # Skip if it's a PR (they have pull_request key)
-                if "pull_request" in issue:
-                    continue
-                
-                title = issue.get("title", "")
-                # Skip generic or maintenance-related issues
-                if any(skip in title.lower() for skip in ["update", "bump", "dependencies", "monthly", "weekly"]):
-                    continue
-                
-                reactions = issue.get("reactions", {}).get("+1", 0)
-                comments = issue.get("comments", 0)
-                has_milestone = issue.get("milestone") is not None
-                labels = [l.get("name", "") for l in issue.get("labels", [])]
-                
-                # Calculate importance based on reactions and comments
-                if reactions > 50 or "core" in labels:
-                    importance = IMPORTANCE_CRITICAL
-                elif reactions > 20:
-                    importance = IMPORTANCE_HIGH
-                elif reactions > 10:
-                    importance = IMPORTANCE_MEDIUM
-                elif reactions > 5:
-                    importance = IMPORTANCE_LOW
-                else:
-                    importance = IMPORTANCE_MINIMAL
-                
-                # Calculate likelihood based on milestone, labels, and activity
-                if has_milestone:
-                    likelihood = LIKELIHOOD_HIGH
-                elif "in-progress" in labels or comments > 10:
-                    likelihood = LIKELIHOOD_MEDIUM
-                elif "investigating" in labels:
-                    likelihood = LIKELIHOOD_LOW
-                else:
-                    likelihood = LIKELIHOOD_SPECULATIVE
-                
-                # Only add features with reasonable importance and likelihood
-                if importance >= IMPORTANCE_LOW and likelihood >= LIKELIHOOD_LOW:
-                    features.append({
-                        "title": title,
-                        "importance": importance,
-                        "likelihood": likelihood,
-                        "source": "issue",
-                        "url": issue.get("html_url", "")
-                    })
+                feature = _score_issue(issue)
+                if feature:
+                    features.append(feature)
             except Exception as err:
                 _LOGGER.debug(f"Error processing issue: {err}")
-                continue
-        
-        # Fetch open PRs that might indicate upcoming features
-        prs = await fetch_github_data(
-            session,
-            "https://api.github.com/repos/home-assistant/core/pulls",
-            params={"state": "open", "per_page": 30, "sort": "updated"},
-            headers=headers
-        )
         
-        for pr in prs[:15]:
+        for pr, _ in CLASSIFIERS["pr"].select(store.pulls()):
             try:
-                title = pr.get("title", "")
-                # Skip maintenance PRs
-                if any(skip in title.lower() for skip in ["bump", "update dependencies", "translation", "fix typo"]):
-                    continue
-                
-                # Look for feature PRs
-                if any(feat in title.lower() for feat in ["add ", "new ", "feature", "implement"]):
-                    labels = [l.get("name", "") for l in pr.get("labels", [])]
-                    
-                    # Calculate importance
-                    if "core" in labels or "breaking-change" in labels:
-                        importance = IMPORTANCE_HIGH
-                    elif "new-integration" in labels:
-                        importance = IMPORTANCE_MEDIUM
-                    else:
-                        importance = IMPORTANCE_LOW
-                    
-                    # PRs are more certain to land
-                    draft = pr.get("draft", False)
-                    if draft:
-                        likelihood = LIKELIHOOD_MEDIUM
-                    else:
-                        likelihood = LIKELIHOOD_HIGH
-                    
-                    if importance >= IMPORTANCE_LOW:
-                        features.append({
-                            "title": title,
-                            "importance": importance,
-                            "likelihood": likelihood,
-                            "source": "pr",
-                            "url": pr.get("html_url", "")
-                        })
+                feature = _score_pr(pr)
+                if feature:
+                    features.append(feature)
             except Exception as err:
                 _LOGGER.debug(f"Error processing PR: {err}")
-                continue
         
     except Exception as err:
         _LOGGER.warning(f"Error fetching real features: {err}")
+        return None
     
     return features
 
-async def fetch_blog_features(session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
+def _next_release_importance(labels: List[str]) -> int:
+    """Importance of a merged or milestoned PR from its labels."""
+    if "breaking-change" in labels:
+        return IMPORTANCE_HIGH
+    if "new-integration" in labels or "new-feature" in labels:
+        return IMPORTANCE_MEDIUM
+    return IMPORTANCE_LOW
+
+async def fetch_next_release_features(client: GitHubClient, prediction: Optional[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Fetch core PRs that are merged or milestoned for the next releases.
+    
+    Uses two bulk search queries instead of guessing from PR titles:
+    feature-labelled PRs merged into dev since the last stable release's
+    beta cut-off, and open PRs on the upcoming version's milestone. Merged
+    PRs are certain to ship; the upcoming beta cut-off decides whether in
+    the upcoming or the next version. Returns None if both searches failed.
+    """
+    if not prediction:
+        _LOGGER.debug("No release history yet, skipping next-release PRs until releases are known")
+        return []
+    upcoming_ver = prediction["upcoming"]["version"]
+    next_ver = prediction["next"]["version"]
+    last_stable = prediction["last_stable"]
+    since = last_stable.get("beta_cut") or last_stable["date"]
+    upcoming_beta = prediction["upcoming"].get("beta") or {}
+    upcoming_cut = upcoming_beta.get("date") if upcoming_beta.get("cut") else None
+    labels = ",".join(f'"{label}"' for label in NEXT_RELEASE_LABELS)
+    queries = {
+        "merged": f"repo:{CORE_REPO} is:pr is:merged base:dev merged:>={since[:19]}Z label:{labels}",
+        "milestone": f'repo:{CORE_REPO} is:pr is:open milestone:"{upcoming_ver}.0"',
+    }
+    results = await asyncio.gather(*(
+        client.get_paginated(
+            GITHUB_SEARCH_ISSUES,
+            params={"q": query, "per_page": 100, "sort": "updated", "order": "desc"},
+            source="search",
+            priority=PRIORITY_ITEMS,
+            max_pages=NEXT_RELEASE_MAX_PAGES,
+            items_key="items",
+            resource="search",
+        )
+        for query in queries.values()
+    ))
+    if all(not items and not complete for items, complete in results):
+        return None
+    features = []
+    for kind, (items, _) in zip(queries, results):
+        for pr in items:
+            try:
+                labels_found = [l.get("name", "") for l in pr.get("labels", [])]
+                if kind == "merged":
+                    merged_at = (pr.get("pull_request") or {}).get("merged_at") or pr.get("closed_at") or ""
+                    target = next_ver if upcoming_cut and merged_at > upcoming_cut else upcoming_ver
+                    likelihood = LIKELIHOOD_CERTAIN
+                else:
+                    target = upcoming_ver
+                    likelihood = LIKELIHOOD_HIGH
+                features.append({
+                    "title": pr.get("title", ""),
+                    "importance": _next_release_importance(labels_found),
+                    "likelihood": likelihood,
+                    "source": kind,
+                    "url": pr.get("html_url", ""),
+                    "target_version": target,
+                })
+            except Exception as err:
+                _LOGGER.debug(f"Error processing next-release PR: {err}")
+    _LOGGER.info(
+        f"Next-release PRs: {sum(1 for f in features if f['source'] == 'merged')} merged, "
+        f"{sum(1 for f in features if f['source'] == 'milestone')} on the {upcoming_ver} milestone"
+    )
+    return features
+
+async def sync_merge_index(client: GitHubClient, index: MergeIndex, base_tag: str) -> bool:
+    """Compare dev against the branch point tag, or the last compared commit, and index merged PRs."""
+    base = index.compare_base(base_tag)
+    commits, complete = await client.get_paginated(
+        HA_COMPARE.format(base=base),
+        params={"per_page": 100},
+        source="compare",
+        priority=PRIORITY_ITEMS,
+        max_pages=MERGE_INDEX_MAX_PAGES,
+        items_key="commits",
+    )
+    if not commits and not complete:
+        if base != base_tag and "compare" not in client.deferred:
+            # The cursor commit may be gone from dev; start over from the tag next run
+            index.reset_cursor()
+        return False
+    added = index.apply(commits)
+    index.async_schedule_save()
+    _LOGGER.info(
+        f"Compared {base[:12]}...dev: {len(commits)} commits, {added} new merged PRs, "
+        f"{len(index.prs)} merged since {base_tag}{'' if complete else ' (more next run)'}"
+    )
+    return True
+
+async def fetch_merged_features(client: GitHubClient, index: MergeIndex, history: ReleaseHistory) -> Optional[List[Dict[str, Any]]]:
+    """Return feature PRs merged into dev since it last branched for a core release.
+    
+    Merged PRs ship in the upcoming version, or the one after once the
+    upcoming beta has been cut. Unlabelled maintenance titles are dropped
+    with the PR title rules.
+    """
+    base_tag = history.branch_point_tag()
+    prediction = history.predict()
+    if not base_tag or not prediction:
+        _LOGGER.debug("No release history yet, skipping merged PR index until releases are known")
+        return []
+    if not await sync_merge_index(client, index, base_tag):
+        if not index.prs:
+            return None
+        _LOGGER.info(f"Merged PR index sync failed, using {len(index.prs)} indexed PRs")
+    cut = (prediction["upcoming"].get("beta") or {}).get("cut")
+    target = prediction["next" if cut else "upcoming"]["version"]
+    return [
+        {
+            "title": pr["title"],
+            "importance": IMPORTANCE_MEDIUM,
+            "likelihood": LIKELIHOOD_CERTAIN,
+            "source": "merged",
+            "url": pr["url"],
+            "target_version": target,
+        }
+        for pr, _ in CLASSIFIERS["pr"].select(index.prs.values())
+    ]
+
+# Phrases announcing planned features, applied to each post's title and summary
+# Matched per sentence: each pattern starts with a literal phrase or is anchored at the
+# sentence start and every repetition is bounded, so matching stays linear in the text
+_BLOG_FEATURE_PATTERNS = [
+    re.compile(r"\b(?i:coming soon|upcoming|in development|working on|next release)\b[^A-Z]{0,40}?([A-Z][a-zA-Z ]{5,50})"),
+    re.compile(r"^\s*([A-Z][a-zA-Z ]{5,50}?)\s+(?i:is |are )?(?i:coming soon|upcoming|will be|planned for)"),
+    re.compile(r"\b(?i:we're|we are) (?i:adding|building|working on|developing) ([A-Z][a-zA-Z ]{5,50})"),
+]
+_SENTENCE_END = re.compile(r"[.!?\n]+")
+BLOG_MAX_FEATURES_PER_POST = 5
+# Only the start of a post is searched, and each sentence up to this length
+BLOG_MAX_TEXT = 4000
+BLOG_MAX_SENTENCE = 300
+
+def _extract_blog_features(entry: FeedEntry) -> List[Dict[str, Any]]:
+    """Find planned features mentioned in one blog post."""
+    text = f"{entry.title}. {entry.summary}"[:BLOG_MAX_TEXT]
+    sentences = [sentence[:BLOG_MAX_SENTENCE] for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+    features = []
+    seen = set()
+    # Skip candidates that are too short or generic
+    classify = CLASSIFIERS["blog"].classify
+    for pattern in _BLOG_FEATURE_PATTERNS:
+        for match in (m for sentence in sentences for m in pattern.finditer(sentence)):
+            feature_text = match.group(1).strip()
+            if classify(feature_text) is None:
+                continue
+            if feature_text.lower() in seen:
+                continue
+            seen.add(feature_text.lower())
+            # Blog mentions are high credibility
+            features.append({
+                "title": feature_text,
+                "importance": IMPORTANCE_HIGH,  # Blog mentions are important
+                "likelihood": LIKELIHOOD_HIGH,   # High likelihood if on blog
+                "source": "blog",
+                "url": entry.link or HA_BLOG,
+                "published": entry.published,
+            })
+            if len(features) >= BLOG_MAX_FEATURES_PER_POST:
+                return features
+    return features
+
+def _extract_blog_posts(entries: List[FeedEntry]) -> Dict[str, Dict[str, Any]]:
+    """Extract the features of new posts, keyed by guid (runs in the executor)."""
+    processed = {}
+    for entry in entries:
+        try:
+            processed[entry.guid] = {"published": entry.published, "features": _extract_blog_features(entry)}
+        except Exception as err:
+            _LOGGER.debug(f"Error parsing blog post {entry.link}: {err}")
+    return processed
+
+async def fetch_blog_features(hass: HomeAssistant, session: aiohttp.ClientSession, blog_store: BlogStore) -> Optional[List[Dict[str, Any]]]:
     """Fetch planned features mentioned in Home Assistant blog posts.
     
+    The feed is parsed entry by entry and only posts not seen on an earlier
+    run are analysed; features of earlier posts come from ``blog_store``.
+    
     Note: The blog RSS feed may occasionally return 404 due to:
     - DNS/network issues
     - Blog infrastructure changes
     - Rate limiting on the home-assistant.io server
-    This is handled gracefully by returning empty list and using cached data.
+    This is handled gracefully by returning None and using cached data.
     """
-    features = []
-    
     try:
-        # Fetch recent blog posts
-        async with session.get(HA_BLOG_RSS, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-            if resp.status != 200:
-                _LOGGER.debug(f"Blog RSS returned status {resp.status} - this is normal if the blog feed is temporarily unavailable")
-                return features
-            
-            content = await resp.text()
-            
-            # Look for keywords indicating planned features in blog posts
-            # Common patterns: "coming soon", "in development", "upcoming", "next release", "working on"
-            feature_keywords = [
-                r"(?:coming soon|upcoming|in development|working on|next release).*?([A-Z][a-zA-Z\s]{5,50})",
-                r"([A-Z][a-zA-Z\s]{5,50}).*?(?:coming soon|upcoming|will be|planned for)",
-                r"(?:we're|we are) (?:adding|building|working on|developing) ([A-Z][a-zA-Z\s]{5,50})",
-            ]
-            
-            for pattern in feature_keywords:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in list(matches)[:5]:  # Limit to avoid spam
-                    try:
-                        feature_text = match.group(1).strip()
-                        # Skip if too short or generic
-                        if len(feature_text) < 10 or any(skip in feature_text.lower() for skip in ["update", "release", "version"]):
-                            continue
-                        
-                        # Blog mentions are high credibility
-                        features.append({
-                            "title": feature_text,
-                            "importance": IMPORTANCE_HIGH,  # Blog mentions are important
-                            "likelihood": LIKELIHOOD_HIGH,   # High likelihood if on blog
-                            "source": "blog",
-                            "url": HA_BLOG
-                        })
-                    except Exception as err:
-                        _LOGGER.debug(f"Error parsing blog feature: {err}")
-                        continue
-    
+        new_entries = await async_read_new_entries(session, HA_BLOG_RSS, blog_store)
     except Exception as err:
         _LOGGER.warning(f"Error fetching blog features: {err}")
+        return None
+    if new_entries is None:
+        return None
     
-    return features
+    if new_entries:
+        # Regex work over many posts; keep it off the event loop
+        processed = await hass.async_add_executor_job(_extract_blog_posts, new_entries)
+        blog_store.add_new(processed)
+    blog_store.async_schedule_save()
+    return blog_store.features()
 
-async def fetch_discussion_features(session: aiohttp.ClientSession, headers: Optional[Dict] = None) -> List[Dict[str, Any]]:
-    """Fetch features from Home Assistant architecture discussions."""
+async def fetch_discussion_features(client: GitHubClient) -> Optional[List[Dict[str, Any]]]:
+    """Fetch features from Home Assistant architecture discussions.
+    
+    Discussions are only exposed through GraphQL, which needs a token; the
+    REST call is kept as the unauthenticated fallback.
+    """
     features = []
     
     try:
+        items = None
+        if client.authenticated:
+            items = await graphql.fetch_items(client, ("discussions",), source="discussions")
+        
         # Fetch GitHub discussions (architecture repo has ADRs and major features)
-        discussions = await fetch_github_data(
-            session,
-            HA_DISCUSSIONS,
-            params={"state": "open", "per_page": 20},
-            headers=headers
-        )
+        if items is not None:
+            discussions = items["discussions"]
+        else:
+            discussions = await fetch_github_data(
+                client,
+                HA_DISCUSSIONS,
+                params={"state": "open", "per_page": 20},
+                source="discussions",
+            )
+            if discussions is None:
+                return None
         
-        for disc in discussions[:10]:
+        # Generic discussions are dropped; ADR/RFC style ones are tagged
+        for disc, tags in CLASSIFIERS["discussion"].select(discussions[:10]):
             try:
                 title = disc.get("title", "")
-                # Skip if too generic
-                if any(skip in title.lower() for skip in ["adr", "question", "meta"]):
-                    continue
-                
-                # Check for "ADR" or "RFC" style discussions (Architecture Decision Records)
-                is_adr = "adr" in title.lower() or "rfc" in title.lower()
+                is_adr = "adr" in tags
                 comments = disc.get("comments", 0)
                 
                 # Discussions in architecture repo are important
@@ -363,301 +592,567 @@ async def fetch_discussion_features(session: aiohttp.ClientSession, headers: Opt
     
     except Exception as err:
         _LOGGER.warning(f"Error fetching discussion features: {err}")
+        return None
     
     return features
 
-async def fetch_forum_features(session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
-    """Fetch popular feature requests from the community forum."""
+async def fetch_forum_features(session: aiohttp.ClientSession, index: ForumIndex, max_pages: int = DEFAULT_FORUM_PAGES) -> Optional[List[Dict[str, Any]]]:
+    """Rank feature requests across the whole forum index.
+    
+    The index is synced incrementally first; topics gaining likes quickly
+    are ranked up, so the result is not just the most recently bumped page.
+    """
     features = []
     
     try:
-        # Fetch from feature requests category
-        # Note: Community forum doesn't have a public API, so we'll use web scraping
-        forum_url = f"{COMMUNITY_FORUM}/c/feature-requests/13.json"
+        if not await async_sync_forum(session, COMMUNITY_FORUM, index, max_pages):
+            if not index.topics:
+                return None
+            _LOGGER.info(f"Could not fetch forum data, ranking {len(index.topics)} indexed topics")
         
-        async with session.get(forum_url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-            if resp.status != 200:
-                _LOGGER.debug(f"Could not fetch forum data: {resp.status}")
-                return features
-            
-            data = await resp.json()
-            topics = data.get("topic_list", {}).get("topics", [])
-            
-            for topic in topics[:10]:
-                try:
-                    title = topic.get("title", "")
-                    likes = topic.get("like_count", 0)
-                    views = topic.get("views", 0)
-                    
-                    # Skip meta-posts about the feature request process itself and non-specific topics
-                    title_lower = title.lower()
-                    
-                    # Define skip patterns for meta-posts and non-specific content
-                    skip_patterns = [
-                        "update", "general", "discussion",  # Original filters
-                        "about the", "guidelines", "guide",  # Meta category/process posts
-                        "heads-up", "moving",  # Meta announcements
-                        "how to", "rules", "process",  # Process documentation
-                        "pinned", "sticky",  # Pinned meta-posts
-                        "category", "faq", "frequently asked",  # Category information
-                        "feature requests are", "feature request guidelines",  # Specific meta-posts about FR process
-                    ]
-                    
-                    # Skip if title matches any skip pattern
-                    if any(skip in title_lower for skip in skip_patterns):
-                        continue
-                    
-                    # Skip titles that are too generic or vague (very short titles are often meta)
-                    if len(title.strip()) < 15:
-                        continue
-                    
-                    # Calculate importance based on engagement
-                    if likes > 50 or views > 1000:
-                        importance = IMPORTANCE_HIGH
-                    elif likes > 20 or views > 500:
-                        importance = IMPORTANCE_MEDIUM
-                    elif likes > 10 or views > 200:
-                        importance = IMPORTANCE_LOW
-                    else:
-                        continue  # Skip low engagement
-                    
-                    # Forum features are speculative unless someone is actively working on them
-                    # They usually end up in HACS first before getting implemented
-                    likelihood = LIKELIHOOD_SPECULATIVE
-                    
-                    topic_id = topic.get("id")
-                    url = f"{COMMUNITY_FORUM}/t/{topic_id}" if topic_id else COMMUNITY_FORUM
-                    
-                    features.append({
-                        "title": title,
-                        "importance": importance,
-                        "likelihood": likelihood,
-                        "source": "forum",
-                        "url": url
-                    })
-                except Exception as err:
-                    _LOGGER.debug(f"Error processing forum topic: {err}")
-                    continue
+        now = datetime.now(timezone.utc).timestamp()
+        ranked = []
+        # Skip meta-posts about the feature request process itself and non-specific topics
+        for topic, _ in CLASSIFIERS["forum"].select(index.open_topics()):
+            try:
+                support = topic["likes"] + topic["votes"]
+                views = topic["views"]
+                trend = index.likes_per_week(topic, now)
+                
+                # Calculate importance based on engagement
+                if support > 50 or views > 1000:
+                    importance = IMPORTANCE_HIGH
+                elif support > 20 or views > 500:
+                    importance = IMPORTANCE_MEDIUM
+                elif support > 10 or views > 200 or trend >= FORUM_TRENDING_LIKES_PER_WEEK:
+                    importance = IMPORTANCE_LOW
+                else:
+                    continue  # Skip low engagement
+                if trend >= FORUM_TRENDING_LIKES_PER_WEEK and importance < IMPORTANCE_HIGH:
+                    importance += 1
+                
+                # Forum features are speculative unless someone is actively working on them
+                # They usually end up in HACS first before getting implemented
+                ranked.append((importance, trend, support, {
+                    "title": topic["title"],
+                    "importance": importance,
+                    "likelihood": LIKELIHOOD_SPECULATIVE,
+                    "source": "forum",
+                    "url": f"{COMMUNITY_FORUM}/t/{topic['id']}",
+                }))
+            except Exception as err:
+                _LOGGER.debug(f"Error processing forum topic: {err}")
+                continue
+        
+        ranked.sort(key=lambda entry: entry[:3], reverse=True)
+        features = [entry[3] for entry in ranked[:FORUM_MAX_FEATURES]]
     
     except Exception as err:
         _LOGGER.warning(f"Error fetching forum features: {err}")
+        return None
     
     return features
 
-async def fetch_hacs_features(session: aiohttp.ClientSession, headers: Optional[Dict] = None) -> List[Dict[str, Any]]:
-    """Fetch popular NEW or recently UPGRADED HACS integrations and cards."""
+def _compact_repo(repo_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the repository fields the HACS scoring reads."""
+    return {key: repo_data.get(key) for key in HACS_REPO_FIELDS}
+
+def _hacs_recency(repo_data: Dict[str, Any], cutoff: datetime) -> tuple:
+    """Return (is_new, is_updated) relative to the cutoff date."""
+    is_new = False
+    is_updated = False
+    created_at = repo_data.get("created_at") or ""
+    pushed_at = repo_data.get("pushed_at") or ""
+    if created_at:
+        created_date = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        is_new = created_date > cutoff
+    if pushed_at:
+        push_date = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
+        is_updated = push_date > cutoff
+    return is_new, is_updated
+
+def _score_hacs_integration(repo_data: Dict[str, Any], cutoff: datetime) -> Optional[Dict[str, Any]]:
+    """Score a HACS integration repository, or return None if it is filtered out."""
+    stars = repo_data.get("stargazers_count") or 0
+    description = repo_data.get("description") or ""
+    name = (repo_data.get("name") or "").replace("-", " ").replace("_", " ").title()
+    
+    # Skip if too few stars (not popular enough)
+    if stars < 50:
+        _LOGGER.debug(f"Filtered {name}: only {stars} stars (need 50+)")
+        return None
+    
+    # Only include if new or recently updated
+    is_new, is_updated = _hacs_recency(repo_data, cutoff)
+    if not (is_new or is_updated):
+        _LOGGER.debug(f"Filtered {name}: not updated in last 3 months")
+        return None
+    
+    # We already know it's recently updated from the pushed_at check
+    recent_release = is_updated
+    
+    # Calculate importance based on stars and recency
+    if is_new and stars > 200:
+        importance = IMPORTANCE_HIGH
+    elif recent_release and stars > 500:
+        importance = IMPORTANCE_HIGH
+    elif stars > 300 or recent_release:
+        importance = IMPORTANCE_MEDIUM
+    elif stars > 100:
+        importance = IMPORTANCE_LOW
+    else:
+        _LOGGER.debug(f"Filtered {name}: importance too low (stars: {stars})")
+        return None
+    
+    # HACS features are always low likelihood for HA core incorporation
+    status = "New" if is_new else "Updated"
+    return {
+        "title": f"{name} integration ({status}){(' - ' + description[:40]) if description else ''}",
+        "importance": importance,
+        "likelihood": LIKELIHOOD_LOW,
+        "source": "hacs",
+        "url": repo_data.get("html_url") or "",
+        "stars": stars,
+    }
+
+def _score_hacs_card(repo_data: Dict[str, Any], cutoff: datetime) -> Optional[Dict[str, Any]]:
+    """Score a HACS Lovelace card repository, or return None if it is filtered out."""
+    stars = repo_data.get("stargazers_count") or 0
+    name = (repo_data.get("name") or "").replace("-", " ").replace("_", " ").title()
+    
+    # Skip if too few stars
+    if stars < 100:
+        _LOGGER.debug(f"Filtered card {name}: only {stars} stars (need 100+)")
+        return None
+    
+    is_new, is_updated = _hacs_recency(repo_data, cutoff)
+    if not (is_new or is_updated):
+        _LOGGER.debug(f"Filtered card {name}: not updated in last 3 months")
+        return None
+    
+    # Cards need more stars to be considered
+    if stars > 1000:
+        importance = IMPORTANCE_MEDIUM
+    elif stars > 500:
+        importance = IMPORTANCE_LOW
+    else:
+        _LOGGER.debug(f"Filtered card {name}: not enough stars for inclusion (need 500+, has {stars})")
+        return None
+    
+    # Cards are less likely to be incorporated
+    status = "New" if is_new else "Updated"
+    return {
+        "title": f"{name} card ({status})",
+        "importance": importance,
+        "likelihood": LIKELIHOOD_LOW,
+        "source": "hacs",
+        "url": repo_data.get("html_url") or "",
+        "stars": stars,
+    }
+
+async def _fetch_repo_metadata(
+    client: GitHubClient,
+    repo_names: List[str],
+    limiter: TokenBucket,
+    concurrency: int,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch repository metadata with a bounded pool of workers.
+
+    Workers stop pulling new repositories once the governor defers
+    enrichment traffic, leaving the remaining quota for other sources.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for repo_name in repo_names:
+        queue.put_nowait(repo_name)
+    results: Dict[str, Dict[str, Any]] = {}
+    
+    async def _worker() -> None:
+        while client.can_spend(PRIORITY_ENRICHMENT):
+            try:
+                repo_name = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            repo_data = await fetch_github_data(
+                client,
+                f"https://api.github.com/repos/{repo_name}",
+                source="hacs_repos",
+                priority=PRIORITY_ENRICHMENT,
+                transform=_compact_repo,
+                rate_limiter=limiter,
+            )
+            if isinstance(repo_data, dict) and repo_data:
+                results[repo_name] = repo_data
+    
+    workers = max(1, min(concurrency, len(repo_names)))
+    await asyncio.gather(*(_worker() for _ in range(workers)))
+    if not client.can_spend(PRIORITY_ENRICHMENT):
+        _LOGGER.warning(
+            f"GitHub quota reserve reached after {len(results)} of {len(repo_names)} HACS repositories; "
+            f"remaining repositories are deferred until the rate limit resets"
+        )
+    return results
+
+async def fetch_hacs_features(
+    hass: HomeAssistant,
+    client: GitHubClient,
+    index_cache: HacsIndexCache,
+    concurrency: int = DEFAULT_HACS_CONCURRENCY,
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch popular NEW or recently UPGRADED HACS integrations and cards.
+    
+    With a GitHub token the whole HACS catalogue is checked in one pass using
+    batched GraphQL queries. Without one, REST is used and only the first
+    HACS_UNAUTHENTICATED_BUDGET repositories in catalogue order are checked,
+    to stay inside the 60 requests/hour limit. The catalogue carries no
+    popularity data, so these are not the most popular ones.
+    """
     features = []
     
     try:
         _LOGGER.info("Fetching HACS features from default repository...")
-        # Fetch HACS default repositories data
-        async with session.get(HACS_DEFAULT_REPOS, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-            if resp.status != 200:
-                _LOGGER.warning(f"Could not fetch HACS data: HTTP {resp.status}")
-                return features
-            
-            data = await resp.json()
-            _LOGGER.info(f"HACS data fetched successfully. Found {len(data.get('integrations', []))} integrations and {len(data.get('lovelace', []))} cards")
-            
-            # Get current time for recency checks
-            now = datetime.now(timezone.utc)
-            three_months_ago = now - timedelta(days=90)
-            
-            # Process integrations
-            integrations = data.get("integrations", [])
-            # Drastically limit iterations to avoid rate limiting - process only 10 integrations
-            _LOGGER.info(f"Processing up to 10 HACS integrations (out of {len(integrations)} available)...")
-            integrations_checked = 0
-            integrations_filtered = 0
-            for integration in integrations[:10]:
-                try:
-                    integrations_checked += 1
-                    repo_name = integration.get("repository", "")
-                    if not repo_name:
-                        continue
-                    
-                    # Fetch repository details from GitHub to get stars and other metrics
-                    repo_url = f"https://api.github.com/repos/{repo_name}"
-                    async with session.get(repo_url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as repo_resp:
-                        if repo_resp.status != 200:
-                            continue
-                        
-                        repo_data = await repo_resp.json()
-                        stars = repo_data.get("stargazers_count", 0)
-                        description = repo_data.get("description", "")
-                        name = repo_data.get("name", "").replace("-", " ").replace("_", " ").title()
-                        created_at = repo_data.get("created_at", "")
-                        updated_at = repo_data.get("updated_at", "")
-                        pushed_at = repo_data.get("pushed_at", "")
-                        
-                        # Skip if too few stars (not popular enough)
-                        if stars < 50:
-                            integrations_filtered += 1
-                            _LOGGER.debug(f"Filtered {name}: only {stars} stars (need 50+)")
-                            continue
-                        
-                        # Check if it's new or recently updated
-                        is_new = False
-                        is_updated = False
-                        
-                        if created_at:
-                            created_date = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                            is_new = created_date > three_months_ago
-                        
-                        if pushed_at:
-                            push_date = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
-                            is_updated = push_date > three_months_ago
-                        
-                        # Only include if new or recently updated
-                        if not (is_new or is_updated):
-                            integrations_filtered += 1
-                            _LOGGER.debug(f"Filtered {name}: not updated in last 3 months")
-                            continue
-                        
-                        # Skip fetching release info to save API quota
-                        # We already know it's recently updated from push_at check
-                        recent_release = is_updated
-                        release_info = ""
-                        
-                        # Calculate importance based on stars and recency
-                        if is_new and stars > 200:
-                            importance = IMPORTANCE_HIGH
-                        elif recent_release and stars > 500:
-                            importance = IMPORTANCE_HIGH
-                        elif stars > 300 or recent_release:
-                            importance = IMPORTANCE_MEDIUM
-                        elif stars > 100:
-                            importance = IMPORTANCE_LOW
-                        else:
-                            integrations_filtered += 1
-                            _LOGGER.debug(f"Filtered {name}: importance too low (stars: {stars})")
-                            continue
-                        
-                        # HACS features are always low likelihood for HA core incorporation
-                        # Removed expensive search API call that was consuming API quota
-                        likelihood = LIKELIHOOD_LOW
-                        
-                        # Determine status label
-                        status = "New" if is_new else "Updated"
-                        
-                        # Add to features
-                        features.append({
-                            "title": f"{name} integration ({status}){release_info}{(' - ' + description[:40]) if description else ''}",
-                            "importance": importance,
-                            "likelihood": likelihood,
-                            "source": "hacs",
-                            "url": repo_data.get("html_url", "")
-                        })
-                        _LOGGER.info(f"Added HACS integration: {name} ({status}, {stars} stars)")
-                        
-                        # Limit to prevent rate limiting
-                        await asyncio.sleep(0.15)
-                        
-                except Exception as err:
-                    _LOGGER.debug(f"Error processing HACS integration: {err}")
-                    continue
-            
-            _LOGGER.info(f"HACS integrations: checked {integrations_checked}, filtered {integrations_filtered}, added {len([f for f in features if 'integration' in f.get('title', '')])}")
-            
-            # Process lovelace cards
-            cards = data.get("lovelace", [])
-            # Limit to 5 cards to conserve API quota
-            _LOGGER.info(f"Processing up to 5 HACS cards (out of {len(cards)} available)...")
-            cards_checked = 0
-            cards_filtered = 0
-            for card in cards[:5]:
-                try:
-                    cards_checked += 1
-                    repo_name = card.get("repository", "")
-                    if not repo_name:
-                        continue
-                    
-                    # Fetch repository details
-                    repo_url = f"https://api.github.com/repos/{repo_name}"
-                    async with session.get(repo_url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as repo_resp:
-                        if repo_resp.status != 200:
-                            continue
-                        
-                        repo_data = await repo_resp.json()
-                        stars = repo_data.get("stargazers_count", 0)
-                        name = repo_data.get("name", "").replace("-", " ").replace("_", " ").title()
-                        created_at = repo_data.get("created_at", "")
-                        pushed_at = repo_data.get("pushed_at", "")
-                        
-                        # Skip if too few stars
-                        if stars < 100:
-                            cards_filtered += 1
-                            _LOGGER.debug(f"Filtered card {name}: only {stars} stars (need 100+)")
-                            continue
-                        
-                        # Check if it's new or recently updated
-                        is_new = False
-                        is_updated = False
-                        
-                        if created_at:
-                            created_date = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                            is_new = created_date > three_months_ago
-                        
-                        if pushed_at:
-                            push_date = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
-                            is_updated = push_date > three_months_ago
-                        
-                        # Only include if new or recently updated
-                        if not (is_new or is_updated):
-                            cards_filtered += 1
-                            _LOGGER.debug(f"Filtered card {name}: not updated in last 3 months")
-                            continue
-                        
-                        # Cards need more stars to be considered
-                        if stars > 1000:
-                            importance = IMPORTANCE_MEDIUM
-                        elif stars > 500:
-                            importance = IMPORTANCE_LOW
-                        else:
-                            cards_filtered += 1
-                            _LOGGER.debug(f"Filtered card {name}: not enough stars for inclusion (need 500+, has {stars})")
-                            continue
-                        
-                        # Cards are less likely to be incorporated
-                        likelihood = LIKELIHOOD_LOW
-                        
-                        status = "New" if is_new else "Updated"
-                        
-                        features.append({
-                            "title": f"{name} card ({status})",
-                            "importance": importance,
-                            "likelihood": likelihood,
-                            "source": "hacs",
-                            "url": repo_data.get("html_url", "")
-                        })
-                        _LOGGER.info(f"Added HACS card: {name} ({status}, {stars} stars)")
-                        
-                        await asyncio.sleep(0.15)
-                        
-                except Exception as err:
-                    _LOGGER.debug(f"Error processing HACS card: {err}")
-                    continue
-            
-            _LOGGER.info(f"HACS cards: checked {cards_checked}, filtered {cards_filtered}, added {len([f for f in features if 'card' in f.get('title', '')])}")
-            _LOGGER.info(f"Total HACS features collected: {len(features)}")
+        # Cached (name, category) index; a 304 or an unchanged content hash skips parsing
+        index = await async_fetch_hacs_index(hass, client.session, HACS_DEFAULT_REPOS, index_cache)
+        if index is None:
+            return None
+        
+        integrations = index.repos("integrations")
+        cards = index.repos("lovelace")
+        _LOGGER.info(f"HACS data fetched successfully. Found {len(integrations)} integrations and {len(cards)} cards")
+        
+        authenticated = client.authenticated
+        if authenticated:
+            limiter = TokenBucket(rate=10.0, capacity=20)
+        else:
+            # Keep the old 10 integrations + 5 cards split within the anonymous budget, in catalogue order
+            integrations = integrations[:HACS_UNAUTHENTICATED_BUDGET * 2 // 3]
+            cards = cards[:HACS_UNAUTHENTICATED_BUDGET - len(integrations)]
+            limiter = TokenBucket(rate=2.0, capacity=5)
+            concurrency = min(concurrency, 2)
+        _LOGGER.info(
+            f"Checking {len(integrations)} HACS integrations and {len(cards)} cards "
+            f"with {concurrency} parallel workers ({'authenticated' if authenticated else 'anonymous budget'})"
+        )
+        
+        repo_names = integrations + cards
+        repo_data = {}
+        if authenticated:
+            # Batched GraphQL first; only batches that fail fall back to REST
+            repo_data, repo_names = await graphql.fetch_repositories(
+                client, repo_names, TokenBucket(rate=5.0, capacity=10)
+            )
+        if repo_names:
+            repo_data.update(await _fetch_repo_metadata(client, repo_names, limiter, concurrency))
+        
+        # Get current time for recency checks
+        three_months_ago = datetime.now(timezone.utc) - timedelta(days=90)
+        
+        integration_features = []
+        for repo_name in integrations:
+            try:
+                if repo_name in repo_data:
+                    feature = _score_hacs_integration(repo_data[repo_name], three_months_ago)
+                    if feature:
+                        integration_features.append(feature)
+            except Exception as err:
+                _LOGGER.debug(f"Error processing HACS integration {repo_name}: {err}")
+        
+        card_features = []
+        for repo_name in cards:
+            try:
+                if repo_name in repo_data:
+                    feature = _score_hacs_card(repo_data[repo_name], three_months_ago)
+                    if feature:
+                        card_features.append(feature)
+            except Exception as err:
+                _LOGGER.debug(f"Error processing HACS card {repo_name}: {err}")
+        
+        _LOGGER.info(f"HACS integrations: checked {len(integrations)}, added {len(integration_features)}")
+        _LOGGER.info(f"HACS cards: checked {len(cards)}, added {len(card_features)}")
+        
+        # Break importance*likelihood ties by popularity rather than catalogue order
+        features = sorted(integration_features + card_features, key=lambda f: (_rank_key(f), -f.get("stars", 0)))
+        _LOGGER.info(f"Total HACS features collected: {len(features)}")
     
     except Exception as err:
         _LOGGER.warning(f"Error fetching HACS features: {err}")
+        return None
     
     return features
 
-async def async_fetch_haos_features(hass: HomeAssistant):
-    """Forecast with live data from multiple sources."""
+def _usable(result: Any) -> bool:
+    """Return True for a successful fetch, whose result (even []) replaces the cached data.
+
+    Fetchers return None, or raise, when the source could not be read.
+    """
+    return result is not None and not isinstance(result, Exception)
+
+def _stage(metrics: Optional[PipelineMetrics], name: str, items_in: Optional[int] = None):
+    """Time a stage into ``metrics``; interim builds pass None and are not recorded."""
+    return metrics.stage(name, items_in) if metrics is not None else nullcontext({})
+
+def _forecast_versions(release_prediction: Optional[Dict[str, Any]]) -> tuple:
+    """Return the current, upcoming and next versions as ``YYYY.M`` strings."""
+    current_year, current_month = parse_ha_version(HA_VERSION)
+    # At least 1 and 2 months ahead of the running version
+    upcoming_year, upcoming_month = get_next_version(current_year, current_month)
+    next_year, next_month = get_next_version(upcoming_year, upcoming_month)
+    if release_prediction:
+        # Target the versions after the latest published stable release
+        upcoming_year, upcoming_month = parse_ha_version(release_prediction["upcoming"]["version"])
+        next_year, next_month = parse_ha_version(release_prediction["next"]["version"])
+    return f"{current_year}.{current_month}", f"{upcoming_year}.{upcoming_month}", f"{next_year}.{next_month}"
+
+def _build_forecast(
+    source_data: Dict[str, List[Dict[str, Any]]],
+    release_prediction: Optional[Dict[str, Any]],
+    source_weights: Dict[str, float],
+    threshold: float,
+    previous_first_seen: Dict[str, str],
+    metrics: Optional[PipelineMetrics] = None,
+    pending: Iterable[str] = (),
+) -> tuple:
+    """Dedup, rank and render the features of every source.
+
+    Returns ``(forecast, html, first_seen, tracked)``: the first-seen time of
+    each shown feature and the ``(key, feature)`` pairs the lifecycle store
+    records for targeted features.
+    """
+    current_ver, upcoming_ver, next_ver = _forecast_versions(release_prediction)
+    hacs_features = source_data["hacs_features"]
+    # Combine all features from different sources (HACS is kept separate for its own section)
+    all_features = (
+        source_data["merged_features"] + source_data["next_release_features"] + source_data["github_features"]
+        + source_data["blog_features"] + source_data["discussion_features"] + source_data["forum_features"]
+    )
+    
+    # Merge the same feature reported by several sources, including near-duplicate titles
+    with _stage(metrics, "dedup", items_in=len(all_features)) as stage:
+        unique_features = deduplicate(all_features, threshold=threshold)
+        stage["items_out"] = len(unique_features)
+    
+    with _stage(metrics, "rank", items_in=len(unique_features)) as stage:
+        # Sort features by importance * likelihood
+        unique_features = sorted(unique_features, key=lambda f: _rank_key(f, source_weights))
+        
+        # Process HACS features separately - they deserve their own section
+        top_hacs = sorted(hacs_features, key=_rank_key)[:5]  # Show top 3-5 HACS features (reduced to conserve display space)
+        
+        # Features with a known target (merged or milestoned PRs) go to their release first;
+        # the rest are split between upcoming and next releases, 60% to upcoming, 40% to next
+        targeted_upcoming = [f for f in unique_features if f.get("target_version") == upcoming_ver]
+        targeted_next = [f for f in unique_features if f.get("target_version") == next_ver]
+        untargeted = [f for f in unique_features if f.get("target_version") not in (upcoming_ver, next_ver)]
+        split_point = max(6, int(len(untargeted) * 0.6))
+        upcoming = (targeted_upcoming + untargeted[:min(10, split_point)])[:10]
+        nxt = (targeted_next + untargeted[split_point:split_point + 7])[:7]
+        stage["items_out"] = len(upcoming) + len(nxt) + len(top_hacs)
+    
+    # Add release statistics with sources breakdown (including HACS)
+    source_counts = {}
+    for f in all_features:
+        src = f.get('source', 'unknown')
+        source_counts[src] = source_counts.get(src, 0) + 1
+    if hacs_features:
+        source_counts['hacs'] = len(hacs_features)
+    
+    # Remember when each feature first appeared; kept only for features still forecast
+    generated_at = datetime.now(timezone.utc).isoformat()
+    first_seen = {}
+    tracked = []
+    
+    def _features(items, version=None):
+        result = []
+        for item in items:
+            key = normalize_title(item.get("title", "")) or item.get("title", "")
+            first_seen[key] = previous_first_seen.get(key, generated_at)
+            feature = Feature.from_dict(item, first_seen=first_seen[key], target_version=version)
+            result.append(feature)
+            if version:
+                tracked.append((key, feature))
+        return result
+    
+    with _stage(metrics, "render", items_in=len(upcoming) + len(nxt) + len(top_hacs)) as stage:
+        forecast = Forecast(
+            generated_at=generated_at,
+            current_version=current_ver,
+            upcoming_version=upcoming_ver,
+            next_version=next_ver,
+            upcoming=_features(upcoming, upcoming_ver),
+            next=_features(nxt, next_ver),
+            hacs=_features(top_hacs),
+            feature_count=len(unique_features),
+            source_counts=source_counts,
+            release_prediction=release_prediction,
+            pending_sources=sorted(pending),
+        )
+        html = render_html(forecast)
+        stage["items_out"] = len(html)
+    return forecast, html, first_seen, tracked
+
+def _publish_partial(
+    hass: HomeAssistant,
+    fetched: Dict[str, Any],
+    cached_data: Dict[str, List[Dict[str, Any]]],
+    pending: List[str],
+    release_prediction: Optional[Dict[str, Any]],
+    threshold: float,
+) -> None:
+    """Render an interim forecast from the sources fetched so far and push it to the sensor.
+
+    Sources still pending (or failed) contribute their cached data. Nothing
+    is persisted; the final forecast of the refresh replaces it.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    source_data = {
+        name: fetched[name] if _usable(fetched.get(name)) else cached_data.get(name, [])
+        for name in SOURCE_NAMES
+    }
+    weights = (domain_data.get("accuracy") or {}).get("weights") or SOURCE_WEIGHTS
+    try:
+        forecast, html, _, _ = _build_forecast(
+            source_data, release_prediction, weights, threshold, domain_data.get("first_seen") or {}, pending=pending
+        )
+    except Exception as err:
+        _LOGGER.warning(f"Could not build an interim forecast: {err}")
+        return
+    domain_data["forecast"] = forecast
+    coordinator = domain_data.get("coordinator")
+    if coordinator is not None:
+        coordinator.async_set_partial_data(html, forecast.feature_count, source_fingerprint("partial", html)[:12], pending)
+    _LOGGER.info(f"Published interim forecast with {forecast.feature_count} features, waiting for {', '.join(pending)}")
+
+class _PartialPublisher:
+    """Publish interim forecasts as sources finish, at most once per interval.
+
+    A source finishing within the interval of the last publish schedules one
+    trailing publish instead. Nothing is published once every source is done,
+    since the final forecast follows right away.
+    """
+
+    def __init__(self, hass: HomeAssistant, interval: float, sources: Iterable[str], publish: Callable[[List[str]], None]) -> None:
+        """Track ``sources`` until each one is done."""
+        self._hass = hass
+        self._interval = interval
+        self._pending = set(sources)
+        self._publish_cb = publish
+        self._changed = False
+        self._last = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def source_done(self, name: str, changed: bool) -> None:
+        """Record a finished source; ``changed`` if its data differs from the cache."""
+        self._pending.discard(name)
+        self._changed = self._changed or changed
+        if not self._pending or not self._changed or self._timer is not None:
+            return
+        wait = self._last + self._interval - time.monotonic()
+        if wait <= 0:
+            self._publish()
+        else:
+            self._timer = self._hass.loop.call_later(wait, self._publish)
+
+    def _publish(self) -> None:
+        self._timer = None
+        if not self._pending or not self._changed:
+            return
+        self._last = time.monotonic()
+        self._changed = False
+        self._publish_cb(sorted(self._pending))
+
+    def cancel(self) -> None:
+        """Drop a scheduled publish."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+def _get_scheduler(hass: HomeAssistant) -> SourceScheduler:
+    """Return the per-source scheduler, creating it from persisted state if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get("scheduler")
+    if scheduler is None:
+        ttls = {}
+        config_entry = domain_data.get("config_entry")
+        if config_entry:
+            ttls = config_entry.options.get(CONF_SOURCE_TTLS, {})
+        scheduler = SourceScheduler(ttls=ttls, state=domain_data.get("scheduler_state"))
+        domain_data["scheduler"] = scheduler
+    return scheduler
+
+async def async_fetch_haos_features(hass: HomeAssistant, force: bool = False):
+    """Forecast with live data from multiple sources.
+    
+    Only sources whose TTL has elapsed are refetched unless ``force`` is set;
+    the rest of the forecast is rebuilt from the per-source cache. Timings,
+    traffic and item counts of the refresh are kept for the diagnostic sensors.
+
+    Single flight: a call made while a refresh is running joins that refresh
+    and returns when it finishes. A forced call that finds an unforced
+    refresh running waits for it and then runs (or joins) a forced one.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    while True:
+        task = domain_data.get("refresh_task")
+        if task is None or task.done():
+            task = hass.async_create_task(_async_refresh(hass, force), f"{DOMAIN}_refresh")
+            domain_data["refresh_task"] = task
+            domain_data["refresh_forced"] = force
+            break
+        if not force or domain_data.get("refresh_forced"):
+            _LOGGER.info("Forecast refresh already in progress, joining it")
+            break
+        _LOGGER.info("Unforced forecast refresh in progress, forcing another once it finishes")
+        await asyncio.shield(task)
+    # A cancelled caller must not cancel the refresh the others are waiting for
+    await asyncio.shield(task)
+
+async def _async_refresh(hass: HomeAssistant, force: bool):
+    """Run one refresh with metrics."""
+    metrics = PipelineMetrics()
+    with metrics.activate():
+        try:
+            await _async_fetch_haos_features(hass, force, metrics)
+        finally:
+            domain_data = hass.data.setdefault(DOMAIN, {})
+            metrics.finish(async_get_governor(hass), domain_data.get("http_cache_stats", {}), _SOURCE_REQUEST_LABELS)
+            metrics.carry_over(domain_data.get("metrics") or {})
+            domain_data["metrics"] = metrics.as_dict()
+            _LOGGER.debug(
+                f"Refresh took {metrics.total_ms:.0f} ms: "
+                + ", ".join(f"{name} {stage['wall_ms']:.0f} ms" for name, stage in metrics.stages.items())
+            )
+
+async def _async_mark_landed(
+    hass: HomeAssistant,
+    lifecycle_db: LifecycleDB,
+    item_store: CoreItemStore,
+    merge_index: MergeIndex,
+    release_prediction: Optional[Dict[str, Any]],
+) -> None:
+    """Mark recorded features landed by the PRs merged since the last sync, then consume them."""
+    merged_prs = item_store.merged + merge_index.merged
+    if not merged_prs:
+        return
+    # Merges before the upcoming beta cut-off land in that version, later ones in the next
+    landed_version = None
+    if release_prediction:
+        cut = (release_prediction["upcoming"].get("beta") or {}).get("cut")
+        landed_version = release_prediction["next" if cut else "upcoming"]["version"]
+    landed = await hass.async_add_executor_job(lifecycle_db.mark_landed, merged_prs, landed_version)
+    _LOGGER.info(f"{len(merged_prs)} core PRs merged since last sync, {landed} forecast features landed")
+    item_store.merged = []
+    merge_index.merged = []
+
+async def _async_fetch_haos_features(hass: HomeAssistant, force: bool, metrics: PipelineMetrics):
+    """Run one refresh, recording stages into ``metrics``."""
     _LOGGER.info("Starting forecast data fetch from multiple sources...")
+    # Interim forecasts replace it while sources are fetched; restored if the refresh fails
+    previous_forecast = hass.data.setdefault(DOMAIN, {}).get("forecast")
+    started = time.monotonic()
     try:
         # Get current HA version and parse it (ignoring patch version)
         current_year, current_month = parse_ha_version(HA_VERSION)
         _LOGGER.info(f"Current HA version: {HA_VERSION} -> {current_year}.{current_month}")
         
-        # Calculate upcoming and next versions (at least 1 and 2 months ahead)
-        upcoming_year, upcoming_month = get_next_version(current_year, current_month)
-        next_year, next_month = get_next_version(upcoming_year, upcoming_month)
-        
         # Initialize domain data if not present
         hass.data.setdefault(DOMAIN, {})
         
@@ -678,57 +1173,188 @@ async def async_fetch_haos_features(hass: HomeAssistant):
         else:
             _LOGGER.warning("No GitHub token configured - API rate limits will be restrictive (60 requests/hour). Add a token in integration options to increase limit to 5000 requests/hour.")
         
-        # Fetch data from multiple sources in parallel
-        async with aiohttp.ClientSession() as session:
-            results = await asyncio.gather(
-                fetch_github_data(session, HA_RELEASES, headers=headers),
-                fetch_github_data(session, HA_OS_RELEASES, headers=headers),
-                fetch_real_features(session, headers=headers),
-                fetch_blog_features(session),
-                fetch_discussion_features(session, headers=headers),
-                fetch_forum_features(session),
-                fetch_hacs_features(session, headers=headers),
-                return_exceptions=True  # Don't fail if one source fails
+        hacs_concurrency = DEFAULT_HACS_CONCURRENCY
+        if config_entry:
+            hacs_concurrency = int(config_entry.options.get(CONF_HACS_CONCURRENCY, DEFAULT_HACS_CONCURRENCY))
+        forum_pages = DEFAULT_FORUM_PAGES
+        if config_entry:
+            forum_pages = max(1, int(config_entry.options.get(CONF_FORUM_PAGES, DEFAULT_FORUM_PAGES)))
+        dedup_threshold_value = dedup_threshold(config_entry.options.get(CONF_DEDUP_THRESHOLD) if config_entry else None)
+        partial_interval = DEFAULT_PARTIAL_INTERVAL
+        if config_entry:
+            partial_interval = max(0.0, float(config_entry.options.get(CONF_PARTIAL_INTERVAL, DEFAULT_PARTIAL_INTERVAL)))
+        refresh_deadline = DEFAULT_REFRESH_DEADLINE
+        if config_entry:
+            refresh_deadline = max(1.0, float(config_entry.options.get(CONF_REFRESH_DEADLINE, DEFAULT_REFRESH_DEADLINE)))
+        
+        # Conditional-request cache so unchanged GitHub payloads cost no quota
+        http_cache = await async_get_http_cache(hass)
+        http_cache.reset_stats()
+        
+        # Only refetch sources whose TTL or backoff window has elapsed
+        scheduler = _get_scheduler(hass)
+        now_ts = datetime.now(timezone.utc).timestamp()
+        due = scheduler.due_sources(SOURCE_NAMES, now_ts, force=force)
+        _LOGGER.info(f"Sources due for refresh: {', '.join(due) if due else 'none'}")
+        breakers = scheduler.breaker_states(now_ts)
+        open_circuits = [name for name, state in breakers.items() if state == BREAKER_OPEN]
+        if open_circuits:
+            _LOGGER.info(f"Circuit open, using cached data for: {', '.join(open_circuits)}")
+        probes = [name for name in due if breakers.get(name) == BREAKER_HALF_OPEN]
+        if probes:
+            _LOGGER.info(f"Probing sources with an open circuit: {', '.join(probes)}")
+        
+        governor = async_get_governor(hass)
+        item_store = await async_get_item_store(hass)
+        hacs_index_cache = await async_get_hacs_index_cache(hass)
+        blog_store = await async_get_blog_store(hass)
+        release_history = await async_get_release_history(hass)
+        merge_index = await async_get_merge_index(hass)
+        forum_index = await async_get_forum_index(hass)
+        fetched = {}
+        deferred_labels = set()
+        if due:
+            # Reuse the entry-owned pooled session so connections survive between runs
+            session = async_get_forecast_session(hass)
+            client = GitHubClient(session, governor, headers=headers, cache=http_cache)
+            fetchers = {
+                "core_releases": lambda: fetch_github_data(client, HA_RELEASES, params=RELEASES_PARAMS, source="core_releases", priority=PRIORITY_RELEASES, transform=compact_releases),
+                "os_releases": lambda: fetch_github_data(client, HA_OS_RELEASES, params=RELEASES_PARAMS, source="os_releases", priority=PRIORITY_RELEASES, transform=compact_releases),
+                "github_features": lambda: fetch_real_features(client, item_store),
+                "next_release_features": lambda: fetch_next_release_features(client, release_history.predict()),
+                "merged_features": lambda: fetch_merged_features(client, merge_index, release_history),
+                "blog_features": lambda: fetch_blog_features(hass, session, blog_store),
+                "discussion_features": lambda: fetch_discussion_features(client),
+                "forum_features": lambda: fetch_forum_features(session, forum_index, forum_pages),
+                "hacs_features": lambda: fetch_hacs_features(hass, client, hacs_index_cache, concurrency=hacs_concurrency),
+            }
+            prediction_before = release_history.predict()
+            publisher = _PartialPublisher(
+                hass, partial_interval, due,
+                lambda pending: _publish_partial(hass, fetched, cached_data, pending, prediction_before, dedup_threshold_value),
             )
             
-            # Use cached data as fallback if fetch fails or returns empty
-            core_releases = results[0] if not isinstance(results[0], Exception) and results[0] else cached_data.get("core_releases", [])
-            os_releases = results[1] if not isinstance(results[1], Exception) and results[1] else cached_data.get("os_releases", [])
-            github_features = results[2] if not isinstance(results[2], Exception) and results[2] else cached_data.get("github_features", [])
-            blog_features = results[3] if not isinstance(results[3], Exception) and results[3] else cached_data.get("blog_features", [])
-            discussion_features = results[4] if not isinstance(results[4], Exception) and results[4] else cached_data.get("discussion_features", [])
-            forum_features = results[5] if not isinstance(results[5], Exception) and results[5] else cached_data.get("forum_features", [])
-            hacs_features = results[6] if not isinstance(results[6], Exception) and results[6] else cached_data.get("hacs_features", [])
-        
-        # Log which sources failed and are using cache
-        if isinstance(results[2], Exception) or not results[2]:
-            _LOGGER.info(f"GitHub features fetch returned no data, using cached data ({len(github_features)} features). This may be due to rate limiting - consider adding a GitHub token.")
-        if isinstance(results[3], Exception) or not results[3]:
-            _LOGGER.debug(f"Blog features fetch returned no data, using cached data ({len(blog_features)} features). The blog RSS feed may be temporarily unavailable.")
-        if isinstance(results[4], Exception) or not results[4]:
-            _LOGGER.debug(f"Discussion features fetch returned no data, using cached data ({len(discussion_features)} features)")
-        if isinstance(results[5], Exception) or not results[5]:
-            _LOGGER.debug(f"Forum features fetch returned no data, using cached data ({len(forum_features)} features)")
-        if isinstance(results[6], Exception) or not results[6]:
-            _LOGGER.info(f"HACS features fetch returned no data, using cached data ({len(hacs_features)} features). This may be due to rate limiting - consider adding a GitHub token.")
+            # One hung host must not hold up the refresh: each source gets its own
+            # timeout, cut short by what is left of the refresh deadline
+            deadline = started + refresh_deadline
+            
+            async def _fetch(name):
+                timeout = max(0.0, min(DEFAULT_SOURCE_TIMEOUTS[name].total_seconds(), deadline - time.monotonic()))
+                try:
+                    return name, await metrics.track_source(name, asyncio.wait_for(fetchers[name](), timeout))
+                except asyncio.TimeoutError as err:
+                    _LOGGER.warning(f"{name} did not finish within {timeout:.0f}s, abandoning it")
+                    return name, err
+                except Exception as err:  # Don't fail if one source fails
+                    return name, err
+            
+            with metrics.stage("fetch", items_in=len(due)) as stage:
+                tasks = [asyncio.create_task(_fetch(name)) for name in due]
+                try:
+                    # Show each source's results as it finishes instead of waiting for the slowest
+                    for completed in asyncio.as_completed(tasks):
+                        name, result = await completed
+                        fetched[name] = result
+                        publisher.source_done(
+                            name,
+                            _usable(result) and source_fingerprint(name, result) != source_fingerprint(name, cached_data.get(name, [])),
+                        )
+                finally:
+                    publisher.cancel()
+                    for task in tasks:
+                        task.cancel()
+                stage["items_out"] = sum(len(result) for result in fetched.values() if isinstance(result, list))
+            deferred_labels = client.deferred
+            _LOGGER.info(
+                f"GitHub requests this run: {client.request_count}, "
+                f"remaining quota: {governor.remaining('core')} REST / {governor.remaining('graphql')} GraphQL / {governor.remaining('search')} search"
+            )
+        
+        # Persist validators and report conditional-request effectiveness
+        http_cache.async_schedule_save()
+        hass.data[DOMAIN]["http_cache_stats"] = {src: dict(counts) for src, counts in http_cache.stats.items()}
+        for src, counts in http_cache.stats.items():
+            _LOGGER.info(f"HTTP cache {src}: {counts['hits']} hits (304), {counts['misses']} misses")
+        
+        # Use fresh results where available and cached data for everything else
+        source_data = {}
+        for name in SOURCE_NAMES:
+            cached = cached_data.get(name, [])
+            if name not in fetched:
+                source_data[name] = cached
+                continue
+            result = fetched[name]
+            if _usable(result):
+                source_data[name] = result
+                scheduler.record_success(name, now_ts)
+                continue
+            source_data[name] = cached
+            if deferred_labels.intersection(_SOURCE_REQUEST_LABELS.get(name, ())):
+                # Held back by the rate-limit governor, not broken: retry after the reset
+                resume_at = max(
+                    (t for t in (governor.resume_at("core"), governor.resume_at("graphql"), governor.resume_at("search")) if t),
+                    default=now_ts,
+                )
+                scheduler.defer(name, resume_at)
+                _LOGGER.info(
+                    f"{name} deferred until GitHub rate limit resets "
+                    f"({datetime.fromtimestamp(resume_at, timezone.utc).strftime('%H:%M')} UTC), using cached data"
+                )
+                continue
+            delay = scheduler.record_failure(name, now_ts)
+            hint = _SOURCE_FAILURE_HINTS.get(name, "")
+            circuit = " (circuit open)" if scheduler.breaker_state(name, now_ts) == BREAKER_OPEN else ""
+            _LOGGER.info(
+                f"{name} fetch failed, using cached data ({len(cached)} items), "
+                f"retrying in {delay / 60:.0f} minutes{circuit}.{(' ' + hint) if hint else ''}"
+            )
         
         # Cache successful fetches for future fallback
-        hass.data[DOMAIN]["cached_features"] = {
-            "core_releases": core_releases if core_releases else cached_data.get("core_releases", []),
-            "os_releases": os_releases if os_releases else cached_data.get("os_releases", []),
-            "github_features": github_features if github_features else cached_data.get("github_features", []),
-            "blog_features": blog_features if blog_features else cached_data.get("blog_features", []),
-            "discussion_features": discussion_features if discussion_features else cached_data.get("discussion_features", []),
-            "forum_features": forum_features if forum_features else cached_data.get("forum_features", []),
-            "hacs_features": hacs_features if hacs_features else cached_data.get("hacs_features", []),
-        }
+        hass.data[DOMAIN]["cached_features"] = source_data
+        
+        # Keep every release ever seen and forecast the next versions from their cadence
+        release_history.update("core", source_data["core_releases"])
+        release_history.update("os", source_data["os_releases"])
+        release_prediction = release_history.predict()
+        hass.data[DOMAIN]["release_prediction"] = release_prediction
+        
+        # Recalibrate the source weights from how earlier forecasts turned out
+        with metrics.stage("score") as stage:
+            lifecycle_db = await async_get_lifecycle_db(hass)
+            accuracy = await hass.async_add_executor_job(
+                lifecycle_db.report, release_history.released_versions(), SOURCE_WEIGHTS
+            )
+            source_weights = accuracy["weights"]
+            stage["items_out"] = accuracy["tracked"]
+        hass.data[DOMAIN]["accuracy"] = accuracy
+        
+        # Skip recompute and re-render when no source output changed since the last render
+        fingerprints = {name: source_fingerprint(name, source_data[name]) for name in SOURCE_NAMES}
+        previous_fingerprints = hass.data[DOMAIN].get("source_fingerprints") or {}
+        hass.data[DOMAIN]["source_fingerprints"] = fingerprints
+        forecast_fingerprint = source_fingerprint(
+            "forecast", {"sources": fingerprints, "version": HA_VERSION, "dedup_threshold": dedup_threshold_value, "weights": source_weights}
+        )
+        if forecast_fingerprint == hass.data[DOMAIN].get("forecast_fingerprint") and hass.data[DOMAIN].get("last_successful_html"):
+            _LOGGER.info("No source data changed since the last forecast, keeping the rendered forecast")
+            hass.data[DOMAIN]["rendered_html"] = hass.data[DOMAIN]["last_successful_html"]
+            hass.data[DOMAIN]["feature_count"] = hass.data[DOMAIN].get("last_successful_count", 0)
+            await _async_mark_landed(hass, lifecycle_db, item_store, merge_index, release_prediction)
+            async_schedule_snapshot_save(hass)
+            return
+        if previous_fingerprints:
+            changed = [name for name in SOURCE_NAMES if fingerprints[name] != previous_fingerprints.get(name)]
+            _LOGGER.debug(f"Sources with changed data: {', '.join(changed) if changed else 'none'}")
         
-        # Combine all features from different sources (HACS is kept separate for its own section)
-        all_features = github_features + blog_features + discussion_features + forum_features
+        core_releases = source_data["core_releases"]
+        os_releases = source_data["os_releases"]
+        hacs_features = source_data["hacs_features"]
         
-        _LOGGER.info(f"Fetched features: {len(github_features)} from GitHub, "
-                    f"{len(blog_features)} from blog, {len(discussion_features)} from discussions, "
-                    f"{len(forum_features)} from forum, {len(hacs_features)} from HACS")
+        _LOGGER.info(f"Fetched features: {len(source_data['merged_features'])} merged into dev, "
+                    f"{len(source_data['next_release_features'])} merged/milestoned for next releases, "
+                    f"{len(source_data['github_features'])} from GitHub, {len(source_data['blog_features'])} from blog, "
+                    f"{len(source_data['discussion_features'])} from discussions, "
+                    f"{len(source_data['forum_features'])} from forum, {len(hacs_features)} from HACS")
         
         # Store the raw data
         release_data = {
@@ -745,38 +1371,12 @@ async def async_fetch_haos_features(hass: HomeAssistant):
         
         hass.data.setdefault(DOMAIN, {})["release_data"] = release_data
         
-        # Deduplicate features by normalized title, keeping the highest scored one
-        seen_normalized = {}
-        unique_features = []
-        
-        for f in all_features:
-            normalized = normalize_title(f["title"])
-            
-            if not normalized:  # Skip if normalization resulted in empty string
-                continue
-            
-            if normalized in seen_normalized:
-                # Keep the feature with higher importance * likelihood
-                existing = seen_normalized[normalized]
-                existing_score = existing['importance'] * existing['likelihood']
-                new_score = f['importance'] * f['likelihood']
-                
-                if new_score > existing_score:
-                    # Replace with better feature
-                    unique_features.remove(existing)
-                    seen_normalized[normalized] = f
-                    unique_features.append(f)
-                    _LOGGER.debug(f"Replaced duplicate: '{existing['title']}' with '{f['title']}'")
-            else:
-                seen_normalized[normalized] = f
-                unique_features.append(f)
-        
-        # Sort features by importance * likelihood
-        unique_features = sorted(unique_features, key=_rank_key)
-        
-        # Process HACS features separately - they deserve their own section
-        hacs_features_sorted = sorted(hacs_features, key=_rank_key)
-        top_hacs = hacs_features_sorted[:5]  # Show top 3-5 HACS features (reduced to conserve display space)
+        forecast, html, first_seen, tracked = _build_forecast(
+            source_data, release_prediction, source_weights, dedup_threshold_value,
+            hass.data[DOMAIN].get("first_seen") or {}, metrics=metrics,
+        )
+        unique_count = forecast.feature_count
+        top_hacs = forecast.hacs
         
         # Log HACS features for debugging
         if not hacs_features:
@@ -785,74 +1385,39 @@ async def async_fetch_haos_features(hass: HomeAssistant):
             _LOGGER.info(f"Found {len(hacs_features)} HACS features, showing top {len(top_hacs)}")
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 for idx, feat in enumerate(top_hacs, 1):
-                    _LOGGER.debug(f"  HACS {idx}: {feat.get('title', 'Unknown')}")
-        
-        # Split features between upcoming and next releases
-        # Allocate 60% to upcoming, 40% to next
-        split_point = max(6, int(len(unique_features) * 0.6))
-        upcoming = unique_features[:min(10, split_point)]
-        nxt = unique_features[split_point:split_point + 7]
+                    _LOGGER.debug(f"  HACS {idx}: {feat.title}")
         
         # If we don't have enough real features, show warning
-        if len(upcoming) < 3:
+        if len(forecast.upcoming) < 3:
             _LOGGER.warning("Not enough real features found, showing limited data. This may result in an empty or minimal card display.")
         
         # Log total feature count for diagnostics
-        _LOGGER.info(f"Processing {len(unique_features)} unique features and {len(top_hacs)} HACS features for display")
-        
-        cet = timezone(timedelta(hours=1))
-        ts = datetime.now(cet).strftime("%b %d %H:%M")
+        _LOGGER.info(f"Processing {unique_count} unique features and {len(top_hacs)} HACS features for display")
         
-        upcoming_ver = f"{upcoming_year}.{upcoming_month}"
-        next_ver = f"{next_year}.{next_month}"
-
-        def _render(title, items, version=None):
-            version_text = f" ({version})" if version else ""
-            if not items:
-                return f"<h4>{title}{version_text}</h4><p><i>No confirmed features yet. Check back later!</i></p>"
-            
-            lis = ""
-            for i in items:
-                try:
-                    imp_label = _importance_label(i.get('importance', 1))
-                    lik_label = _likelihood_label(i.get('likelihood', 1))
-                    lis += f"<li>{i['title']} <small>— {imp_label} · {lik_label} · {_src_badge(i.get('source'), i.get('url'))}</small></li>"
-                except Exception as err:
-                    _LOGGER.warning(f"Render skip: {err}")
-            return f"<h4>{title}{version_text}</h4><ul>{lis}</ul>"
-
-        # Add release statistics with sources breakdown (including HACS)
-        source_counts = {}
-        for f in all_features:
-            src = f.get('source', 'unknown')
-            source_counts[src] = source_counts.get(src, 0) + 1
-        if hacs_features:
-            source_counts['hacs'] = len(hacs_features)
-        
-        source_text = ", ".join([f"{count} from {src}" for src, count in source_counts.items()])
-        stats_html = f"<p><small>📊 Analyzing {len(unique_features)} unique features ({source_text})</small></p>"
-        
-        html = (f"<p><b>Last updated:</b> {ts} CET | <b>Current version:</b> {current_year}.{current_month}</p>" + 
-                stats_html +
-                _render("Upcoming", upcoming, upcoming_ver) + 
-                _render("Next", nxt, next_ver) +
-                _render("New & Updated HACS Features", top_hacs))
+        hass.data[DOMAIN]["first_seen"] = first_seen
+        hass.data[DOMAIN]["forecast"] = forecast
+        await hass.async_add_executor_job(lifecycle_db.record, tracked, forecast.generated_at)
+        # After recording, so features first forecast from a PR merged this run are marked landed too
+        await _async_mark_landed(hass, lifecycle_db, item_store, merge_index, release_prediction)
 
         hass.data.setdefault(DOMAIN, {})["rendered_html"] = html
-        hass.data[DOMAIN]["feature_count"] = len(unique_features)
+        hass.data[DOMAIN]["feature_count"] = unique_count
         # Also cache the last successful HTML render
         hass.data[DOMAIN]["last_successful_html"] = html
-        hass.data[DOMAIN]["last_successful_count"] = len(unique_features)
+        hass.data[DOMAIN]["last_successful_count"] = unique_count
+        hass.data[DOMAIN]["forecast_fingerprint"] = forecast_fingerprint
+        # Persist the per-source cache and output so restarts can show it instantly
+        async_schedule_snapshot_save(hass)
         
         # Log HTML length for diagnostics
-        _LOGGER.info(f"Generated forecast HTML ({len(html)} characters) with {len(unique_features)} features and {len(top_hacs)} HACS features")
+        _LOGGER.info(f"Generated forecast HTML ({len(html)} characters) with {unique_count} features and {len(top_hacs)} HACS features")
         
         # Warn if HTML is suspiciously short (likely empty/error)
         if len(html) < 200:
             _LOGGER.warning(f"Generated HTML is very short ({len(html)} chars) - card may appear empty. Check if data sources are accessible.")
         
         # Note: We no longer set state directly here, the coordinator/sensor handles it
-        _LOGGER.info(f"Forecast updated v1.4.3 with {len(unique_features)} real features from multiple sources and {len(top_hacs)} HACS features")
+        _LOGGER.info(f"Forecast updated v1.4.3 with {unique_count} real features from multiple sources and {len(top_hacs)} HACS features")
 
     except Exception as e:
         _LOGGER.exception("async_fetch_haos_features failed: %s", e)
@@ -862,6 +1427,7 @@ async def async_fetch_haos_features(hass: HomeAssistant):
         last_count = hass.data[DOMAIN].get("last_successful_count", 0)
         if last_html:
             _LOGGER.warning("Using last successful cached HTML due to fetch failure")
+            hass.data[DOMAIN]["forecast"] = previous_forecast
             hass.data[DOMAIN]["rendered_html"] = last_html
             hass.data[DOMAIN]["feature_count"] = last_count
         else:
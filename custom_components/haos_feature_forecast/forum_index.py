@@ -0,0 +1,197 @@
+"""Local index of community forum feature requests.
+
+The feature-requests category is walked through Discourse's paginated
+``top.json`` and ``latest.json`` lists. Topic metrics are kept per topic
+with a short history of like counts, so ranking covers the whole corpus and
+can favour requests that are gaining support rather than whatever was
+bumped last. After the first walk only ``latest`` pages are read, and only
+until a topic bumped before the stored cursor is reached.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+FORUM_INDEX_KEY = f"{DOMAIN}.forum_topics"
+FORUM_INDEX_VERSION = 1
+FORUM_INDEX_SAVE_DELAY = 30
+
+FORUM_CATEGORY = "c/feature-requests/13"
+# Re-walk the top list this often so likes on topics nobody bumped are refreshed
+TOP_REFRESH_INTERVAL = 7 * 86400
+# Keep the most recently bumped topics up to this many
+FORUM_MAX_TOPICS = 3000
+# Like-count samples per topic: at most one a day, for this long
+HISTORY_SAMPLE_INTERVAL = 86400
+HISTORY_RETENTION = 8 * 7 * 86400
+
+WEEK = 7 * 86400
+
+
+def compact_topic(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a topic-list entry to the metrics the ranking reads."""
+    return {
+        "title": raw.get("title", ""),
+        "likes": raw.get("like_count", 0) or 0,
+        "views": raw.get("views", 0) or 0,
+        "posts": raw.get("posts_count", 0) or 0,
+        # Only present when the voting plugin is enabled on the category
+        "votes": raw.get("vote_count", 0) or 0,
+        "bumped_at": raw.get("bumped_at"),
+        "closed": bool(raw.get("closed") or raw.get("archived")),
+    }
+
+
+class ForumIndex:
+    """Feature-request topics keyed by id, with a ``bumped_at`` cursor."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty index."""
+        self._store = Store(hass, FORUM_INDEX_VERSION, FORUM_INDEX_KEY)
+        # topic id -> compact_topic() plus "history": [[timestamp, likes], ...]
+        self.topics: Dict[str, Dict[str, Any]] = {}
+        # Newest bumped_at seen; latest pages are read until they reach it
+        self.last_bumped: Optional[str] = None
+        self.top_synced: float = 0.0
+
+    async def async_load(self) -> None:
+        """Load the index from disk."""
+        data = await self._store.async_load()
+        if isinstance(data, dict):
+            self.topics = data.get("topics", {})
+            self.last_bumped = data.get("last_bumped")
+            self.top_synced = data.get("top_synced", 0.0)
+        _LOGGER.debug(f"Loaded {len(self.topics)} forum topics (last bumped {self.last_bumped})")
+
+    def apply(self, raw_topics: List[Dict[str, Any]], now: float) -> int:
+        """Merge fetched topics and sample their like counts; returns how many changed."""
+        changed = 0
+        for raw in raw_topics:
+            if not isinstance(raw, dict) or raw.get("id") is None or raw.get("pinned"):
+                continue
+            topic = compact_topic(raw)
+            key = str(raw["id"])
+            previous = self.topics.get(key)
+            history = list(previous.get("history", [])) if previous else []
+            if not history or now - history[-1][0] >= HISTORY_SAMPLE_INTERVAL:
+                history.append([now, topic["likes"]])
+            else:
+                history[-1] = [history[-1][0], topic["likes"]]
+            topic["history"] = [sample for sample in history if now - sample[0] <= HISTORY_RETENTION]
+            if previous != topic:
+                self.topics[key] = topic
+                changed += 1
+            bumped = topic["bumped_at"]
+            if bumped and (self.last_bumped is None or bumped > self.last_bumped):
+                self.last_bumped = bumped
+        if len(self.topics) > FORUM_MAX_TOPICS:
+            newest = sorted(self.topics, key=lambda k: self.topics[k].get("bumped_at") or "", reverse=True)
+            self.topics = {k: self.topics[k] for k in newest[:FORUM_MAX_TOPICS]}
+        return changed
+
+    def likes_per_week(self, topic: Dict[str, Any], now: float) -> float:
+        """Return likes gained per week over the sampled history."""
+        history = topic.get("history") or []
+        if not history:
+            return 0.0
+        since, likes_then = history[0]
+        # Less than a day of history says nothing about a trend
+        if now - since < HISTORY_SAMPLE_INTERVAL:
+            return 0.0
+        return max(topic["likes"] - likes_then, 0) / ((now - since) / WEEK)
+
+    def open_topics(self) -> List[Dict[str, Any]]:
+        """Return open topics with their id."""
+        return [{"id": key, **topic} for key, topic in self.topics.items() if not topic.get("closed")]
+
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write of the index."""
+        self._store.async_delay_save(
+            lambda: {"topics": self.topics, "last_bumped": self.last_bumped, "top_synced": self.top_synced},
+            FORUM_INDEX_SAVE_DELAY,
+        )
+
+
+async def async_get_forum_index(hass: HomeAssistant) -> ForumIndex:
+    """Return the shared forum index, loading it from disk on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get("forum_index")
+    if index is None:
+        index = ForumIndex(hass)
+        await index.async_load()
+        domain_data["forum_index"] = index
+    return index
+
+
+async def _read_pages(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: Dict[str, Any],
+    max_pages: int,
+    stop_before: Optional[str] = None,
+    timeout: float = 15,
+) -> Optional[List[Dict[str, Any]]]:
+    """Read up to ``max_pages`` topic-list pages; None if the first page failed.
+
+    An HTTP or network error ends the walk with the pages read so far. With
+    ``stop_before`` reading ends at the first unpinned topic bumped at or
+    before it, since ``latest`` is ordered by bump date.
+    """
+    topics: List[Dict[str, Any]] = []
+    for page in range(max_pages):
+        try:
+            async with session.get(url, params={**params, "page": page}, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                if resp.status != 200:
+                    _LOGGER.debug(f"Could not fetch forum page {url} #{page}: {resp.status}")
+                    return topics if page else None
+                data = await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            _LOGGER.info(f"Could not fetch forum page {url} #{page}: {err!r}")
+            return topics if page else None
+        page_topics = (data.get("topic_list") or {}).get("topics") or []
+        for topic in page_topics:
+            if stop_before and not topic.get("pinned") and (topic.get("bumped_at") or "") <= stop_before:
+                return topics
+            topics.append(topic)
+        if not page_topics or not (data.get("topic_list") or {}).get("more_topics_url"):
+            break
+    return topics
+
+
+async def async_sync_forum(session: aiohttp.ClientSession, base_url: str, index: ForumIndex, max_pages: int) -> bool:
+    """Bring the index up to date; returns False if nothing could be read.
+
+    The first run and a weekly refresh walk ``top`` (all time) as well as
+    ``latest``; other runs only read ``latest`` back to the cursor.
+    """
+    now = time.time()
+    walk_top = not index.topics or now - index.top_synced >= TOP_REFRESH_INTERVAL
+    latest = await _read_pages(
+        session, f"{base_url}/{FORUM_CATEGORY}/l/latest.json", {}, max_pages,
+        stop_before=None if walk_top else index.last_bumped,
+    )
+    top = None
+    if walk_top:
+        top = await _read_pages(session, f"{base_url}/{FORUM_CATEGORY}/l/top.json", {"period": "all"}, max_pages)
+    if latest is None and top is None:
+        return False
+    changed = index.apply((latest or []) + (top or []), now)
+    if top is not None:
+        index.top_synced = now
+    index.async_schedule_save()
+    _LOGGER.info(
+        f"Synced forum feature requests: {len(latest or [])} from latest, "
+        f"{len(top) if top is not None else 'skipped'} from top, {changed} changed, {len(index.topics)} indexed"
+    )
+    return True
@@ -0,0 +1,221 @@
+"""Single entry point for all GitHub API traffic during a refresh."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .http_cache import HttpValidatorCache
+from .ratelimit import PRIORITY_ITEMS, RateLimitGovernor, TokenBucket
+
+_LOGGER = logging.getLogger(__name__)
+
+GITHUB_GRAPHQL = "https://api.github.com/graphql"
+
+
+def async_get_governor(hass: HomeAssistant) -> RateLimitGovernor:
+    """Return the long-lived rate-limit governor."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    governor = domain_data.get("rate_governor")
+    if governor is None:
+        governor = RateLimitGovernor()
+        domain_data["rate_governor"] = governor
+    return governor
+
+
+class GitHubClient:
+    """Wrap a session with auth headers, validator cache and quota governance.
+
+    Every GitHub request goes through here so X-RateLimit headers from all
+    sources feed one governor, and low-priority work is deferred rather than
+    spending the requests releases and issues still need.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        governor: RateLimitGovernor,
+        headers: Optional[Dict[str, str]] = None,
+        cache: Optional[HttpValidatorCache] = None,
+    ) -> None:
+        """Initialize the client for one refresh."""
+        self.session = session
+        self.governor = governor
+        self.headers = dict(headers or {})
+        self.cache = cache
+        # Source labels that had at least one request deferred this run
+        self.deferred: Set[str] = set()
+        self.request_count = 0
+
+    @property
+    def authenticated(self) -> bool:
+        """Return True when a GitHub token is configured."""
+        return bool(self.headers.get("Authorization"))
+
+    def can_spend(self, priority: int, resource: str = "core") -> bool:
+        """Return True if the governor would admit a request of this priority."""
+        return self.governor.allows(resource, priority)
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        source: str = "github",
+        priority: int = PRIORITY_ITEMS,
+        transform: Optional[Callable[[Any], Any]] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        resource: str = "core",
+    ) -> Any:
+        """GET a REST endpoint; return the parsed body or None on any failure.
+
+        Requests are conditional when a validator cache is set, and a 304
+        Not Modified replays the stored body without using quota.
+        ``transform`` compacts the body before it is cached and returned.
+        """
+        body, _ = await self._get(url, params, source, priority, transform, rate_limiter, use_cache=True, resource=resource)
+        return body
+
+    async def get_paginated(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        source: str = "github",
+        priority: int = PRIORITY_ITEMS,
+        max_pages: Optional[int] = None,
+        items_key: Optional[str] = None,
+        resource: str = "core",
+    ) -> Tuple[List[Any], bool]:
+        """GET every page of a list endpoint by following ``Link: rel="next"``.
+
+        Returns ``(items, complete)``; ``complete`` is False when a page
+        failed, was deferred or ``max_pages`` cut the walk short.
+        ``items_key`` names the list inside object bodies (search "items").
+        """
+        items: List[Any] = []
+        next_url: Optional[str] = url
+        pages = 0
+        while next_url:
+            if max_pages is not None and pages >= max_pages:
+                return items, False
+            # Page URLs already carry the query string
+            body, next_url = await self._get(
+                next_url, params if pages == 0 else None, source, priority, None, None,
+                use_cache=False, resource=resource,
+            )
+            if items_key and isinstance(body, dict):
+                body = body.get(items_key)
+            if not isinstance(body, list):
+                return items, False
+            items.extend(body)
+            pages += 1
+        _LOGGER.debug(f"Fetched {len(items)} items from {url} in {pages} pages")
+        return items, True
+
+    async def _get(
+        self,
+        url: str,
+        params: Optional[Dict],
+        source: str,
+        priority: int,
+        transform: Optional[Callable[[Any], Any]],
+        rate_limiter: Optional[TokenBucket],
+        use_cache: bool,
+        resource: str = "core",
+    ) -> Tuple[Any, Optional[str]]:
+        """Perform one governed GET; return ``(body or None, next page URL)``.
+
+        ``resource`` is the GitHub rate-limit bucket ("core" or "search").
+        """
+        if not self.governor.allows(resource, priority):
+            self.deferred.add(source)
+            _LOGGER.debug(f"Deferring {url}: GitHub quota reserved for higher-priority requests")
+            return None, None
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        cache = self.cache if use_cache else None
+        cache_key = None
+        request_headers = dict(self.headers)
+        if cache is not None:
+            cache_key = cache.make_key(url, params)
+            request_headers.update(cache.conditional_headers(cache_key))
+        async with self.governor.slot(priority):
+            # Quota may have run out while waiting for a slot
+            if not self.governor.allows(resource, priority):
+                self.deferred.add(source)
+                return None, None
+            self.governor.reserve(resource)
+            self.request_count += 1
+            try:
+                async with self.session.get(url, params=params, headers=request_headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+                    self.governor.update(resource, resp.headers, resp.status)
+                    if resp.status == 304 and cache is not None:
+                        body = cache.get_body(cache_key)
+                        if body is not None:
+                            cache.record(source, hit=True)
+                            _LOGGER.debug(f"GitHub API returned 304 for {url}, reusing cached body")
+                        return body, None
+                    if resp.status == 200:
+                        body = await resp.json()
+                        if transform is not None:
+                            body = transform(body)
+                        if cache is not None:
+                            cache.record(source, hit=False)
+                            cache.update(cache_key, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), body)
+                        next_link = resp.links.get("next")
+                        return body, str(next_link["url"]) if next_link else None
+                    elif resp.status in (403, 429):
+                        if not self.governor.allows(resource, priority):
+                            _LOGGER.warning(f"GitHub API rate limit exceeded (status {resp.status}). Add a GitHub token in integration options to increase rate limit from 60/hour to 5000/hour.")
+                        else:
+                            _LOGGER.debug(f"GitHub API returned status {resp.status} for {url}")
+                        return None, None
+                    elif resp.status == 401:
+                        _LOGGER.error(f"GitHub API authentication failed (status 401). Check that your GitHub token is valid.")
+                        return None, None
+                    else:
+                        _LOGGER.debug(f"GitHub API returned status {resp.status} for {url}")
+                        return None, None
+            except Exception as err:
+                _LOGGER.debug(f"Failed to fetch from {url}: {err}")
+                return None, None
+
+    async def graphql(
+        self,
+        query: str,
+        source: str = "graphql",
+        priority: int = PRIORITY_ITEMS,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Run a GraphQL query and return its ``data``, or None on failure.
+
+        Partial data is returned when GitHub reports per-node errors (for
+        example a HACS repository that has since been deleted).
+        """
+        if not self.governor.allows("graphql", priority):
+            self.deferred.add(source)
+            _LOGGER.debug("Deferring GraphQL query: GitHub quota reserved for higher-priority requests")
+            return None
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        async with self.governor.slot(priority):
+            self.governor.reserve("graphql")
+            self.request_count += 1
+            try:
+                async with self.session.post(
+                    GITHUB_GRAPHQL, json={"query": query}, headers=self.headers, timeout=aiohttp.ClientTimeout(total=30)
+                ) as resp:
+                    self.governor.update("graphql", resp.headers, resp.status)
+                    if resp.status != 200:
+                        _LOGGER.debug(f"GitHub GraphQL returned status {resp.status}")
+                        return None
+                    payload = await resp.json()
+            except Exception as err:
+                _LOGGER.debug(f"GitHub GraphQL request failed: {err}")
+                return None
+        if payload.get("errors"):
+            _LOGGER.debug(f"GitHub GraphQL reported {len(payload['errors'])} errors: {payload['errors'][0].get('message')}")
+        return payload.get("data")
@@ -0,0 +1,129 @@
+"""Batched GitHub GraphQL queries used when a token is configured.
+
+Two lookups go through GraphQL: HACS repository metadata, 50 repositories
+per query, and architecture discussions. Core issues and PRs do not; they
+come from the incremental REST sync of the item store (``item_store.py``).
+
+GraphQL needs authentication, so every caller keeps its REST path as the
+fallback. Results are mapped to the same dict shape the REST API returns so
+the scoring code does not care which path produced them.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .github_client import GitHubClient
+from .ratelimit import PRIORITY_ENRICHMENT, PRIORITY_ITEMS, TokenBucket
+
+_LOGGER = logging.getLogger(__name__)
+
+# Aliased repository nodes per query; GitHub charges one point per query here
+GRAPHQL_BATCH_SIZE = 50
+
+_REPO_NODE = "name description stargazerCount createdAt pushedAt url"
+
+_ITEM_SECTIONS = {
+    "discussions": (
+        'discussions: repository(owner: "home-assistant", name: "architecture") { discussions(first: 20, '
+        "states: [OPEN], orderBy: {field: UPDATED_AT, direction: DESC}) { nodes { title url "
+        "comments { totalCount } } } }"
+    ),
+}
+
+
+def build_repository_query(repo_names: List[str]) -> Tuple[str, Dict[str, str]]:
+    """Build one query with an aliased repository node per name.
+
+    Returns the query and a mapping of alias to ``owner/name``.
+    """
+    aliases = {}
+    parts = []
+    for idx, full_name in enumerate(repo_names):
+        owner, _, name = full_name.partition("/")
+        if not owner or not name:
+            continue
+        alias = f"r{idx}"
+        aliases[alias] = full_name
+        parts.append(f"{alias}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {_REPO_NODE} }}")
+    return "query { " + " ".join(parts) + " }", aliases
+
+
+def _repo_to_rest(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL repository node to the compact REST field names."""
+    return {
+        "name": node.get("name"),
+        "description": node.get("description"),
+        "stargazers_count": node.get("stargazerCount", 0),
+        "created_at": node.get("createdAt"),
+        "pushed_at": node.get("pushedAt"),
+        "html_url": node.get("url"),
+    }
+
+
+async def fetch_repositories(
+    client: GitHubClient,
+    repo_names: List[str],
+    rate_limiter: Optional[TokenBucket] = None,
+    batch_size: int = GRAPHQL_BATCH_SIZE,
+) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Fetch repository metadata in batches.
+
+    Returns ``(results, failed)`` where ``failed`` lists repositories whose
+    batch could not be queried at all and should go through REST instead.
+    Once the governor defers enrichment, the remaining batches are left out
+    of both so they are not retried through REST either.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    failed: List[str] = []
+    for start in range(0, len(repo_names), batch_size):
+        batch = repo_names[start:start + batch_size]
+        query, aliases = build_repository_query(batch)
+        if not aliases:
+            continue
+        data = await client.graphql(query, source="hacs_repos", priority=PRIORITY_ENRICHMENT, rate_limiter=rate_limiter)
+        if data is None:
+            if "hacs_repos" in client.deferred:
+                break
+            failed.extend(aliases.values())
+            continue
+        for alias, full_name in aliases.items():
+            node = data.get(alias)
+            if node:
+                results[full_name] = _repo_to_rest(node)
+    _LOGGER.debug(
+        f"GraphQL fetched {len(results)} of {len(repo_names)} repositories "
+        f"in {(len(repo_names) + batch_size - 1) // batch_size} queries"
+    )
+    return results, failed
+
+
+def _discussion_to_rest(node: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "title": node.get("title", ""),
+        "html_url": node.get("url", ""),
+        "comments": (node.get("comments") or {}).get("totalCount", 0),
+    }
+
+
+async def fetch_items(
+    client: GitHubClient,
+    sections: Iterable[str],
+    source: str = "graphql",
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Fetch one or more item sections in a single query.
+
+    ``sections`` currently supports ``discussions``.
+    Returns REST-shaped lists per section, or None if the query failed.
+    """
+    sections = [name for name in sections if name in _ITEM_SECTIONS]
+    query = "query { " + " ".join(_ITEM_SECTIONS[name] for name in sections) + " }"
+    data = await client.graphql(query, source=source, priority=PRIORITY_ITEMS)
+    if data is None:
+        return None
+    items: Dict[str, List[Dict[str, Any]]] = {}
+    if "discussions" in sections:
+        nodes = ((data.get("discussions") or {}).get("discussions") or {}).get("nodes", [])
+        items["discussions"] = [_discussion_to_rest(n) for n in nodes if n]
+    return items
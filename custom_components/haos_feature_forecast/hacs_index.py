@@ -0,0 +1,232 @@
+"""Streaming parser and cached compact index for the HACS default data.json.
+
+The catalogue is several megabytes of JSON, of which the forecast needs
+only the repository names of two categories. The response is scanned in
+chunks and only those names are materialized. The resulting index is kept
+between runs keyed by the content hash and ETag: an unchanged file answers
+the conditional request with 304 and is neither downloaded nor parsed, and
+a new ETag with the same content is hashed but not parsed.
+"""
+from __future__ import annotations
+
+import codecs
+import hashlib
+import json
+import logging
+import re
+from array import array
+from typing import Any, Dict, List, Optional, Sequence
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .metrics import record_stream_bytes
+
+_LOGGER = logging.getLogger(__name__)
+
+HACS_INDEX_STORAGE_KEY = f"{DOMAIN}.hacs_index"
+HACS_INDEX_STORAGE_VERSION = 1
+
+# Categories the forecast reads, in category-code order
+HACS_CATEGORIES = ("integrations", "lovelace")
+# Fields that hold the "owner/name" of a repository entry
+_REPO_NAME_FIELDS = ("repository", "full_name")
+
+_CHUNK_SIZE = 64 * 1024
+
+# One JSON token: string, structural character or bare literal/number
+_TOKEN = re.compile(r'\s*(?:("[^"\\]*(?:\\.[^"\\]*)*")|([{}\[\]:,])|([^\s{}\[\]:,"]+))')
+_TRAILING_SPACE = re.compile(r"\s*\Z")
+
+
+class HacsCatalogueParser:
+    """Incremental JSON scanner that only keeps repository names.
+
+    Handles ``{category: [ "owner/name" | {"repository": ...}, ... ]}`` and
+    ``{category: {id: {"full_name": ...}, ...}}``; everything else is
+    tokenized and skipped without building Python objects.
+    """
+
+    def __init__(self, categories: Sequence[str] = HACS_CATEGORIES) -> None:
+        """Initialize the scanner for the given categories."""
+        self._categories = {name: code for code, name in enumerate(categories)}
+        self._buffer = ""
+        self._stack: List[str] = []
+        self._keys: List[Optional[str]] = []
+        self._expect_key = False
+        self._element_done = False
+        self.names: List[str] = []
+        self.codes = array("B")
+
+    def feed(self, text: str, final: bool = False) -> None:
+        """Consume the next piece of decoded text."""
+        buf = self._buffer + text if self._buffer else text
+        end = len(buf)
+        pos = 0
+        match = _TOKEN.match
+        while True:
+            m = match(buf, pos)
+            if m is None:
+                break
+            if m.lastindex == 3 and m.end() == end and not final:
+                # A literal at the end of the chunk may continue in the next one
+                break
+            self._token(m)
+            pos = m.end()
+        self._buffer = buf[pos:]
+        if final and (self._stack or not _TRAILING_SPACE.match(self._buffer)):
+            raise ValueError("Truncated or malformed HACS catalogue JSON")
+
+    def _token(self, m: "re.Match[str]") -> None:
+        string, punct, literal = m.groups()
+        stack = self._stack
+        if punct is not None:
+            if punct in "{[":
+                if len(stack) == 2:
+                    self._element_done = False
+                stack.append(punct)
+                self._keys.append(None)
+                self._expect_key = punct == "{"
+            elif punct in "}]":
+                stack.pop()
+                self._keys.pop()
+                self._expect_key = False
+            elif punct == ",":
+                self._expect_key = bool(stack) and stack[-1] == "{"
+            else:
+                self._expect_key = False
+            return
+        if string is not None and self._expect_key:
+            # Keys only matter at the category and element levels
+            self._keys[-1] = json.loads(string) if len(stack) in (1, 3) else None
+            return
+        if string is None:
+            return
+        depth = len(stack)
+        if depth == 2 and stack[1] == "[":
+            self._record(json.loads(string))
+        elif depth == 3 and not self._element_done and self._keys[2] in _REPO_NAME_FIELDS:
+            self._record(json.loads(string))
+            self._element_done = True
+
+    def _record(self, name: Any) -> None:
+        code = self._categories.get(self._keys[0])
+        if code is not None and isinstance(name, str) and name:
+            self.names.append(name)
+            self.codes.append(code)
+
+
+class HacsRepoIndex:
+    """Compact (name, category) index: a name list plus a byte array of codes."""
+
+    __slots__ = ("content_hash", "etag", "names", "codes")
+
+    def __init__(self, content_hash: str, etag: Optional[str], names: List[str], codes: array) -> None:
+        """Initialize the index."""
+        self.content_hash = content_hash
+        self.etag = etag
+        self.names = names
+        self.codes = codes
+
+    def repos(self, category: str) -> List[str]:
+        """Return repository names in one category, in catalogue order."""
+        code = HACS_CATEGORIES.index(category)
+        return [name for name, c in zip(self.names, self.codes) if c == code]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable form for the Store."""
+        return {
+            "content_hash": self.content_hash,
+            "etag": self.etag,
+            "names": self.names,
+            "codes": self.codes.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HacsRepoIndex":
+        """Rebuild an index from its stored form."""
+        return cls(data["content_hash"], data.get("etag"), list(data["names"]), array("B", data["codes"]))
+
+
+class HacsIndexCache:
+    """Holds the last index in memory and on disk."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store = Store(hass, HACS_INDEX_STORAGE_VERSION, HACS_INDEX_STORAGE_KEY)
+        self.index: Optional[HacsRepoIndex] = None
+
+    async def async_load(self) -> None:
+        """Load the stored index."""
+        data = await self._store.async_load()
+        if isinstance(data, dict) and data.get("content_hash"):
+            try:
+                self.index = HacsRepoIndex.from_dict(data)
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.debug(f"Discarding unreadable HACS index: {err}")
+
+    def set(self, index: HacsRepoIndex) -> None:
+        """Replace the index and persist it."""
+        self.index = index
+        self._store.async_delay_save(index.as_dict, 10)
+
+
+async def async_get_hacs_index_cache(hass: HomeAssistant) -> HacsIndexCache:
+    """Return the shared index cache, loading it from disk on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get("hacs_index")
+    if cache is None:
+        cache = HacsIndexCache(hass)
+        await cache.async_load()
+        domain_data["hacs_index"] = cache
+    return cache
+
+
+def parse_catalogue(chunks: List[bytes]) -> HacsCatalogueParser:
+    """Scan the raw catalogue chunks; runs in the executor."""
+    parser = HacsCatalogueParser()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True), final=True)
+    return parser
+
+
+async def async_fetch_hacs_index(
+    hass: HomeAssistant, session: aiohttp.ClientSession, url: str, cache: HacsIndexCache
+) -> Optional[HacsRepoIndex]:
+    """Return the current HACS index, re-parsing only when the content changed."""
+    cached = cache.index
+    headers = {"If-None-Match": cached.etag} if cached and cached.etag else {}
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+        if resp.status == 304 and cached:
+            _LOGGER.info(f"HACS catalogue unchanged, reusing index of {len(cached.names)} repositories")
+            return cached
+        if resp.status != 200:
+            _LOGGER.warning(f"Could not fetch HACS data: HTTP {resp.status}")
+            return None
+        # Hashed as it arrives and only parsed once the hash shows the content changed
+        chunks: List[bytes] = []
+        digest = hashlib.sha256()
+        size = 0
+        async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+            size += len(chunk)
+            record_stream_bytes(len(chunk))
+            digest.update(chunk)
+            chunks.append(chunk)
+        etag = resp.headers.get("ETag")
+    content_hash = digest.hexdigest()
+    if cached and cached.content_hash == content_hash:
+        # Same content under a new ETag; keep the existing index
+        _LOGGER.info(f"HACS catalogue content unchanged under a new ETag, reusing index of {len(cached.names)} repositories")
+        cached.etag = etag
+        cache.set(cached)
+        return cached
+    parser = await hass.async_add_executor_job(parse_catalogue, chunks)
+    index = HacsRepoIndex(content_hash, etag, parser.names, parser.codes)
+    cache.set(index)
+    _LOGGER.info(f"Parsed HACS catalogue ({size} bytes) into an index of {len(index.names)} repositories")
+    return index
@@ -0,0 +1,95 @@
+"""Persistent HTTP validator cache for conditional GitHub requests."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+HTTP_CACHE_STORAGE_KEY = f"{DOMAIN}.http_cache"
+HTTP_CACHE_STORAGE_VERSION = 1
+# Coalesce disk writes after a refresh instead of writing once per response
+HTTP_CACHE_SAVE_DELAY = 30
+
+
+class HttpValidatorCache:
+    """Store ETag/Last-Modified validators and bodies per URL + params.
+
+    GitHub does not count 304 Not Modified responses against the rate limit,
+    so replaying the stored body on a 304 makes unchanged sources free.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store = Store(hass, HTTP_CACHE_STORAGE_VERSION, HTTP_CACHE_STORAGE_KEY)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    async def async_load(self) -> None:
+        """Load stored validators from disk."""
+        data = await self._store.async_load()
+        if isinstance(data, dict):
+            self._entries = data.get("entries", {})
+        _LOGGER.debug(f"Loaded {len(self._entries)} cached HTTP validators")
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """Build a stable cache key from the URL and query parameters."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted((str(k), str(v)) for k, v in params.items()))}"
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for a stored entry."""
+        entry = self._entries.get(key)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get_body(self, key: str) -> Any:
+        """Return the stored body for a key, or None."""
+        entry = self._entries.get(key)
+        return entry.get("body") if entry else None
+
+    def update(self, key: str, etag: Optional[str], last_modified: Optional[str], body: Any) -> None:
+        """Store validators and body from a 200 response."""
+        if not etag and not last_modified:
+            # Nothing to revalidate against, so keeping the body would only waste disk
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = {"etag": etag, "last_modified": last_modified, "body": body}
+
+    def record(self, source: str, hit: bool) -> None:
+        """Count a cache hit (304) or miss (full download) for a source."""
+        counts = self.stats.setdefault(source, {"hits": 0, "misses": 0})
+        counts["hits" if hit else "misses"] += 1
+
+    def reset_stats(self) -> None:
+        """Clear per-run hit/miss counters."""
+        self.stats = {}
+
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write of the validator cache."""
+        self._store.async_delay_save(lambda: {"entries": self._entries}, HTTP_CACHE_SAVE_DELAY)
+
+
+async def async_get_http_cache(hass: HomeAssistant) -> HttpValidatorCache:
+    """Return the shared validator cache, loading it from disk on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get("http_cache")
+    if cache is None:
+        cache = HttpValidatorCache(hass)
+        await cache.async_load()
+        domain_data["http_cache"] = cache
+    return cache
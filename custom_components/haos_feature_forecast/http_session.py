@@ -0,0 +1,40 @@
+"""Long-lived HTTP session owned by the config entry."""
+from __future__ import annotations
+
+import logging
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession, async_get_clientsession
+
+from .const import DOMAIN
+from .metrics import metrics_trace_config
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def async_create_forecast_session(hass: HomeAssistant, entry: ConfigEntry) -> aiohttp.ClientSession:
+    """Create the entry's session and close it when the entry unloads.
+
+    Built by HA, so it gets HA's user agent, SSL context and pooled
+    connector; aiohttp negotiates gzip/deflate (and brotli when installed).
+    """
+    session = async_create_clientsession(
+        hass,
+        # Counts requests and bytes per source for the refresh metrics
+        trace_configs=[metrics_trace_config()],
+    )
+    hass.data.setdefault(DOMAIN, {})["session"] = session
+    entry.async_on_unload(session.close)
+    _LOGGER.debug("Created the forecast HTTP session")
+    return session
+
+
+def async_get_forecast_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the entry's session, or HA's shared session before setup."""
+    session = hass.data.get(DOMAIN, {}).get("session")
+    if session is None or session.closed:
+        return async_get_clientsession(hass)
+    return session
@@ -0,0 +1,131 @@
+"""Local store of open home-assistant/core feature issues and PRs.
+
+The store is filled once by walking every page of the issues endpoint and
+then kept current with ``since=<last sync>`` so later runs only transfer
+items that changed.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+ITEM_STORE_KEY = f"{DOMAIN}.core_items"
+ITEM_STORE_VERSION = 1
+ITEM_STORE_SAVE_DELAY = 30
+
+# Issues are only kept when they carry this label; open PRs are always kept
+FEATURE_ISSUE_LABEL = "new-feature"
+
+
+def compact_item(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an issues-endpoint item to the REST fields the scoring reads."""
+    milestone = raw.get("milestone")
+    item = {
+        "number": raw.get("number"),
+        "title": raw.get("title", ""),
+        "html_url": raw.get("html_url", ""),
+        "state": raw.get("state", "open"),
+        "comments": raw.get("comments", 0),
+        "reactions": {"+1": (raw.get("reactions") or {}).get("+1", 0)},
+        "labels": [{"name": label.get("name", "")} for label in raw.get("labels", []) if isinstance(label, dict)],
+        "milestone": {"title": milestone.get("title")} if isinstance(milestone, dict) else None,
+        "updated_at": raw.get("updated_at"),
+    }
+    if "pull_request" in raw:
+        item["pull_request"] = {}
+        item["draft"] = raw.get("draft", False)
+    return item
+
+
+def _is_tracked(item: Dict[str, Any]) -> bool:
+    """Return True for open PRs and open feature-labelled issues."""
+    if item["state"] != "open":
+        return False
+    if "pull_request" in item:
+        return True
+    return any(label["name"] == FEATURE_ISSUE_LABEL for label in item["labels"])
+
+
+class CoreItemStore:
+    """Open feature issues and PRs keyed by number, with a sync cursor."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty store."""
+        self._store = Store(hass, ITEM_STORE_VERSION, ITEM_STORE_KEY)
+        self.items: Dict[str, Dict[str, Any]] = {}
+        # Newest updated_at seen; used as the ``since`` cursor for the next run
+        self.last_sync: Optional[str] = None
+        # PRs seen merged since they were last consumed (for accuracy scoring)
+        self.merged: List[Dict[str, Any]] = []
+
+    async def async_load(self) -> None:
+        """Load stored items from disk."""
+        data = await self._store.async_load()
+        if isinstance(data, dict):
+            self.items = data.get("items", {})
+            self.last_sync = data.get("last_sync")
+        _LOGGER.debug(f"Loaded {len(self.items)} stored core issues/PRs (last sync {self.last_sync})")
+
+    def apply(self, raw_items: List[Dict[str, Any]]) -> Tuple[int, Optional[str]]:
+        """Merge fetched items, dropping closed or no longer relevant ones.
+
+        Returns the number of items that changed and the newest ``updated_at``
+        seen; the caller decides whether that may become the sync cursor.
+        """
+        changed = 0
+        newest: Optional[str] = None
+        for raw in raw_items:
+            if not isinstance(raw, dict) or raw.get("number") is None:
+                continue
+            item = compact_item(raw)
+            key = str(item["number"])
+            merged_at = (raw.get("pull_request") or {}).get("merged_at")
+            if merged_at:
+                self.merged.append({"number": item["number"], "title": item["title"], "url": item["html_url"], "merged_at": merged_at})
+            if _is_tracked(item):
+                if self.items.get(key) != item:
+                    self.items[key] = item
+                    changed += 1
+            elif self.items.pop(key, None) is not None:
+                changed += 1
+            updated_at = item.get("updated_at")
+            if updated_at and (newest is None or updated_at > newest):
+                newest = updated_at
+        return changed, newest
+
+    def advance_cursor(self, newest: Optional[str]) -> None:
+        """Move the ``since`` cursor forward to ``newest``."""
+        if newest and (self.last_sync is None or newest > self.last_sync):
+            self.last_sync = newest
+
+    def issues(self) -> List[Dict[str, Any]]:
+        """Return stored feature issues."""
+        return [item for item in self.items.values() if "pull_request" not in item]
+
+    def pulls(self) -> List[Dict[str, Any]]:
+        """Return stored open PRs."""
+        return [item for item in self.items.values() if "pull_request" in item]
+
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write of the store."""
+        self._store.async_delay_save(
+            lambda: {"items": self.items, "last_sync": self.last_sync}, ITEM_STORE_SAVE_DELAY
+        )
+
+
+async def async_get_item_store(hass: HomeAssistant) -> CoreItemStore:
+    """Return the shared item store, loading it from disk on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    store = domain_data.get("item_store")
+    if store is None:
+        store = CoreItemStore(hass)
+        await store.async_load()
+        domain_data["item_store"] = store
+    return store
@@ -0,0 +1,165 @@
+"""Feature lifecycle database and forecast accuracy scoring.
+
+Every forecasted feature is recorded in a small SQLite database with when
+it was first and last forecast and the version it was first predicted for.
+When a matching core PR merges the feature is marked as landed (release
+notes are not matched), and once its predicted version ships without it,
+as missed. Per-source hit rates then calibrate the source weights used
+for ranking.
+
+All database access runs in the executor.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DOMAIN
+from .dedup import jaccard, title_tokens
+from .model import Feature
+
+_LOGGER = logging.getLogger(__name__)
+
+LIFECYCLE_DB_NAME = f"{DOMAIN}.lifecycle.db"
+
+# A merged PR lands a forecast feature when titles are at least this similar
+LANDED_TITLE_THRESHOLD = 0.6
+# How many resolved forecasts count as much as the hard-coded prior weight
+PRIOR_STRENGTH = 5
+# Features not forecast for this long are dropped from the database
+RETENTION = timedelta(days=730)
+MIN_WEIGHT = 0.1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS features (
+    key TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    sources TEXT NOT NULL,
+    urls TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    target_version TEXT,
+    landed_at TEXT,
+    landed_version TEXT,
+    landed_url TEXT
+)
+"""
+
+
+def _version_key(version: Optional[str]) -> Tuple[int, ...]:
+    try:
+        return tuple(int(part) for part in (version or "").split("."))
+    except ValueError:
+        return ()
+
+
+class LifecycleDB:
+    """Synchronous access to the lifecycle database; call from the executor."""
+
+    def __init__(self, path: str) -> None:
+        """Open (and create) the database."""
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._conn.close()
+
+    def record(self, features: Iterable[Tuple[str, Feature]], now: str) -> None:
+        """Insert or refresh forecast features keyed by normalized title.
+
+        The target version is kept from the first forecast, so a feature
+        that slips is scored against what was originally predicted.
+        """
+        rows = [
+            (key, f.title, ",".join(f.sources), " ".join(u for u in f.urls if u), f.first_seen or now, now, f.target_version)
+            for key, f in features
+        ]
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO features (key, title, sources, urls, first_seen, last_seen, target_version)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    title = excluded.title,
+                    sources = excluded.sources,
+                    urls = excluded.urls,
+                    last_seen = excluded.last_seen,
+                    target_version = COALESCE(features.target_version, excluded.target_version)
+                """,
+                rows,
+            )
+            cutoff = (datetime.fromisoformat(now) - RETENTION).isoformat()
+            self._conn.execute("DELETE FROM features WHERE last_seen < ?", (cutoff,))
+
+    def mark_landed(self, merged: List[Dict[str, Any]], version: Optional[str]) -> int:
+        """Mark open features as landed by merged PRs; returns how many."""
+        pending = self._conn.execute("SELECT key, title, urls FROM features WHERE landed_at IS NULL").fetchall()
+        if not pending or not merged:
+            return 0
+        candidates = [(key, title_tokens(title), set(urls.split())) for key, title, urls in pending]
+        updates = []
+        for pr in merged:
+            pr_tokens = title_tokens(pr.get("title", ""))
+            for key, tokens, urls in candidates:
+                if pr.get("url") in urls or jaccard(tokens, pr_tokens) >= LANDED_TITLE_THRESHOLD:
+                    updates.append((pr.get("merged_at"), version, pr.get("url"), key))
+        if updates:
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE features SET landed_at = ?, landed_version = ?, landed_url = ? "
+                    "WHERE key = ? AND landed_at IS NULL",
+                    updates,
+                )
+        return len({update[3] for update in updates})
+
+    def report(self, released: Set[str], priors: Mapping[str, float]) -> Dict[str, Any]:
+        """Return per-source hit rates and calibrated weights.
+
+        A forecast is a hit when the feature landed in or before its target
+        version, a miss when the target version shipped without it (or it
+        landed later), and pending otherwise.
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        rows = self._conn.execute("SELECT sources, target_version, landed_version FROM features").fetchall()
+        for sources, target, landed in rows:
+            if not target:
+                outcome = "pending"
+            elif landed:
+                outcome = "hits" if _version_key(landed) <= _version_key(target) else "misses"
+            elif target in released:
+                outcome = "misses"
+            else:
+                outcome = "pending"
+            for source in sources.split(","):
+                counts = stats.setdefault(source, {"hits": 0, "misses": 0, "pending": 0})
+                counts[outcome] += 1
+        weights = dict(priors)
+        sources_report = {}
+        for source, counts in stats.items():
+            resolved = counts["hits"] + counts["misses"]
+            prior = priors.get(source, 1.0)
+            weight = (counts["hits"] + PRIOR_STRENGTH * prior) / (resolved + PRIOR_STRENGTH)
+            weights[source] = round(min(max(weight, MIN_WEIGHT), 1.0), 3)
+            sources_report[source] = {
+                **counts,
+                "hit_rate": round(counts["hits"] / resolved, 3) if resolved else None,
+                "weight": weights[source],
+            }
+        return {"tracked": len(rows), "sources": sources_report, "weights": weights}
+
+
+async def async_get_lifecycle_db(hass: HomeAssistant) -> LifecycleDB:
+    """Return the shared database, opening it in the executor on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    db = domain_data.get("lifecycle_db")
+    if db is None:
+        db = await hass.async_add_executor_job(LifecycleDB, hass.config.path(STORAGE_DIR, LIFECYCLE_DB_NAME))
+        domain_data["lifecycle_db"] = db
+    return db
@@ -0,0 +1,130 @@
+"""Index of core PRs merged into dev since its newest release branch point.
+
+The compare endpoint lists the commits on ``dev`` that are not in the tag
+of the newest version's first beta (see ``ReleaseHistory.branch_point_tag``),
+so patch releases don't move the base. Squash merges carry the PR number in
+their subject (``Add foo integration (#12345)``), so the commits map onto
+merged PRs. The head SHA compared last is kept, and later runs only compare
+from it, so a cycle usually costs a single request.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+MERGE_INDEX_KEY = f"{DOMAIN}.merge_index"
+MERGE_INDEX_VERSION = 1
+MERGE_INDEX_SAVE_DELAY = 30
+
+CORE_PULL_URL = "https://github.com/home-assistant/core/pull/{number}"
+
+_PR_SUFFIX = re.compile(r"\s*\(#(\d+)\)\s*$")
+
+
+def parse_commit(commit: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the merged PR of a compare-endpoint commit, or None.
+
+    Only the subject line is used; commits without a ``(#number)`` suffix
+    (direct pushes, version bumps) are not PR merges.
+    """
+    details = commit.get("commit") or {}
+    subject = (details.get("message") or "").split("\n", 1)[0]
+    match = _PR_SUFFIX.search(subject)
+    if not match:
+        return None
+    number = int(match.group(1))
+    return {
+        "number": number,
+        "title": subject[: match.start()].strip(),
+        "url": CORE_PULL_URL.format(number=number),
+        "sha": commit.get("sha"),
+        "merged_at": (details.get("committer") or {}).get("date"),
+    }
+
+
+class MergeIndex:
+    """Merged PRs between a release tag and dev, with a compare cursor."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty index."""
+        self._store = Store(hass, MERGE_INDEX_VERSION, MERGE_INDEX_KEY)
+        # Tag the index was built against; a new tag starts a new index
+        self.base_tag: Optional[str] = None
+        # Newest dev commit compared; the next compare starts here
+        self.head_sha: Optional[str] = None
+        self.prs: Dict[str, Dict[str, Any]] = {}
+        # PRs added since they were last consumed (for accuracy scoring)
+        self.merged: List[Dict[str, Any]] = []
+
+    async def async_load(self) -> None:
+        """Load the index from disk."""
+        data = await self._store.async_load()
+        if isinstance(data, dict):
+            self.base_tag = data.get("base_tag")
+            self.head_sha = data.get("head_sha")
+            self.prs = data.get("prs", {})
+        _LOGGER.debug(f"Loaded {len(self.prs)} merged core PRs since {self.base_tag} (head {self.head_sha})")
+
+    def compare_base(self, tag: str) -> str:
+        """Return the ref to compare dev against for ``tag``.
+
+        Starts over from the tag when it changed since the last run.
+        """
+        if tag != self.base_tag:
+            if self.base_tag is not None:
+                _LOGGER.info(f"New release branch point {tag}, rebuilding merged PR index (was {self.base_tag})")
+            self.base_tag = tag
+            self.head_sha = None
+            self.prs = {}
+        return self.head_sha or tag
+
+    def apply(self, commits: List[Dict[str, Any]]) -> int:
+        """Add the PRs of newly compared commits; returns how many were new.
+
+        Compare lists commits oldest first, so the last one becomes the cursor.
+        """
+        added = 0
+        for commit in commits:
+            if not isinstance(commit, dict):
+                continue
+            pr = parse_commit(commit)
+            if pr is not None and str(pr["number"]) not in self.prs:
+                self.prs[str(pr["number"])] = pr
+                self.merged.append(pr)
+                added += 1
+            if commit.get("sha"):
+                self.head_sha = commit["sha"]
+        return added
+
+    def reset_cursor(self) -> None:
+        """Compare from the tag again, e.g. after dev was rewritten."""
+        self.head_sha = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a summary for diagnostics."""
+        return {"base_tag": self.base_tag, "head_sha": self.head_sha, "merged_prs": len(self.prs)}
+
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write of the index."""
+        self._store.async_delay_save(
+            lambda: {"base_tag": self.base_tag, "head_sha": self.head_sha, "prs": self.prs}, MERGE_INDEX_SAVE_DELAY
+        )
+
+
+async def async_get_merge_index(hass: HomeAssistant) -> MergeIndex:
+    """Return the shared merge index, loading it from disk on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get("merge_index")
+    if index is None:
+        index = MergeIndex(hass)
+        await index.async_load()
+        domain_data["merge_index"] = index
+    return index
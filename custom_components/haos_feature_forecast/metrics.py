@@ -0,0 +1,170 @@
+"""Per-refresh pipeline metrics.
+
+One ``PipelineMetrics`` is created per refresh. Each scheduled source runs
+inside ``track_source`` and each pipeline stage inside ``stage``. HTTP
+requests and response bytes are attributed to the active source by an
+aiohttp trace config on the entry's session, which looks the source up in
+a context variable (tasks spawned by a fetcher inherit it). The trace config
+only sees bodies read in full, so streaming readers report their chunks
+with ``record_stream_bytes``.
+
+The last refresh's metrics are kept in ``hass.data[DOMAIN]["metrics"]`` for
+the diagnostic sensors and the diagnostics download.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Dict, Iterator, Mapping, Optional, Tuple
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# GitHub rate-limit buckets reported after each refresh
+QUOTA_RESOURCES = ("core", "graphql", "search")
+
+_ACTIVE: ContextVar[Optional[Tuple["PipelineMetrics", Optional[str]]]] = ContextVar(
+    "haos_feature_forecast_metrics", default=None
+)
+
+
+def _ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def _count(result: Any) -> Optional[int]:
+    return len(result) if isinstance(result, (list, tuple, dict)) else None
+
+
+class PipelineMetrics:
+    """Timings, traffic and item counts of one refresh."""
+
+    def __init__(self) -> None:
+        """Start measuring a refresh."""
+        self._start = time.perf_counter()
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.quota: Dict[str, Optional[int]] = {}
+        self.total_ms: Optional[float] = None
+        # Requests made outside any source (e.g. the session fallback)
+        self.unattributed = {"requests": 0, "bytes": 0}
+
+    def _source(self, name: str) -> Dict[str, Any]:
+        return self.sources.setdefault(
+            name,
+            {"at": self.started_at, "wall_ms": 0.0, "requests": 0, "bytes": 0, "cache_hits": 0, "items_out": None, "ok": None},
+        )
+
+    @contextmanager
+    def activate(self) -> Iterator["PipelineMetrics"]:
+        """Make this the refresh that traced requests are counted for."""
+        token = _ACTIVE.set((self, None))
+        try:
+            yield self
+        finally:
+            _ACTIVE.reset(token)
+
+    async def track_source(self, name: str, fetch: Awaitable[Any]) -> Any:
+        """Await one source fetcher, attributing its time and traffic to ``name``."""
+        record = self._source(name)
+        token = _ACTIVE.set((self, name))
+        start = time.perf_counter()
+        try:
+            result = await fetch
+        except Exception:
+            record["ok"] = False
+            raise
+        finally:
+            record["wall_ms"] = _ms(start)
+            _ACTIVE.reset(token)
+        record["items_out"] = _count(result)
+        # Fetchers return None when the source could not be read; [] is a valid result
+        record["ok"] = result is not None
+        return result
+
+    @contextmanager
+    def stage(self, name: str, items_in: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Time a pipeline stage; set ``items_out`` on the yielded record."""
+        record = {"wall_ms": None, "items_in": items_in, "items_out": None}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall_ms"] = _ms(start)
+            self.stages[name] = record
+
+    def record_request(self, source: Optional[str]) -> None:
+        """Count one HTTP request."""
+        target = self._source(source) if source else self.unattributed
+        target["requests"] += 1
+
+    def record_bytes(self, source: Optional[str], size: int) -> None:
+        """Count received response body bytes."""
+        target = self._source(source) if source else self.unattributed
+        target["bytes"] += size
+
+    def finish(
+        self,
+        governor: Any,
+        cache_stats: Mapping[str, Mapping[str, int]],
+        source_labels: Mapping[str, Tuple[str, ...]],
+    ) -> None:
+        """Close the refresh with quota and conditional-request cache figures.
+
+        The cache counts hits per GitHubClient request label; ``source_labels``
+        maps each scheduled source to the labels its requests use.
+        """
+        self.total_ms = _ms(self._start)
+        self.quota = {resource: governor.remaining(resource) for resource in QUOTA_RESOURCES}
+        for name, labels in source_labels.items():
+            hits = sum(cache_stats.get(label, {}).get("hits", 0) for label in labels)
+            if hits and name in self.sources:
+                self.sources[name]["cache_hits"] = hits
+
+    def carry_over(self, previous: Mapping[str, Any]) -> None:
+        """Keep the last figures of sources that were not due this refresh."""
+        for name, record in (previous.get("sources") or {}).items():
+            self.sources.setdefault(name, record)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the JSON form."""
+        return {
+            "started_at": self.started_at,
+            "total_ms": self.total_ms,
+            "sources": self.sources,
+            "stages": self.stages,
+            "quota": self.quota,
+            "unattributed": self.unattributed,
+        }
+
+
+async def _on_request_end(session: aiohttp.ClientSession, context: Any, params: Any) -> None:
+    active = _ACTIVE.get()
+    if active is not None:
+        active[0].record_request(active[1])
+
+
+async def _on_chunk(session: aiohttp.ClientSession, context: Any, params: Any) -> None:
+    active = _ACTIVE.get()
+    if active is not None:
+        active[0].record_bytes(active[1], len(params.chunk))
+
+
+def record_stream_bytes(size: int) -> None:
+    """Count body bytes read through ``resp.content``, which the trace config does not see."""
+    active = _ACTIVE.get()
+    if active is not None:
+        active[0].record_bytes(active[1], size)
+
+
+def metrics_trace_config() -> aiohttp.TraceConfig:
+    """Return a trace config counting requests and fully read bytes for the active refresh."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_response_chunk_received.append(_on_chunk)
+    return trace_config
@@ -0,0 +1,129 @@
+"""Typed forecast model shared by every output format.
+
+The fetch pipeline builds one ``Forecast`` per refresh; the HTML card,
+markdown and the JSON API are all rendered from it (see ``render.py``).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bump when the JSON layout changes incompatibly
+FORECAST_SCHEMA_VERSION = 1
+
+
+@dataclass(slots=True)
+class Feature:
+    """One forecast feature, possibly reported by several sources."""
+
+    title: str
+    importance: int
+    likelihood: int
+    sources: Tuple[str, ...]
+    urls: Tuple[str, ...]
+    first_seen: Optional[str] = None
+    target_version: Optional[str] = None
+
+    @classmethod
+    def from_dict(
+        cls, raw: Dict[str, Any], first_seen: Optional[str] = None, target_version: Optional[str] = None
+    ) -> "Feature":
+        """Build a feature from a fetcher or dedup dict."""
+        refs = raw.get("sources") or [{"source": raw.get("source"), "url": raw.get("url")}]
+        return cls(
+            title=raw.get("title", ""),
+            importance=raw.get("importance", 1),
+            likelihood=raw.get("likelihood", 1),
+            sources=tuple(ref.get("source") or "unknown" for ref in refs),
+            urls=tuple(ref.get("url") or "" for ref in refs),
+            first_seen=first_seen,
+            target_version=target_version,
+        )
+
+    @property
+    def score(self) -> int:
+        """Return importance * likelihood."""
+        return self.importance * self.likelihood
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the JSON form."""
+        return {
+            "title": self.title,
+            "importance": self.importance,
+            "likelihood": self.likelihood,
+            "sources": list(self.sources),
+            "urls": list(self.urls),
+            "first_seen": self.first_seen,
+            "target_version": self.target_version,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Feature":
+        """Rebuild a feature from its JSON form."""
+        return cls(
+            title=data["title"],
+            importance=data["importance"],
+            likelihood=data["likelihood"],
+            sources=tuple(data.get("sources", ())),
+            urls=tuple(data.get("urls", ())),
+            first_seen=data.get("first_seen"),
+            target_version=data.get("target_version"),
+        )
+
+
+@dataclass(slots=True)
+class Forecast:
+    """The complete forecast produced by one refresh."""
+
+    generated_at: str
+    current_version: str
+    upcoming_version: str
+    next_version: str
+    upcoming: List[Feature] = field(default_factory=list)
+    next: List[Feature] = field(default_factory=list)
+    hacs: List[Feature] = field(default_factory=list)
+    feature_count: int = 0
+    source_counts: Dict[str, int] = field(default_factory=dict)
+    # Beta/stable date forecast from release_history.ReleaseHistory.predict()
+    release_prediction: Optional[Dict[str, Any]] = None
+    # Sources still being fetched when an interim forecast was built (shown from cache)
+    pending_sources: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the versioned JSON form."""
+        return {
+            "schema_version": FORECAST_SCHEMA_VERSION,
+            "generated_at": self.generated_at,
+            "current_version": self.current_version,
+            "upcoming_version": self.upcoming_version,
+            "next_version": self.next_version,
+            "feature_count": self.feature_count,
+            "source_counts": dict(self.source_counts),
+            "release_prediction": self.release_prediction,
+            "pending_sources": list(self.pending_sources),
+            "upcoming": [f.as_dict() for f in self.upcoming],
+            "next": [f.as_dict() for f in self.next],
+            "hacs": [f.as_dict() for f in self.hacs],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> Optional["Forecast"]:
+        """Rebuild a forecast from its JSON form; None for other schema versions."""
+        if not isinstance(data, dict) or data.get("schema_version") != FORECAST_SCHEMA_VERSION:
+            return None
+        try:
+            return cls(
+                generated_at=data["generated_at"],
+                current_version=data["current_version"],
+                upcoming_version=data["upcoming_version"],
+                next_version=data["next_version"],
+                upcoming=[Feature.from_json(f) for f in data.get("upcoming", [])],
+                next=[Feature.from_json(f) for f in data.get("next", [])],
+                hacs=[Feature.from_json(f) for f in data.get("hacs", [])],
+                feature_count=data.get("feature_count", 0),
+                source_counts=dict(data.get("source_counts", {})),
+                release_prediction=data.get("release_prediction"),
+                pending_sources=list(data.get("pending_sources", [])),
+            )
+        except (KeyError, TypeError):
+            return None
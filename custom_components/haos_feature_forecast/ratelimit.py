@@ -0,0 +1,167 @@
+"""Rate limiting and GitHub quota governance shared by all GitHub traffic."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Request priorities, lower runs first
+PRIORITY_RELEASES = 0
+PRIORITY_ITEMS = 1
+PRIORITY_ENRICHMENT = 2
+
+# Share of the hourly limit each priority must leave for higher priorities,
+# with an absolute floor so the 60 requests/hour anonymous limit still works
+_PRIORITY_RESERVE = {
+    PRIORITY_RELEASES: (0.0, 0),
+    PRIORITY_ITEMS: (0.05, 3),
+    PRIORITY_ENRICHMENT: (0.2, 10),
+}
+
+# Concurrent GitHub requests across all sources
+MAX_CONCURRENT_REQUESTS = 8
+
+
+class TokenBucket:
+    """Token-bucket limiter smoothing bursts to ``rate`` requests per second."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize the bucket full."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class _PrioritySemaphore:
+    """Semaphore that wakes waiters in priority order instead of FIFO."""
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: int) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if not fut.cancelled():
+                # Woken and cancelled at the same time; pass the slot on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._value += 1
+
+
+class _QuotaState:
+    """Last known quota for one GitHub rate-limit resource."""
+
+    __slots__ = ("limit", "remaining", "reset_at", "blocked_until")
+
+    def __init__(self) -> None:
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.blocked_until: float = 0.0
+
+
+class RateLimitGovernor:
+    """Track GitHub quota from response headers and admit requests by priority.
+
+    The governor outlives individual refreshes so a quota exhausted in one
+    run is still respected by the next one until the reset time passes.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REQUESTS) -> None:
+        """Initialize with no known quota."""
+        self._quota: Dict[str, _QuotaState] = {}
+        self._slots = _PrioritySemaphore(max_concurrent)
+
+    def _state(self, resource: str) -> _QuotaState:
+        return self._quota.setdefault(resource, _QuotaState())
+
+    def update(self, resource: str, headers: Mapping[str, str], status: int) -> None:
+        """Record X-RateLimit-*/Retry-After headers from a GitHub response."""
+        state = self._state(headers.get("X-RateLimit-Resource", resource))
+        try:
+            if "X-RateLimit-Limit" in headers:
+                state.limit = int(headers["X-RateLimit-Limit"])
+            if "X-RateLimit-Remaining" in headers:
+                state.remaining = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Reset" in headers:
+                state.reset_at = float(headers["X-RateLimit-Reset"])
+            if "Retry-After" in headers:
+                state.blocked_until = time.time() + float(headers["Retry-After"])
+        except ValueError:
+            _LOGGER.debug(f"Ignoring malformed rate-limit headers for {resource}")
+        if status in (403, 429) and state.remaining == 0 and state.reset_at:
+            state.blocked_until = max(state.blocked_until, state.reset_at)
+
+    def allows(self, resource: str, priority: int) -> bool:
+        """Return True if a request of this priority may spend quota now."""
+        state = self._state(resource)
+        now = time.time()
+        if now < state.blocked_until:
+            return False
+        if state.remaining is None or (state.reset_at is not None and now >= state.reset_at):
+            return True
+        fraction, floor = _PRIORITY_RESERVE.get(priority, _PRIORITY_RESERVE[PRIORITY_ENRICHMENT])
+        reserve = max(floor, int((state.limit or 0) * fraction)) if priority else 0
+        return state.remaining > reserve
+
+    def resume_at(self, resource: str) -> Optional[float]:
+        """Return when deferred work for a resource may run again (POSIX time)."""
+        state = self._state(resource)
+        candidates = [t for t in (state.reset_at, state.blocked_until) if t]
+        return max(candidates) if candidates else None
+
+    def remaining(self, resource: str) -> Optional[int]:
+        """Return the last reported remaining quota for a resource."""
+        return self._state(resource).remaining
+
+    def reserve(self, resource: str) -> None:
+        """Optimistically count a request until its response headers arrive."""
+        state = self._state(resource)
+        if state.remaining:
+            state.remaining -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold one of the shared request slots, served in priority order."""
+        await self._slots.acquire(priority)
+        try:
+            yield
+        finally:
+            self._slots.release()
@@ -0,0 +1,252 @@
+"""Persisted release history and release-cadence prediction.
+
+Every core and OS release seen is kept (tag, date, kind), so the history
+grows past the single releases page fetched per run. Core releases are
+split into betas (``2026.11.0b0``), stable monthly releases (``2026.11.0``)
+and patches (``2026.11.1``); each kind gets its own cadence, from which the
+next beta cut-off and stable date are forecast with a prediction interval.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import re
+from datetime import datetime, timedelta, timezone
+from statistics import mean, stdev
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+RELEASE_HISTORY_KEY = f"{DOMAIN}.release_history"
+RELEASE_HISTORY_VERSION = 1
+
+# Only the most recent intervals describe the current cadence
+CADENCE_WINDOW = 12
+# Two-sided ~90% prediction interval
+_Z = 1.645
+# Never claim more precision than a day
+_MIN_STDEV_DAYS = 1.0
+
+_CORE_TAG = re.compile(r"^(\d{4})\.(\d{1,2})\.(\d+)(b\d+)?$")
+
+
+def classify_release(tag: str, prerelease: bool) -> str:
+    """Return "beta", "stable" or "patch" for a release tag."""
+    match = _CORE_TAG.match(tag or "")
+    if match:
+        if match.group(4):
+            return "beta"
+        return "stable" if match.group(3) == "0" else "patch"
+    # OS and other version schemes only distinguish pre-releases
+    return "beta" if prerelease else "stable"
+
+
+def _core_version(tag: str) -> Optional[Tuple[int, int]]:
+    match = _CORE_TAG.match(tag or "")
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def _next_month(version: Tuple[int, int]) -> Tuple[int, int]:
+    year, month = version
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _parse(ts: str) -> datetime:
+    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+class Cadence:
+    """Interval statistics of one release kind."""
+
+    __slots__ = ("last", "mean_days", "stdev_days", "samples")
+
+    def __init__(self, dates: List[datetime]) -> None:
+        """Compute the cadence from sorted release dates."""
+        self.last = dates[-1] if dates else None
+        intervals = [
+            (b - a).total_seconds() / 86400 for a, b in zip(dates, dates[1:])
+        ][-CADENCE_WINDOW:]
+        self.samples = len(intervals)
+        self.mean_days = mean(intervals) if intervals else None
+        self.stdev_days = max(stdev(intervals), _MIN_STDEV_DAYS) if len(intervals) > 1 else None
+
+    @property
+    def usable(self) -> bool:
+        """Return True if there is enough history to forecast."""
+        return self.last is not None and self.mean_days is not None
+
+    def estimate(self, after: datetime, steps: int = 1) -> Optional[Dict[str, Any]]:
+        """Forecast the release ``steps`` intervals after ``after``.
+
+        The interval widens with the number of steps, and a forecast that
+        would already be in the past is reported as overdue at ``now``.
+        """
+        if not self.usable:
+            return None
+        expected = after + timedelta(days=self.mean_days * steps)
+        spread = timedelta(0)
+        if self.stdev_days is not None:
+            spread = timedelta(days=_Z * self.stdev_days * math.sqrt(steps + 1 / self.samples))
+        now = datetime.now(timezone.utc)
+        low, high = expected - spread, expected + spread
+        overdue = expected < now
+        return {
+            "expected": max(expected, now).isoformat(),
+            "low": max(low, now).isoformat(),
+            "high": max(high, now).isoformat(),
+            "overdue": overdue,
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the JSON form."""
+        return {
+            "last": self.last.isoformat() if self.last else None,
+            "mean_days": round(self.mean_days, 2) if self.mean_days is not None else None,
+            "stdev_days": round(self.stdev_days, 2) if self.stdev_days is not None else None,
+            "samples": self.samples,
+        }
+
+
+class ReleaseHistory:
+    """Every release seen per repository, keyed by tag."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty history."""
+        self._store = Store(hass, RELEASE_HISTORY_VERSION, RELEASE_HISTORY_KEY)
+        # repository ("core"/"os") -> tag -> {"published_at", "kind"}
+        self.releases: Dict[str, Dict[str, Dict[str, Any]]] = {"core": {}, "os": {}}
+
+    async def async_load(self) -> None:
+        """Load the history from disk."""
+        data = await self._store.async_load()
+        if isinstance(data, dict):
+            for repo in self.releases:
+                self.releases[repo] = data.get(repo, {})
+
+    def update(self, repo: str, releases: List[Dict[str, Any]]) -> int:
+        """Add releases not seen before; returns how many were added."""
+        known = self.releases.setdefault(repo, {})
+        added = 0
+        for release in releases:
+            tag = release.get("tag_name")
+            published = release.get("published_at")
+            if not tag or not published or tag in known:
+                continue
+            known[tag] = {"published_at": published, "kind": classify_release(tag, bool(release.get("prerelease")))}
+            added += 1
+        if added:
+            self._store.async_delay_save(lambda: self.releases, 10)
+        return added
+
+    def _dates(self, repo: str, kind: str) -> List[Tuple[datetime, str]]:
+        return sorted(
+            (_parse(entry["published_at"]), tag)
+            for tag, entry in self.releases.get(repo, {}).items()
+            if entry.get("kind") == kind
+        )
+
+    def released_versions(self) -> Set[str]:
+        """Return the core versions (``2026.11``) with a stable release."""
+        versions = set()
+        for tag, entry in self.releases.get("core", {}).items():
+            version = _core_version(tag)
+            if version and entry.get("kind") == "stable":
+                versions.add(f"{version[0]}.{version[1]}")
+        return versions
+
+    def branch_point_tag(self) -> Optional[str]:
+        """Return the core tag of dev's newest release branch point.
+
+        That is the first beta of the newest version, or its ``.0`` when no
+        beta of it is known. Picked by version, so patch releases and later
+        betas (which are tagged on the release branch) never move it.
+        """
+        newest: Optional[Tuple[Tuple[int, int], float, str]] = None
+        for tag in self.releases.get("core", {}):
+            match = _CORE_TAG.match(tag)
+            if not match or (match.group(3) != "0" and not match.group(4)):
+                continue
+            version = (int(match.group(1)), int(match.group(2)))
+            # First beta before later betas, and any beta before the .0
+            order = int(match.group(4)[1:]) if match.group(4) else math.inf
+            candidate = (version, -order, tag)
+            if newest is None or candidate[:2] > newest[:2]:
+                newest = candidate
+        return newest[2] if newest else None
+
+    def cadence(self, repo: str, kind: str) -> Cadence:
+        """Return the cadence of one release kind."""
+        return Cadence([date for date, _ in self._dates(repo, kind)])
+
+    def predict(self) -> Optional[Dict[str, Any]]:
+        """Forecast the next two core versions' beta cut-off and stable dates.
+
+        Returns None until at least one stable core release is known.
+        """
+        stables = self._dates("core", "stable")
+        if not stables:
+            return None
+        betas = self._dates("core", "beta")
+        last_stable_date, last_stable_tag = stables[-1]
+        last_version = _core_version(last_stable_tag)
+        upcoming = _next_month(last_version)
+        following = _next_month(upcoming)
+
+        # Has the upcoming version's first beta already been cut?
+        upcoming_beta = next(
+            (date for date, tag in betas if _core_version(tag) == upcoming and date > last_stable_date),
+            None,
+        )
+        # Betas are cut once per version; only the first beta of each counts
+        first_betas: Dict[Tuple[int, int], datetime] = {}
+        for date, tag in betas:
+            first_betas.setdefault(_core_version(tag), date)
+        beta_cadence = Cadence(sorted(first_betas.values()))
+        if upcoming_beta is not None:
+            upcoming_beta_info = {"cut": True, "date": upcoming_beta.isoformat()}
+            following_beta_info = beta_cadence.estimate(upcoming_beta)
+        else:
+            anchor = beta_cadence.last or last_stable_date
+            upcoming_beta_info = beta_cadence.estimate(anchor)
+            following_beta_info = beta_cadence.estimate(anchor, steps=2)
+        stable_cadence = self.cadence("core", "stable")
+        return {
+            "upcoming": {
+                "version": f"{upcoming[0]}.{upcoming[1]}",
+                "beta": upcoming_beta_info,
+                "stable": stable_cadence.estimate(last_stable_date),
+            },
+            "next": {
+                "version": f"{following[0]}.{following[1]}",
+                "beta": following_beta_info,
+                "stable": stable_cadence.estimate(last_stable_date, steps=2),
+            },
+            "last_stable": {
+                "version": last_stable_tag,
+                "date": last_stable_date.isoformat(),
+                # Merges into dev after this cut-off ship in the upcoming version
+                "beta_cut": first_betas[last_version].isoformat() if last_version in first_betas else None,
+            },
+            "cadence": {
+                "beta": beta_cadence.as_dict(),
+                "stable": stable_cadence.as_dict(),
+                "patch": self.cadence("core", "patch").as_dict(),
+                "os": self.cadence("os", "stable").as_dict(),
+            },
+        }
+
+
+async def async_get_release_history(hass: HomeAssistant) -> ReleaseHistory:
+    """Return the shared release history, loading it from disk on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    history = domain_data.get("release_history")
+    if history is None:
+        history = ReleaseHistory(hass)
+        await history.async_load()
+        domain_data["release_history"] = history
+    return history
@@ -0,0 +1,155 @@
+"""Output formats for a ``Forecast``: card HTML, markdown and JSON."""
+from __future__ import annotations
+
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from html import escape
+from typing import Any, Dict, List, Optional
+
+from .model import Feature, Forecast
+
+_LOGGER = logging.getLogger(__name__)
+
+# The card has always shown times in CET
+_CET = timezone(timedelta(hours=1))
+
+# Titles are written by anyone who can open an issue or forum topic; every
+# interpolated string is escaped and only web links are rendered as links
+_SAFE_URL_SCHEMES = ("https://", "http://")
+_MARKDOWN_SPECIAL = re.compile(r"([\\`*_{}\[\]()#+!|~-])")
+_MARKDOWN_URL_UNSAFE = {"(": "%28", ")": "%29", " ": "%20", "<": "%3C", ">": "%3E"}
+
+
+def _importance_label(level: int) -> str:
+    """Convert importance level to label."""
+    labels = {5: "Critical", 4: "High", 3: "Medium", 2: "Low", 1: "Minimal"}
+    return labels.get(level, "Unknown")
+
+
+def _likelihood_label(level: int) -> str:
+    """Convert likelihood level to label."""
+    labels = {5: "Certain", 4: "Very likely", 3: "Likely", 2: "Possible", 1: "Speculative"}
+    return labels.get(level, "Unknown")
+
+
+def _safe_url(url: Optional[str]) -> Optional[str]:
+    if url and url.lower().startswith(_SAFE_URL_SCHEMES):
+        return url
+    return None
+
+
+def _md(text: str) -> str:
+    """Escape text for markdown, including any HTML in it."""
+    return _MARKDOWN_SPECIAL.sub(r"\\\1", escape(text, quote=False))
+
+
+def _md_url(url: str) -> str:
+    return "".join(_MARKDOWN_URL_UNSAFE.get(char, char) for char in url)
+
+
+def _src_badge(src, url):
+    url = _safe_url(url)
+    if url:
+        return f'<a href="{escape(url, quote=True)}" target="_blank">{escape(src.title())}</a>'
+    return escape(src.title())
+
+
+def _timestamp(forecast: Forecast) -> str:
+    try:
+        return datetime.fromisoformat(forecast.generated_at).astimezone(_CET).strftime("%b %d %H:%M")
+    except ValueError:
+        return forecast.generated_at
+
+
+def _version_label(forecast: Forecast, key: str, version: str) -> str:
+    """Append the predicted stable date, e.g. ``2026.11, ~Nov 05``."""
+    prediction = (forecast.release_prediction or {}).get(key) or {}
+    stable = prediction.get("stable")
+    if prediction.get("version") != version or not stable:
+        return version
+    try:
+        expected = datetime.fromisoformat(stable["expected"]).astimezone(_CET)
+    except (KeyError, TypeError, ValueError):
+        return version
+    return f"{version}, ~{expected.strftime('%b %d')}"
+
+
+def _sections(forecast: Forecast) -> List[tuple]:
+    return [
+        ("Upcoming", forecast.upcoming, _version_label(forecast, "upcoming", forecast.upcoming_version)),
+        ("Next", forecast.next, _version_label(forecast, "next", forecast.next_version)),
+        ("New & Updated HACS Features", forecast.hacs, None),
+    ]
+
+
+def _source_text(forecast: Forecast) -> str:
+    return ", ".join(f"{count} from {src}" for src, count in forecast.source_counts.items())
+
+
+def _pending_text(forecast: Forecast) -> str:
+    return ", ".join(name.replace("_", " ") for name in forecast.pending_sources)
+
+
+def _html_section(title: str, items: List[Feature], version: Optional[str] = None) -> str:
+    title = escape(title)
+    version_text = f" ({escape(version)})" if version else ""
+    if not items:
+        return f"<h4>{title}{version_text}</h4><p><i>No confirmed features yet. Check back later!</i></p>"
+
+    lis = ""
+    for i in items:
+        try:
+            badges = ", ".join(_src_badge(src, url) for src, url in zip(i.sources, i.urls))
+            lis += (
+                f"<li>{escape(i.title)} <small>— {_importance_label(i.importance)} · "
+                f"{_likelihood_label(i.likelihood)} · {badges}</small></li>"
+            )
+        except Exception as err:
+            _LOGGER.warning(f"Render skip: {err}")
+    return f"<h4>{title}{version_text}</h4><ul>{lis}</ul>"
+
+
+def render_html(forecast: Forecast) -> str:
+    """Render the card HTML."""
+    header = (
+        f"<p><b>Last updated:</b> {_timestamp(forecast)} CET | "
+        f"<b>Current version:</b> {escape(forecast.current_version)}</p>"
+    )
+    stats = f"<p><small>📊 Analyzing {forecast.feature_count} unique features ({escape(_source_text(forecast))})</small></p>"
+    if forecast.pending_sources:
+        stats += f"<p><small>⏳ Still updating: {escape(_pending_text(forecast))}</small></p>"
+    return header + stats + "".join(_html_section(*section) for section in _sections(forecast))
+
+
+def render_markdown(forecast: Forecast) -> str:
+    """Render a markdown version, e.g. for notifications."""
+    lines = [
+        f"**Last updated:** {_timestamp(forecast)} CET | **Current version:** {_md(forecast.current_version)}",
+        "",
+        f"_Analyzing {forecast.feature_count} unique features ({_md(_source_text(forecast))})_",
+    ]
+    if forecast.pending_sources:
+        lines.append(f"_Still updating: {_md(_pending_text(forecast))}_")
+    for title, items, version in _sections(forecast):
+        lines += ["", f"#### {_md(title)}{f' ({_md(version)})' if version else ''}"]
+        if not items:
+            lines.append("_No confirmed features yet. Check back later!_")
+            continue
+        for i in items:
+            links = ", ".join(
+                f"[{_md(src.title())}]({_md_url(url)})" if url else _md(src.title())
+                for src, url in ((src, _safe_url(url)) for src, url in zip(i.sources, i.urls))
+            )
+            lines.append(
+                f"- {_md(i.title)} — {_importance_label(i.importance)} · {_likelihood_label(i.likelihood)} · {links}"
+            )
+    return "\n".join(lines)
+
+
+def render_json(forecast: Forecast) -> Dict[str, Any]:
+    """Return the versioned JSON form."""
+    return forecast.as_dict()
+
+
+RENDERERS = {"html": render_html, "markdown": render_markdown, "json": render_json}
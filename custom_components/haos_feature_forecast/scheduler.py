@@ -0,0 +1,111 @@
+"""Per-source refresh scheduling with independent TTLs, failure backoff and circuit breakers.
+
+A source's circuit opens after ``BREAKER_THRESHOLD`` consecutive failures:
+it is then skipped, by forced refreshes too, and its cached data is used
+until the backoff has elapsed. The next fetch is a half-open probe that
+closes the circuit on success or reopens it with a longer backoff.
+"""
+from __future__ import annotations
+
+import logging
+import random
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from .const import DEFAULT_SOURCE_TTLS
+
+_LOGGER = logging.getLogger(__name__)
+
+# First retry after a failed fetch, doubled per consecutive failure
+BACKOFF_BASE = timedelta(minutes=5)
+# Backoff delays are shortened by up to this fraction so failed sources don't retry in lockstep
+BACKOFF_JITTER = 0.2
+# Consecutive failures that open a source's circuit
+BREAKER_THRESHOLD = 3
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class SourceScheduler:
+    """Decide which sources are due and track their success/failure history.
+
+    Times are POSIX timestamps so the state can be persisted as plain JSON.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, Any]] = None, state: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """Initialize with optional TTL overrides (seconds) and persisted state."""
+        self.ttls: Dict[str, float] = {name: ttl.total_seconds() for name, ttl in DEFAULT_SOURCE_TTLS.items()}
+        for name, seconds in (ttls or {}).items():
+            try:
+                self.ttls[name] = float(seconds)
+            except (TypeError, ValueError):
+                _LOGGER.warning(f"Ignoring invalid TTL for source {name}: {seconds}")
+        self._state: Dict[str, Dict[str, Any]] = {
+            name: dict(entry) for name, entry in (state or {}).items() if isinstance(entry, dict)
+        }
+
+    def _entry(self, source: str) -> Dict[str, Any]:
+        return self._state.setdefault(source, {"last_success": None, "failures": 0, "next_attempt": 0.0})
+
+    def is_due(self, source: str, now: float) -> bool:
+        """Return True when the source's TTL or backoff window has elapsed."""
+        entry = self._entry(source)
+        if entry["failures"] or entry.get("deferred"):
+            return now >= entry["next_attempt"]
+        last_success = entry["last_success"]
+        return last_success is None or now - last_success >= self.ttls.get(source, 0)
+
+    def breaker_state(self, source: str, now: float) -> str:
+        """Return the source's circuit state: closed, open or half_open (one probe allowed)."""
+        entry = self._entry(source)
+        if entry["failures"] < BREAKER_THRESHOLD:
+            return BREAKER_CLOSED
+        return BREAKER_OPEN if now < entry["next_attempt"] else BREAKER_HALF_OPEN
+
+    def due_sources(self, sources: Iterable[str], now: float, force: bool = False) -> List[str]:
+        """Filter sources down to the ones that should be fetched now.
+
+        ``force`` skips TTLs and backoff, but never an open circuit.
+        """
+        return [
+            name for name in sources
+            if self.is_due(name, now) or (force and self.breaker_state(name, now) != BREAKER_OPEN)
+        ]
+
+    def record_success(self, source: str, now: float) -> None:
+        """Mark a successful fetch and clear any backoff."""
+        entry = self._entry(source)
+        entry["last_success"] = now
+        entry["failures"] = 0
+        entry["deferred"] = False
+        entry["next_attempt"] = now + self.ttls.get(source, 0)
+
+    def record_failure(self, source: str, now: float) -> float:
+        """Mark a failed fetch and return the backoff delay in seconds."""
+        entry = self._entry(source)
+        entry["failures"] += 1
+        delay = BACKOFF_BASE.total_seconds() * (2 ** (entry["failures"] - 1))
+        delay = min(delay, self.ttls.get(source, delay))
+        delay *= 1 - BACKOFF_JITTER * random.random()
+        entry["next_attempt"] = now + delay
+        return delay
+
+    def defer(self, source: str, until: float) -> None:
+        """Hold a source back until ``until`` without counting a failure."""
+        entry = self._entry(source)
+        entry["deferred"] = True
+        entry["next_attempt"] = until
+
+    def last_success(self, source: str) -> Optional[float]:
+        """Return the timestamp of the last successful fetch."""
+        return self._entry(source)["last_success"]
+
+    def breaker_states(self, now: float) -> Dict[str, str]:
+        """Return the circuit state of every tracked source."""
+        return {name: self.breaker_state(name, now) for name in self._state}
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return the scheduler state for persistence."""
+        return {name: dict(entry) for name, entry in self._state.items()}
@@ -1,12 +1,14 @@
 """Sensor platform for HAOS Feature Forecast (A-rev1 stabilized)."""
 from __future__ import annotations
 import logging
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers import entity_registry as er
-from .const import DOMAIN
+from .const import CONF_HTML_ATTRIBUTE, DEFAULT_HTML_ATTRIBUTE, DOMAIN
 from .coordinator import HaosFeatureForecastCoordinator
+from .fetch_haos_features import SOURCE_NAMES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,8 +29,14 @@ async def async_setup_entry(hass, entry, async_add_entities: AddEntitiesCallback
     else:
         _LOGGER.info("Creating new HAOS Feature Forecast sensor")
     
-    sensor = HaosFeatureForecastSensor(coordinator)
-    async_add_entities([sensor], True)
+    expose_html = entry.options.get(CONF_HTML_ATTRIBUTE, DEFAULT_HTML_ATTRIBUTE)
+    sensor = HaosFeatureForecastSensor(coordinator, expose_html=expose_html)
+    metric_sensors = [
+        HaosFeatureForecastRefreshSensor(coordinator),
+        HaosFeatureForecastQuotaSensor(coordinator),
+    ] + [HaosFeatureForecastSourceSensor(coordinator, source) for source in SOURCE_NAMES]
+    # No update before add: state comes from the restored snapshot or the entry's first refresh
+    async_add_entities([sensor, *metric_sensors])
     _LOGGER.info("HAOS Feature Forecast sensor created and added to Home Assistant")
 
 class HaosFeatureForecastSensor(CoordinatorEntity, SensorEntity):
@@ -38,13 +46,16 @@ class HaosFeatureForecastSensor(CoordinatorEntity, SensorEntity):
     _attr_name = "HAOS Feature Forecast"
     _attr_unique_id = "haos_feature_forecast"
     _attr_icon = "mdi:home-assistant"
+    # Several KB that change rarely; keep them out of the recorder database
+    _unrecorded_attributes = frozenset({"rendered_html"})
     
     # Explicitly set the entity_id to prevent duplicates
     entity_id = "sensor.haos_feature_forecast"
 
-    def __init__(self, coordinator: HaosFeatureForecastCoordinator) -> None:
+    def __init__(self, coordinator: HaosFeatureForecastCoordinator, expose_html: bool = True) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
+        self._expose_html = expose_html
         _LOGGER.info("HAOS Feature Forecast sensor initializing...")
         
         # Set initial state from coordinator's initial data
@@ -63,9 +74,16 @@ class HaosFeatureForecastSensor(CoordinatorEntity, SensorEntity):
             feature_count = self.coordinator.data.get("feature_count", 0)
             
             self._attr_extra_state_attributes = {
-                "rendered_html": rendered_html,
-                "feature_count": feature_count
+                "feature_count": feature_count,
+                # Changes whenever the forecast content does; cards use it to refetch from the API
+                "forecast_id": self.coordinator.data.get("forecast_id"),
             }
+            pending = self.coordinator.data.get("pending_sources")
+            if pending:
+                # Interim forecast: these sources are still being fetched
+                self._attr_extra_state_attributes["pending_sources"] = pending
+            if self._expose_html:
+                self._attr_extra_state_attributes["rendered_html"] = rendered_html
             
             # Log diagnostic information for empty card debugging
             if not rendered_html or len(rendered_html) < 100:
@@ -103,5 +121,99 @@ class HaosFeatureForecastSensor(CoordinatorEntity, SensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         _LOGGER.debug("Sensor received coordinator update")
+        previous = (self._attr_native_value, self._attr_extra_state_attributes)
         self._update_from_coordinator()
+        if (self._attr_native_value, self._attr_extra_state_attributes) == previous:
+            # Identical state and attributes; don't rewrite them to the state machine and recorder
+            _LOGGER.debug("Forecast unchanged, skipping state write")
+            return
         self.async_write_ha_state()
+
+
+class _MetricSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor reading the last refresh's pipeline metrics."""
+
+    _attr_has_entity_name = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: HaosFeatureForecastCoordinator, key: str, name: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+        self._attr_name = f"HAOS Feature Forecast {name}"
+
+    @property
+    def _metrics(self) -> dict:
+        return self.hass.data.get(DOMAIN, {}).get("metrics") or {}
+
+
+class HaosFeatureForecastRefreshSensor(_MetricSensor):
+    """Duration of the last refresh, with per-stage timings and item counts."""
+
+    _attr_icon = "mdi:timer-outline"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, coordinator: HaosFeatureForecastCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "refresh_duration", "refresh duration")
+
+    @property
+    def native_value(self):
+        """Return the last refresh's wall time."""
+        return self._metrics.get("total_ms")
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return per-stage timings and item counts."""
+        return {"started_at": self._metrics.get("started_at"), "stages": self._metrics.get("stages", {})}
+
+
+class HaosFeatureForecastQuotaSensor(_MetricSensor):
+    """Remaining GitHub REST quota after the last refresh."""
+
+    _attr_icon = "mdi:github"
+    _attr_native_unit_of_measurement = "requests"
+
+    def __init__(self, coordinator: HaosFeatureForecastCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "github_quota", "GitHub quota remaining")
+
+    @property
+    def native_value(self):
+        """Return the remaining core (REST) quota."""
+        return (self._metrics.get("quota") or {}).get("core")
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the remaining quota of every rate-limit bucket."""
+        return dict(self._metrics.get("quota") or {})
+
+
+class HaosFeatureForecastSourceSensor(_MetricSensor):
+    """Fetch time of one source, with its requests, bytes, cache hits and items."""
+
+    _attr_icon = "mdi:download-network-outline"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    # One per source; enable the ones you want to watch
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: HaosFeatureForecastCoordinator, source: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, f"{source}_fetch", f"{source.replace('_', ' ')} fetch time")
+        self._source = source
+
+    @property
+    def _record(self) -> dict:
+        return (self._metrics.get("sources") or {}).get(self._source) or {}
+
+    @property
+    def native_value(self):
+        """Return the source's fetch time from the last refresh it was due in."""
+        return self._record.get("wall_ms")
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the source's traffic and item counts."""
+        record = self._record
+        return {key: record.get(key) for key in ("at", "requests", "bytes", "cache_hits", "items_out", "ok")}
@@ -0,0 +1,94 @@
+"""On-disk snapshot of the forecast so restarts never wait on a cold fetch."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshot"
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10
+
+# Only these release fields are used downstream; release bodies are large
+_RELEASE_FIELDS = ("tag_name", "name", "published_at", "prerelease")
+_RELEASE_SOURCES = ("core_releases", "os_releases")
+
+
+def compact_releases(releases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Strip GitHub release payloads down to the fields the forecast reads."""
+    return [{k: r.get(k) for k in _RELEASE_FIELDS} for r in releases if isinstance(r, dict)]
+
+
+def source_fingerprint(name: str, data: Any) -> str:
+    """Return a stable hash of one source's normalized output."""
+    if name in _RELEASE_SOURCES and isinstance(data, list):
+        data = compact_releases(data)
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode()).hexdigest()
+
+
+def _get_store(hass: HomeAssistant) -> Store:
+    """Return the shared snapshot store."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    store = domain_data.get("snapshot_store")
+    if store is None:
+        store = Store(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY)
+        domain_data["snapshot_store"] = store
+    return store
+
+
+def _build_snapshot(hass: HomeAssistant) -> Dict[str, Any]:
+    """Collect the per-source cache and rendered output from hass.data."""
+    domain_data = hass.data.get(DOMAIN, {})
+    cached = dict(domain_data.get("cached_features", {}))
+    scheduler = domain_data.get("scheduler")
+    forecast = domain_data.get("forecast")
+    for key in _RELEASE_SOURCES:
+        if key in cached:
+            cached[key] = compact_releases(cached[key])
+    return {
+        "saved_at": datetime.now(timezone.utc).isoformat(),
+        "cached_features": cached,
+        "rendered_html": domain_data.get("last_successful_html", ""),
+        "feature_count": domain_data.get("last_successful_count", 0),
+        "release_data": domain_data.get("release_data", {}),
+        "scheduler": scheduler.as_dict() if scheduler else domain_data.get("scheduler_state", {}),
+        "forecast_fingerprint": domain_data.get("forecast_fingerprint"),
+        "forecast": forecast.as_dict() if forecast else None,
+        "first_seen": domain_data.get("first_seen", {}),
+    }
+
+
+async def async_load_snapshot(hass: HomeAssistant) -> Optional[Dict[str, Any]]:
+    """Load the last saved snapshot, or None if there is none."""
+    try:
+        data = await _get_store(hass).async_load()
+    except Exception as err:
+        _LOGGER.warning(f"Could not load forecast snapshot: {err}")
+        return None
+    if not isinstance(data, dict) or not data.get("rendered_html"):
+        return None
+    return data
+
+
+def async_schedule_snapshot_save(hass: HomeAssistant) -> None:
+    """Schedule a delayed write of the current forecast snapshot."""
+    _get_store(hass).async_delay_save(lambda: _build_snapshot(hass), SNAPSHOT_SAVE_DELAY)
+
+
+def snapshot_age(snapshot: Dict[str, Any]) -> Optional[float]:
+    """Return the snapshot age in seconds, or None if it has no timestamp."""
+    try:
+        saved_at = datetime.fromisoformat(snapshot["saved_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return (datetime.now(timezone.utc) - saved_at).total_seconds()
@@ -0,0 +1 @@
+"""Tests for the HAOS Feature Forecast integration."""
@@ -0,0 +1,21 @@
+"""Shared test setup.
+
+The integration's modules are imported without running its ``__init__``
+(which sets up the integration against Home Assistant), so the modules
+that don't use Home Assistant are tested without it installed. Tests of
+modules that do import it skip when it is missing.
+"""
+import sys
+import types
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "custom_components" / "haos_feature_forecast"
+
+for name, path in (
+    ("custom_components", PACKAGE_DIR.parent),
+    ("custom_components.haos_feature_forecast", PACKAGE_DIR),
+):
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules[name] = package
@@ -0,0 +1,119 @@
+"""Tests for the streaming blog feed parser and store."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("homeassistant")
+
+from custom_components.haos_feature_forecast.blog_feed import (  # noqa: E402
+    BLOG_MAX_ENTRIES,
+    BlogStore,
+    FeedParser,
+    async_read_new_entries,
+    html_to_text,
+)
+
+RSS = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Home Assistant</title>
+<item><title>2026.11: Voice &amp; timers</title><link>https://www.home-assistant.io/blog/3</link>
+<guid>post-3</guid><pubDate>Wed, 04 Nov 2026 00:00:00 +0000</pubDate>
+<description>&lt;p&gt;We are &lt;b&gt;adding&lt;/b&gt; timers.&lt;/p&gt;</description></item>
+<item><title>Second post</title><link>https://www.home-assistant.io/blog/2</link><guid>post-2</guid></item>
+<item><title>First post</title><link>https://www.home-assistant.io/blog/1</link><guid>post-1</guid></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Home Assistant</title>
+<entry><title>Atom post</title><id>tag:post-a</id><updated>2026-11-04T00:00:00Z</updated>
+<link rel="alternate" href="https://www.home-assistant.io/blog/a"/><summary>Plain summary</summary></entry>
+</feed>"""
+
+
+def _parse(data, size):
+    parser = FeedParser()
+    entries = []
+    for start in range(0, len(data), size):
+        entries.extend(parser.feed(data[start:start + size]))
+    return entries
+
+
+@pytest.mark.parametrize("size", [1, 16, 100000])
+def test_rss_entries_in_any_chunking(size):
+    entries = _parse(RSS, size)
+    assert [e.guid for e in entries] == ["post-3", "post-2", "post-1"]
+    assert entries[0].title == "2026.11: Voice & timers"
+    assert entries[0].summary == "We are adding timers."
+    assert entries[0].link == "https://www.home-assistant.io/blog/3"
+
+
+def test_atom_entries():
+    (entry,) = _parse(ATOM, 64)
+    assert entry == ("tag:post-a", "Atom post", "https://www.home-assistant.io/blog/a", "2026-11-04T00:00:00Z", "Plain summary")
+
+
+def test_html_to_text():
+    assert html_to_text("<p>Hello <i>there</i>\n  world</p>") == "Hello there world"
+    assert html_to_text("no   tags") == "no tags"
+
+
+def test_store_keeps_newest_entries():
+    store = BlogStore(MagicMock())
+    store.add_new({f"old-{i}": {"features": [{"title": f"old {i}"}]} for i in range(BLOG_MAX_ENTRIES)})
+    store.add_new({"new": {"features": [{"title": "new"}]}})
+    assert len(store.entries) == BLOG_MAX_ENTRIES
+    assert next(iter(store.entries)) == "new"
+    assert f"old-{BLOG_MAX_ENTRIES - 1}" not in store.entries
+    assert store.features()[0] == {"title": "new"}
+
+
+class _Content:
+    def __init__(self, body):
+        self._body = body
+        self.read = 0
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self._body), size):
+            self.read += 1
+            yield self._body[start:start + size]
+
+
+class _Response:
+    def __init__(self, status, body=b"", etag=None):
+        self.status = status
+        self.headers = {"ETag": etag} if etag else {}
+        self.content = _Content(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Session:
+    def __init__(self, response):
+        self.response = response
+        self.headers = None
+
+    def get(self, url, headers=None, timeout=None):
+        self.headers = headers
+        return self.response
+
+
+def test_reading_stops_at_the_first_known_post():
+    store = BlogStore(MagicMock())
+    store.entries = {"post-2": {"features": []}}
+    store.etag = '"old"'
+    session = _Session(_Response(200, RSS, etag='"new"'))
+    entries = asyncio.run(async_read_new_entries(session, "https://example.com/rss", store))
+    assert [e.guid for e in entries] == ["post-3"]
+    assert session.headers == {"If-None-Match": '"old"'}
+    assert store.etag == '"new"'
+
+
+def test_unchanged_feed_and_errors():
+    store = BlogStore(MagicMock())
+    assert asyncio.run(async_read_new_entries(_Session(_Response(304)), "u", store)) == []
+    assert asyncio.run(async_read_new_entries(_Session(_Response(500)), "u", store)) is None
@@ -0,0 +1,72 @@
+"""Tests for feature deduplication."""
+from custom_components.haos_feature_forecast.dedup import dedup_threshold, deduplicate, jaccard, title_tokens
+
+
+def _feature(title, source, url="", importance=2, likelihood=2, **extra):
+    return {"title": title, "source": source, "url": url, "importance": importance, "likelihood": likelihood, **extra}
+
+
+def test_title_tokens_drop_punctuation_and_short_words():
+    assert title_tokens("Support a Z-Wave JS Integration!") == title_tokens("support z-wave integration")
+    assert "js" not in title_tokens("Z-Wave JS")
+
+
+def test_jaccard():
+    assert jaccard(frozenset({"a", "b"}), frozenset({"b", "c"})) == 1 / 3
+    assert jaccard(frozenset(), frozenset({"a"})) == 0.0
+
+
+def test_similar_titles_merge_across_sources():
+    features = [
+        _feature("Add Matter bridge support for thermostats", "issues", "https://example.com/1", importance=3),
+        _feature("Unrelated dashboard layout editor", "blog"),
+        _feature("Matter bridge support for thermostats", "forum", "https://example.com/2", likelihood=4),
+    ]
+    result = deduplicate(features, threshold=0.6)
+    assert len(result) == 2
+    merged = result[0]
+    # The highest-scored member is the representative and is listed first
+    assert merged["title"] == "Matter bridge support for thermostats"
+    assert [src["source"] for src in merged["sources"]] == ["forum", "issues"]
+    # Corroboration never lowers the estimate
+    assert (merged["importance"], merged["likelihood"]) == (3, 4)
+
+
+def test_merge_keeps_a_target_version_from_any_member():
+    features = [
+        _feature("Voice assistant timers", "forum", importance=4),
+        _feature("Voice assistant timers", "merged", target_version="2026.11"),
+    ]
+    (merged,) = deduplicate(features)
+    assert merged["source"] == "forum"
+    assert merged["target_version"] == "2026.11"
+
+
+def test_dissimilar_titles_stay_apart():
+    features = [_feature("Energy dashboard gas costs", "issues"), _feature("Energy dashboard solar forecast", "blog")]
+    assert len(deduplicate(features, threshold=0.6)) == 2
+
+
+def test_threshold_one_only_merges_identical_token_sets():
+    features = [
+        _feature("Bluetooth proxy improvements", "issues"),
+        _feature("bluetooth PROXY improvements!", "blog"),
+        _feature("Bluetooth proxy improvements for ESPHome", "forum"),
+    ]
+    assert len(deduplicate(features, threshold=1.0)) == 2
+
+
+def test_titles_without_significant_words_are_dropped():
+    assert deduplicate([_feature("a to of", "forum")]) == []
+
+
+def test_common_words_do_not_chain_clusters():
+    features = [_feature(f"sensor card widget{i} thing{i}", "hacs") for i in range(200)]
+    assert len(deduplicate(features, threshold=0.6)) == 200
+
+
+def test_dedup_threshold_option():
+    assert dedup_threshold(None) == 0.6
+    assert dedup_threshold("0.8") == 0.8
+    assert dedup_threshold(5) == 1.0
+    assert dedup_threshold(0) == 0.1
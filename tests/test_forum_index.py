@@ -0,0 +1,97 @@
+"""Tests for the forum topic index."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+pytest.importorskip("homeassistant")
+
+from custom_components.haos_feature_forecast.forum_index import (  # noqa: E402
+    HISTORY_SAMPLE_INTERVAL,
+    WEEK,
+    ForumIndex,
+    async_sync_forum,
+)
+
+DAY = 86400
+
+
+def _topic(topic_id, likes=0, bumped="2026-10-01T00:00:00Z", **extra):
+    return {"id": topic_id, "title": f"Topic {topic_id}", "like_count": likes, "views": 10, "posts_count": 2, "bumped_at": bumped, **extra}
+
+
+class _Response:
+    def __init__(self, payload):
+        self.status = 200
+        self._payload = payload
+
+    async def json(self):
+        return self._payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Session:
+    """Serves topic-list pages in order; an exception instance is raised instead."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+
+    def get(self, url, params=None, timeout=None):
+        page = self.pages.pop(0)
+        if isinstance(page, BaseException):
+            raise page
+        return _Response(page)
+
+
+def _page(topics, more=True):
+    return {"topic_list": {"topics": topics, "more_topics_url": "/more" if more else None}}
+
+
+def test_apply_samples_likes_and_skips_pinned():
+    index = ForumIndex(MagicMock())
+    assert index.apply([_topic(1, likes=5), _topic(2, pinned=True)], now=0) == 1
+    assert list(index.topics) == ["1"]
+    index.apply([_topic(1, likes=12)], now=HISTORY_SAMPLE_INTERVAL)
+    assert index.topics["1"]["history"] == [[0, 5], [HISTORY_SAMPLE_INTERVAL, 12]]
+
+
+def test_likes_per_week():
+    index = ForumIndex(MagicMock())
+    index.apply([_topic(1, likes=10)], now=0)
+    index.apply([_topic(1, likes=24)], now=WEEK)
+    assert index.likes_per_week(index.topics["1"], WEEK) == pytest.approx(14)
+    # Less than a day of history is no trend
+    index.apply([_topic(2, likes=50)], now=WEEK)
+    assert index.likes_per_week(index.topics["2"], WEEK + DAY / 2) == 0.0
+
+
+def test_network_error_keeps_the_index():
+    index = ForumIndex(MagicMock())
+    index.apply([_topic(1, likes=30)], now=0)
+    index.top_synced = 10**12
+    session = _Session([aiohttp.ClientError("connection reset")])
+    assert asyncio.run(async_sync_forum(session, "https://forum", index, max_pages=3)) is False
+    assert list(index.topics) == ["1"]
+
+
+def test_timeout_mid_walk_keeps_pages_read():
+    index = ForumIndex(MagicMock())
+    session = _Session([_page([_topic(1), _topic(2)]), asyncio.TimeoutError(), _page([_topic(3)], more=False)])
+    assert asyncio.run(async_sync_forum(session, "https://forum", index, max_pages=3)) is True
+    assert set(index.topics) == {"1", "2", "3"}
+
+
+def test_incremental_walk_stops_at_cursor():
+    index = ForumIndex(MagicMock())
+    index.apply([_topic(1, bumped="2026-10-01T00:00:00Z")], now=0)
+    index.top_synced = 10**12
+    session = _Session([_page([_topic(2, bumped="2026-10-02T00:00:00Z"), _topic(1, bumped="2026-10-01T00:00:00Z")])])
+    assert asyncio.run(async_sync_forum(session, "https://forum", index, max_pages=3)) is True
+    assert set(index.topics) == {"1", "2"}
+    assert index.last_bumped == "2026-10-02T00:00:00Z"
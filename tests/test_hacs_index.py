@@ -0,0 +1,137 @@
+"""Tests for the HACS catalogue parser and index cache."""
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("homeassistant")
+
+from custom_components.haos_feature_forecast import hacs_index  # noqa: E402
+from custom_components.haos_feature_forecast.hacs_index import (  # noqa: E402
+    HacsCatalogueParser,
+    HacsIndexCache,
+    HacsRepoIndex,
+    async_fetch_hacs_index,
+    parse_catalogue,
+)
+
+CATALOGUE = {
+    "appdaemon": ["someone/app"],
+    "integrations": ["owner/one", {"repository": "owner/two", "stars": 5}, "owner/three"],
+    "lovelace": {"1": {"full_name": "owner/card", "topics": ["a", "b"]}, "2": {"full_name": "owner/other-card"}},
+    "theme": ["owner/theme"],
+}
+
+
+def _parse_in_pieces(text, size):
+    parser = HacsCatalogueParser()
+    for start in range(0, len(text), size):
+        parser.feed(text[start:start + size])
+    parser.feed("", final=True)
+    return parser
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 100000])
+def test_parser_keeps_only_wanted_categories(size):
+    parser = _parse_in_pieces(json.dumps(CATALOGUE), size)
+    index = HacsRepoIndex("hash", None, parser.names, parser.codes)
+    assert index.repos("integrations") == ["owner/one", "owner/two", "owner/three"]
+    assert index.repos("lovelace") == ["owner/card", "owner/other-card"]
+
+
+def test_parser_handles_escapes_and_split_utf8():
+    text = json.dumps({"integrations": ['own\\"er/ü-näme', "owner/x"]}, ensure_ascii=False)
+    raw = text.encode()
+    parser = parse_catalogue([raw[i:i + 1] for i in range(len(raw))])
+    assert parser.names == ['own\\"er/ü-näme', "owner/x"]
+
+
+def test_parser_rejects_truncated_json():
+    parser = HacsCatalogueParser()
+    with pytest.raises(ValueError):
+        parser.feed('{"integrations": ["owner/one"', final=True)
+
+
+def test_index_round_trips_through_storage():
+    parser = _parse_in_pieces(json.dumps(CATALOGUE), 64)
+    index = HacsRepoIndex("hash", "etag", parser.names, parser.codes)
+    restored = HacsRepoIndex.from_dict(index.as_dict())
+    assert restored.repos("lovelace") == index.repos("lovelace")
+    assert restored.etag == "etag"
+
+
+class _Content:
+    def __init__(self, body):
+        self._body = body
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self._body), size):
+            yield self._body[start:start + size]
+
+
+class _Response:
+    def __init__(self, status, body=b"", etag=None):
+        self.status = status
+        self.headers = {"ETag": etag} if etag else {}
+        self.content = _Content(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Session:
+    def __init__(self, response):
+        self.response = response
+        self.headers = None
+
+    def get(self, url, headers=None, timeout=None):
+        self.headers = headers
+        return self.response
+
+
+def _hass():
+    hass = MagicMock()
+
+    async def run(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = run
+    return hass
+
+
+def _fetch(cache, response):
+    session = _Session(response)
+    index = asyncio.run(async_fetch_hacs_index(_hass(), session, "https://example.com/data.json", cache))
+    return index, session
+
+
+def test_changed_etag_with_same_content_is_not_parsed():
+    body = json.dumps(CATALOGUE).encode()
+    cache = HacsIndexCache(MagicMock())
+    first, _ = _fetch(cache, _Response(200, body, etag='"a"'))
+    assert first.repos("integrations") == ["owner/one", "owner/two", "owner/three"]
+
+    with patch.object(hacs_index, "parse_catalogue", side_effect=AssertionError("parsed again")):
+        second, session = _fetch(cache, _Response(200, body, etag='"b"'))
+    assert session.headers == {"If-None-Match": '"a"'}
+    assert second is first
+    assert second.etag == '"b"'
+
+
+def test_not_modified_reuses_index():
+    cache = HacsIndexCache(MagicMock())
+    first, _ = _fetch(cache, _Response(200, json.dumps(CATALOGUE).encode(), etag='"a"'))
+    second, _ = _fetch(cache, _Response(304))
+    assert second is first
+
+
+def test_changed_content_is_parsed():
+    cache = HacsIndexCache(MagicMock())
+    _fetch(cache, _Response(200, json.dumps(CATALOGUE).encode(), etag='"a"'))
+    index, _ = _fetch(cache, _Response(200, json.dumps({"integrations": ["owner/new"]}).encode(), etag='"b"'))
+    assert index.repos("integrations") == ["owner/new"]
@@ -0,0 +1,70 @@
+"""Tests for the incremental core issue/PR store."""
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.haos_feature_forecast.item_store import CoreItemStore  # noqa: E402
+
+
+def _issue(number, updated, state="open", labels=("new-feature",), **extra):
+    return {
+        "number": number,
+        "title": f"Item {number}",
+        "html_url": f"https://github.com/home-assistant/core/issues/{number}",
+        "state": state,
+        "labels": [{"name": name} for name in labels],
+        "updated_at": updated,
+        **extra,
+    }
+
+
+def _pull(number, updated, state="open", merged_at=None):
+    return _issue(number, updated, state=state, labels=(), pull_request={"merged_at": merged_at})
+
+
+@pytest.fixture
+def store():
+    return CoreItemStore(MagicMock())
+
+
+def test_full_sync_keeps_feature_issues_and_open_prs(store):
+    changed, newest = store.apply([
+        _issue(1, "2026-10-01T00:00:00Z"),
+        _issue(2, "2026-10-02T00:00:00Z", labels=("bug",)),
+        _pull(3, "2026-10-03T00:00:00Z"),
+    ])
+    assert changed == 2
+    assert newest == "2026-10-03T00:00:00Z"
+    assert [i["number"] for i in store.issues()] == [1]
+    assert [p["number"] for p in store.pulls()] == [3]
+
+
+def test_delta_updates_and_drops_closed_items(store):
+    store.apply([_issue(1, "2026-10-01T00:00:00Z"), _pull(3, "2026-10-03T00:00:00Z")])
+    changed, _ = store.apply([
+        _issue(1, "2026-10-05T00:00:00Z", comments=7),
+        _pull(3, "2026-10-06T00:00:00Z", state="closed", merged_at="2026-10-06T00:00:00Z"),
+    ])
+    assert changed == 2
+    assert store.items["1"]["comments"] == 7
+    assert "3" not in store.items
+    assert store.merged == [{
+        "number": 3,
+        "title": "Item 3",
+        "url": "https://github.com/home-assistant/core/issues/3",
+        "merged_at": "2026-10-06T00:00:00Z",
+    }]
+
+
+def test_unchanged_delta_changes_nothing(store):
+    store.apply([_issue(1, "2026-10-01T00:00:00Z")])
+    assert store.apply([_issue(1, "2026-10-01T00:00:00Z")])[0] == 0
+
+
+def test_cursor_only_moves_forward(store):
+    store.advance_cursor("2026-10-05T00:00:00Z")
+    store.advance_cursor("2026-10-01T00:00:00Z")
+    store.advance_cursor(None)
+    assert store.last_sync == "2026-10-05T00:00:00Z"
@@ -0,0 +1,68 @@
+"""Tests for the feature lifecycle database."""
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.haos_feature_forecast.lifecycle import LifecycleDB  # noqa: E402
+from custom_components.haos_feature_forecast.model import Feature  # noqa: E402
+
+NOW = "2026-10-01T12:00:00+00:00"
+PR_URL = "https://github.com/home-assistant/core/pull/12345"
+
+
+def _feature(title, sources=("merged",), urls=(PR_URL,), target="2026.11"):
+    return Feature(title=title, importance=3, likelihood=5, sources=sources, urls=urls, target_version=target)
+
+
+@pytest.fixture
+def db():
+    database = LifecycleDB(":memory:")
+    yield database
+    database.close()
+
+
+def test_merged_feature_recorded_then_landed_is_a_hit(db):
+    """A feature first forecast from a PR merged this run is scored as a hit."""
+    db.record([("add foo integration", _feature("Add Foo integration"))], NOW)
+    merged = [{"title": "Add Foo integration", "url": PR_URL, "merged_at": NOW}]
+    assert db.mark_landed(merged, "2026.11") == 1
+
+    report = db.report({"2026.11"}, {"merged": 1.0})
+    assert report["sources"]["merged"]["hits"] == 1
+    assert report["sources"]["merged"]["misses"] == 0
+
+
+def test_landing_matches_similar_titles(db):
+    db.record([("add foo integration", _feature("Add Foo integration", sources=("issues",), urls=("",)))], NOW)
+    merged = [{"title": "Add the Foo integration", "url": PR_URL, "merged_at": NOW}]
+    assert db.mark_landed(merged, "2026.11") == 1
+
+
+def test_target_shipped_without_landing_is_a_miss(db):
+    db.record([("bar support", _feature("Bar support", sources=("blog",), urls=("",)))], NOW)
+    report = db.report({"2026.11"}, {"blog": 0.8})
+    assert report["sources"]["blog"]["misses"] == 1
+    assert report["sources"]["blog"]["hit_rate"] == 0.0
+    assert report["weights"]["blog"] < 0.8
+
+
+def test_landing_after_target_is_a_miss(db):
+    db.record([("bar support", _feature("Bar support"))], NOW)
+    db.mark_landed([{"title": "Bar support", "url": PR_URL, "merged_at": NOW}], "2026.12")
+    report = db.report({"2026.11"}, {})
+    assert report["sources"]["merged"]["misses"] == 1
+
+
+def test_unreleased_target_is_pending(db):
+    db.record([("bar support", _feature("Bar support"))], NOW)
+    report = db.report(set(), {"merged": 1.0})
+    assert report["sources"]["merged"]["pending"] == 1
+    assert report["sources"]["merged"]["hit_rate"] is None
+    assert report["weights"]["merged"] == 1.0
+
+
+def test_target_version_is_kept_from_first_forecast(db):
+    db.record([("bar support", _feature("Bar support", target="2026.11"))], NOW)
+    db.record([("bar support", _feature("Bar support", target="2026.12"))], NOW)
+    report = db.report({"2026.11"}, {})
+    assert report["sources"]["merged"]["misses"] == 1
@@ -0,0 +1,54 @@
+"""Tests for the merged PR index."""
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.haos_feature_forecast.merge_index import MergeIndex, parse_commit  # noqa: E402
+
+
+def _commit(sha, message, date="2026-10-01T00:00:00Z"):
+    return {"sha": sha, "commit": {"message": message, "committer": {"date": date}}}
+
+
+def test_parse_commit():
+    pr = parse_commit(_commit("abc", "Add foo integration (#12345)\n\nBody"))
+    assert pr == {
+        "number": 12345,
+        "title": "Add foo integration",
+        "url": "https://github.com/home-assistant/core/pull/12345",
+        "sha": "abc",
+        "merged_at": "2026-10-01T00:00:00Z",
+    }
+    assert parse_commit(_commit("def", "Bump version to 2026.11.0.dev0")) is None
+
+
+def test_pages_advance_the_cursor():
+    index = MergeIndex(MagicMock())
+    assert index.compare_base("2026.11.0b0") == "2026.11.0b0"
+    assert index.apply([_commit("a", "One (#1)"), _commit("b", "Direct push")]) == 1
+    assert index.compare_base("2026.11.0b0") == "b"
+    # The next page, or the next run, continues from the cursor
+    assert index.apply([_commit("b", "Direct push"), _commit("c", "Two (#2)"), _commit("d", "One (#1)")]) == 1
+    assert index.head_sha == "d"
+    assert sorted(index.prs) == ["1", "2"]
+    assert [pr["number"] for pr in index.merged] == [1, 2]
+
+
+def test_new_branch_point_rebuilds_the_index():
+    index = MergeIndex(MagicMock())
+    index.compare_base("2026.11.0b0")
+    index.apply([_commit("a", "One (#1)")])
+    assert index.compare_base("2026.12.0b0") == "2026.12.0b0"
+    assert index.prs == {}
+    assert index.head_sha is None
+
+
+def test_reset_cursor_compares_from_the_tag_again():
+    index = MergeIndex(MagicMock())
+    index.compare_base("2026.11.0b0")
+    index.apply([_commit("a", "One (#1)")])
+    index.reset_cursor()
+    assert index.compare_base("2026.11.0b0") == "2026.11.0b0"
+    assert "1" in index.prs
@@ -0,0 +1,55 @@
+"""Tests for the release history."""
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.haos_feature_forecast.release_history import ReleaseHistory, classify_release  # noqa: E402
+
+
+def _history(*releases):
+    history = ReleaseHistory(MagicMock())
+    history.update("core", [
+        {"tag_name": tag, "published_at": published, "prerelease": "b" in tag}
+        for tag, published in releases
+    ])
+    return history
+
+
+def test_classify_release():
+    assert classify_release("2026.10.0b3", True) == "beta"
+    assert classify_release("2026.10.0", False) == "stable"
+    assert classify_release("2026.10.2", False) == "patch"
+    assert classify_release("16.2", False) == "stable"
+
+
+def test_branch_point_is_first_beta_of_newest_version():
+    history = _history(
+        ("2026.9.0", "2026-09-03T18:00:00Z"),
+        ("2026.10.0b0", "2026-09-24T18:00:00Z"),
+        ("2026.10.0b1", "2026-09-25T18:00:00Z"),
+        ("2026.10.0", "2026-10-01T18:00:00Z"),
+    )
+    assert history.branch_point_tag() == "2026.10.0b0"
+
+
+def test_branch_point_ignores_later_patches():
+    history = _history(
+        ("2026.10.0b0", "2026-09-24T18:00:00Z"),
+        ("2026.10.0", "2026-10-01T18:00:00Z"),
+        ("2026.11.0b0", "2026-10-29T18:00:00Z"),
+        # Patch of the older version published after the newer beta
+        ("2026.10.4", "2026-10-30T18:00:00Z"),
+        ("2026.11.0b1", "2026-10-31T18:00:00Z"),
+    )
+    assert history.branch_point_tag() == "2026.11.0b0"
+
+
+def test_branch_point_falls_back_to_stable_without_betas():
+    history = _history(("2026.9.0", "2026-09-03T18:00:00Z"), ("2026.9.1", "2026-09-10T18:00:00Z"))
+    assert history.branch_point_tag() == "2026.9.0"
+
+
+def test_branch_point_without_core_releases():
+    assert _history().branch_point_tag() is None
@@ -0,0 +1,63 @@
+"""Tests for the forecast renderers."""
+from custom_components.haos_feature_forecast.model import Feature, Forecast
+from custom_components.haos_feature_forecast.render import render_html, render_markdown
+
+PAYLOAD = '<img src=x onerror="alert(1)">'
+
+
+def _forecast(title=PAYLOAD, url="https://github.com/home-assistant/core/issues/1", **kwargs):
+    feature = Feature(title=title, importance=4, likelihood=3, sources=("issues",), urls=(url,), target_version="2026.11")
+    defaults = dict(
+        generated_at="2026-10-01T12:00:00+00:00",
+        current_version="2026.10",
+        upcoming_version="2026.11",
+        next_version="2026.12",
+        upcoming=[feature],
+        next=[],
+        hacs=[],
+        feature_count=1,
+        source_counts={"issues": 1},
+    )
+    defaults.update(kwargs)
+    return Forecast(**defaults)
+
+
+def test_html_escapes_titles():
+    html = render_html(_forecast())
+    assert "<img" not in html
+    assert "&lt;img src=x onerror=&quot;alert(1)&quot;&gt;" in html
+
+
+def test_html_escapes_hrefs():
+    html = render_html(_forecast(url='https://example.com/"><script>alert(1)</script>'))
+    assert "<script>" not in html
+    assert 'href="https://example.com/&quot;&gt;&lt;script&gt;' in html
+
+
+def test_html_drops_non_web_links():
+    html = render_html(_forecast(url="javascript:alert(1)"))
+    assert "javascript:" not in html
+    assert "<a " not in html
+
+
+def test_html_escapes_versions_and_pending_sources():
+    html = render_html(_forecast(current_version="<b>x</b>", pending_sources=["<i>forum</i>"]))
+    assert "<b>x</b>" not in html
+    assert "<i>forum</i>" not in html
+
+
+def test_markdown_escapes_titles_and_link_text():
+    markdown = render_markdown(_forecast(title="[click](javascript:alert(1)) <b>bold</b>"))
+    assert "[click](javascript" not in markdown
+    assert r"\[click\]\(javascript:alert\(1\)\)" in markdown
+    assert "<b>" not in markdown
+
+
+def test_markdown_link_urls_cannot_close_the_link():
+    markdown = render_markdown(_forecast(url="https://example.com/a) [x](javascript:alert(1)"))
+    assert "[Issues](https://example.com/a%29%20[x]%28javascript:alert%281%29)" in markdown
+
+
+def test_markdown_drops_non_web_links():
+    markdown = render_markdown(_forecast(url="javascript:alert(1)"))
+    assert "(javascript:" not in markdown
@@ -0,0 +1,93 @@
+"""Tests for the per-source scheduler and circuit breaker."""
+from unittest.mock import patch
+
+from custom_components.haos_feature_forecast.scheduler import (
+    BACKOFF_BASE,
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    BREAKER_THRESHOLD,
+    SourceScheduler,
+)
+
+HOUR = 3600
+
+
+def test_new_source_is_due_then_waits_for_its_ttl():
+    scheduler = SourceScheduler({"blog_features": 2 * HOUR})
+    assert scheduler.is_due("blog_features", 0)
+    scheduler.record_success("blog_features", 0)
+    assert not scheduler.is_due("blog_features", HOUR)
+    assert scheduler.is_due("blog_features", 2 * HOUR)
+
+
+def test_backoff_doubles_with_jitter():
+    scheduler = SourceScheduler({"forum_features": 24 * HOUR})
+    with patch("custom_components.haos_feature_forecast.scheduler.random.random", return_value=0.0):
+        first = scheduler.record_failure("forum_features", 0)
+        second = scheduler.record_failure("forum_features", 0)
+    assert first == BACKOFF_BASE.total_seconds()
+    assert second == 2 * first
+    with patch("custom_components.haos_feature_forecast.scheduler.random.random", return_value=1.0):
+        third = scheduler.record_failure("forum_features", 0)
+    assert 0.8 * 4 * first <= third < 4 * first
+
+
+def test_backoff_is_capped_at_the_ttl():
+    scheduler = SourceScheduler({"github_features": 600})
+    for _ in range(6):
+        delay = scheduler.record_failure("github_features", 0)
+    assert delay <= 600
+
+
+def test_breaker_opens_half_opens_and_closes():
+    scheduler = SourceScheduler({"hacs_features": 24 * HOUR})
+    now = 0.0
+    for _ in range(BREAKER_THRESHOLD - 1):
+        scheduler.record_failure("hacs_features", now)
+    assert scheduler.breaker_state("hacs_features", now) == BREAKER_CLOSED
+
+    delay = scheduler.record_failure("hacs_features", now)
+    assert scheduler.breaker_state("hacs_features", now) == BREAKER_OPEN
+    # An open circuit is skipped even by a forced refresh
+    assert scheduler.due_sources(["hacs_features"], now, force=True) == []
+
+    probe_at = now + delay
+    assert scheduler.breaker_state("hacs_features", probe_at) == BREAKER_HALF_OPEN
+    assert scheduler.due_sources(["hacs_features"], probe_at) == ["hacs_features"]
+
+    scheduler.record_success("hacs_features", probe_at)
+    assert scheduler.breaker_state("hacs_features", probe_at) == BREAKER_CLOSED
+
+
+def test_failed_probe_reopens_the_circuit():
+    scheduler = SourceScheduler({"hacs_features": 24 * HOUR})
+    for _ in range(BREAKER_THRESHOLD):
+        delay = scheduler.record_failure("hacs_features", 0)
+    scheduler.record_failure("hacs_features", delay)
+    assert scheduler.breaker_state("hacs_features", delay) == BREAKER_OPEN
+
+
+def test_force_skips_ttl_and_backoff_below_the_threshold():
+    scheduler = SourceScheduler({"blog_features": 12 * HOUR})
+    scheduler.record_success("blog_features", 0)
+    scheduler.record_failure("blog_features", 1)
+    assert scheduler.due_sources(["blog_features"], 2) == []
+    assert scheduler.due_sources(["blog_features"], 2, force=True) == ["blog_features"]
+
+
+def test_deferred_source_waits_without_counting_a_failure():
+    scheduler = SourceScheduler({"github_features": HOUR})
+    scheduler.record_success("github_features", 0)
+    scheduler.defer("github_features", 2 * HOUR)
+    assert not scheduler.is_due("github_features", HOUR)
+    assert scheduler.is_due("github_features", 2 * HOUR)
+    assert scheduler.breaker_state("github_features", HOUR) == BREAKER_CLOSED
+
+
+def test_state_round_trips_and_invalid_ttls_are_ignored():
+    scheduler = SourceScheduler({"blog_features": "soon"})
+    scheduler.record_success("blog_features", 100)
+    restored = SourceScheduler(state=scheduler.as_dict())
+    assert restored.last_success("blog_features") == 100
+    assert restored.ttls["blog_features"] == scheduler.ttls["blog_features"]